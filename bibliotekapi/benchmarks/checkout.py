@@ -0,0 +1,104 @@
+"""A benchmark comparing the previous, multi-statement checkout with the atomic one.
+
+Lends every copy of a new book to a new user, half of them the previous way
+and half with `HistoryRepository.checkout`, one transaction per checkout.
+Reports the median latency and the statements sent per checkout.
+Needs the configured database.
+Run from the project root: `python -m benchmarks.checkout [copies]`.
+"""
+
+import sys
+import time
+import uuid
+import asyncio
+import statistics
+
+from sqlalchemy import event
+
+from src.core.domain.book import BookCreate
+from src.core.domain.book_copy import BookCopyStatus
+from src.core.domain.history import HistoryCreate
+from src.core.domain.reservation import ReservationStatus
+from src.core.domain.user import UserCreate
+from src.db import async_session_factory, engine, init_db
+from src.infrastructure.repositories.book import BookRepository
+from src.infrastructure.repositories.book_copy import BookCopyRepository
+from src.infrastructure.repositories.history import HistoryRepository
+from src.infrastructure.repositories.reservation import ReservationRepository
+from src.infrastructure.repositories.user import UserRepository
+
+statements = 0
+
+
+def count_statement(*_) -> None:
+    """A listener counting statements sent to the database."""
+    global statements
+    statements += 1
+
+
+async def setup(copies: int) -> tuple[uuid.UUID, list[int]]:
+    """A function creating a user and a book with the given number of copies."""
+    async with async_session_factory() as session, session.begin():
+        suffix = uuid.uuid4().hex[:8]
+        user = await UserRepository(session).add_user(
+            UserCreate(username=f"bench{suffix}", email=f"bench{suffix}@example.com", password="benchmark"))
+        book = await BookRepository(session).add_book(BookCreate(title="Checkout benchmark"))
+        new_copies = await BookCopyRepository(session).add_book_copies(book.book_id, None, copies)
+        return user.user_id, [copy.copy_id for copy in new_copies]
+
+
+async def previous_checkout(user_id: uuid.UUID, copy_id: int) -> None:
+    """The checkout as `HistoryService.mark_as_borrowed` did it before."""
+    async with async_session_factory() as session, session.begin():
+        users, copies = UserRepository(session), BookCopyRepository(session)
+        reservations, history = ReservationRepository(session), HistoryRepository(session)
+        await users.get_user_by_uuid(user_id)
+        copy = await copies.get_book_copy_by_id(copy_id)
+        reservation = await reservations.get_reservation_by_user_and_copy(user_id, copy_id)
+        if copy.status == BookCopyStatus.borrowed or (copy.status == BookCopyStatus.reserved and not reservation):
+            raise RuntimeError("copy not available")
+        copy.status = BookCopyStatus.borrowed
+        await copies.update_book_copy(copy_id, copy)
+        await history.add_history(HistoryCreate(user_id=user_id, copy_id=copy_id))
+        reservation = await reservations.get_reservation_by_user_and_copy(user_id, copy_id)
+        if reservation:
+            reservation.status = ReservationStatus.collected
+            await reservations.update_reservation(reservation.reservation_id, reservation)
+
+
+async def atomic_checkout(user_id: uuid.UUID, copy_id: int) -> None:
+    """The checkout as a single statement."""
+    async with async_session_factory() as session, session.begin():
+        result = await HistoryRepository(session).checkout(user_id, copy_id)
+        if result.failure:
+            raise RuntimeError(result.failure)
+
+
+async def measure(checkout, user_id: uuid.UUID, copy_ids: list[int]) -> tuple[float, float]:
+    """A function returning the median latency (ms) and the statements per checkout."""
+    global statements
+    statements = 0
+    latencies = []
+    for copy_id in copy_ids:
+        start = time.perf_counter()
+        await checkout(user_id, copy_id)
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000, statements / len(copy_ids)
+
+
+async def main(copies: int) -> None:
+    engine.echo = False
+    await init_db()
+    user_id, copy_ids = await setup(copies)
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    half = len(copy_ids) // 2
+    for name, checkout, ids in (
+        ("previous", previous_checkout, copy_ids[:half]),
+        ("atomic", atomic_checkout, copy_ids[half:]),
+    ):
+        latency, per_checkout = await measure(checkout, user_id, ids)
+        print(f"{name:>8}: {latency:.2f} ms median, {per_checkout:.1f} statements per checkout")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 400))
@@ -0,0 +1,118 @@
+"""A concurrency check of reserving one title through `ReservationService.add_reservation`.
+
+Creates a book with a number of available copies and as many users as
+reservations, then has every user reserve the book at the same time,
+each call with its own unit of work as the API does. Checks that no copy
+is reserved twice and that exactly as many reservations succeed as there
+were available copies; exits with a non-zero status otherwise, so it can
+be run as an automated check. The created rows are deleted afterwards,
+but the check still writes to the configured database while it runs:
+point it at a disposable database, never at a production one.
+Run from the project root: `python -m benchmarks.concurrent_reservations [reservations] [copies]`.
+"""
+
+import sys
+import time
+import uuid
+import asyncio
+from collections import Counter
+
+from sqlalchemy import delete, select
+
+from src.container import Container
+from src.core.domain.book import BookCreate
+from src.core.domain.book_copy import BookCopyStatus
+from src.core.exceptions.exceptions import BookNotAvailable
+from src.db import Book as BookORM, BookCopy as BookCopyORM, Reservation as ReservationORM, User as UserORM, async_session_factory, engine, init_db
+from src.infrastructure.repositories.book import BookRepository
+from src.infrastructure.repositories.book_copy import BookCopyRepository
+from src.infrastructure.utils.password import hash_password
+
+
+async def setup(reservations: int, copies: int) -> tuple[int, list[uuid.UUID]]:
+    """A function creating a book with the given number of available copies and the reserving users."""
+    async with async_session_factory() as session, session.begin():
+        book = await BookRepository(session).add_book(BookCreate(title="Concurrency check"))
+        await BookCopyRepository(session).add_book_copies(book.book_id, None, copies)
+        password = hash_password("concurrency")
+        users = [UserORM(username=f"check{suffix}", email=f"check{suffix}@example.com", password=password)
+                 for suffix in (uuid.uuid4().hex[:12] for _ in range(reservations))]
+        session.add_all(users)
+        await session.flush()
+        user_ids = [user.user_id for user in users]
+        return book.book_id, user_ids
+
+
+async def teardown(book_id: int, user_ids: list[uuid.UUID]) -> None:
+    """A function deleting the book, its copies and reservations and the users created by `setup`."""
+    async with async_session_factory() as session, session.begin():
+        copy_ids = select(BookCopyORM.copy_id).where(BookCopyORM.book_id == book_id)
+        await session.execute(delete(ReservationORM).where(ReservationORM.copy_id.in_(copy_ids)))
+        await session.execute(delete(BookCopyORM).where(BookCopyORM.book_id == book_id))
+        # Also removes the counter deltas appended for the deleted copies.
+        await session.execute(delete(BookORM).where(BookORM.book_id == book_id))
+        await session.execute(delete(UserORM).where(UserORM.user_id.in_(user_ids)))
+
+
+async def reserve(container: Container, book_id: int, user_id: uuid.UUID) -> int | None:
+    """A function reserving the book for the user, returning the reserved copy id."""
+    try:
+        reservation = await container.reservation_service().add_reservation(book_id, user_id)
+    except BookNotAvailable:
+        return None
+    return reservation.copy_id
+
+
+async def stored_reservations(book_id: int) -> tuple[Counter, int]:
+    """A function counting the stored reservations per copy and the reserved copies of the book."""
+    async with async_session_factory() as session:
+        copy_ids = (await session.execute(
+            select(ReservationORM.copy_id)
+            .join(BookCopyORM, BookCopyORM.copy_id == ReservationORM.copy_id)
+            .where(BookCopyORM.book_id == book_id)
+        )).scalars().all()
+        reserved = (await session.execute(
+            select(BookCopyORM.copy_id)
+            .where(BookCopyORM.book_id == book_id, BookCopyORM.status == BookCopyStatus.reserved)
+        )).scalars().all()
+        return Counter(copy_ids), len(reserved)
+
+
+async def main(reservations: int, copies: int) -> list[str]:
+    """A function running the check, returning the found violations."""
+    engine.echo = False
+    await init_db()
+    book_id, user_ids = await setup(reservations, copies)
+    try:
+        container = Container()
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(reserve(container, book_id, user_id) for user_id in user_ids))
+        elapsed = time.perf_counter() - start
+
+        returned = [copy_id for copy_id in results if copy_id is not None]
+        stored, reserved = await stored_reservations(book_id)
+        expected = min(reservations, copies)
+        print(f"{reservations} reservations of {copies} copies, {len(returned)} succeeded in {elapsed * 1000:.0f} ms")
+
+        errors = []
+        if len(returned) != len(set(returned)):
+            errors.append("the service returned the same copy for several reservations")
+        if doubled := [copy_id for copy_id, count in stored.items() if count > 1]:
+            errors.append(f"copies reserved more than once: {sorted(doubled)}")
+        if len(returned) != expected:
+            errors.append(f"{len(returned)} reservations succeeded, expected {expected}")
+        if sum(stored.values()) != expected or reserved != expected:
+            errors.append(f"{sum(stored.values())} reservations and {reserved} reserved copies stored, expected {expected}")
+        return errors
+    finally:
+        await teardown(book_id, user_ids)
+
+
+if __name__ == "__main__":
+    reservations = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    errors = asyncio.run(main(reservations, copies))
+    for error in errors:
+        print(f"FAILED: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
@@ -0,0 +1,169 @@
+"""A benchmark comparing the previous and the fast JSON path of list endpoints.
+
+Both paths start from ORM rows and end with the encoded response body.
+By default the rows are built in memory; with `--db` they are loaded
+from the configured database, so real column values are encoded.
+Run from the project root: `python -m benchmarks.serialization [rows] [--db]`.
+"""
+
+import sys
+import time
+import uuid
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import select
+
+from src.api.utils.responses import ModelResponse
+from src.core.domain.book import Book, BookAvailability, BookSummary
+from src.core.domain.history import History
+from src.core.domain.user import User
+from src.db import Book as BookORM, History as HistoryORM, User as UserORM, async_session_factory, engine
+from src.infrastructure.dto.historydto import HistoryDTO
+from src.infrastructure.dto.userdto import UserDTO
+
+BOOK_SHAPE = Book | BookAvailability | BookSummary
+
+
+def history_rows(count: int) -> list[SimpleNamespace]:
+    """A function building ORM-like history rows."""
+    now = datetime.now()
+    return [
+        SimpleNamespace(
+            history_id=i,
+            copy_id=i,
+            user_id=uuid.uuid4(),
+            borrowed_date=now,
+            due_date=now + timedelta(days=14),
+            return_date=None,
+            status="borrowed",
+        )
+        for i in range(count)
+    ]
+
+
+def user_rows(count: int) -> list[SimpleNamespace]:
+    """A function building ORM-like user rows."""
+    return [
+        SimpleNamespace(
+            user_id=uuid.uuid4(),
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            password="$2b$12$" + "x" * 53,
+            role="user",
+        )
+        for i in range(count)
+    ]
+
+
+def book_rows(count: int) -> list[SimpleNamespace]:
+    """A function building ORM-like book rows."""
+    return [
+        SimpleNamespace(
+            book_id=i,
+            isbn=f"978{i:010d}",
+            title=f"Book {i}",
+            authors=["Stanisław Lem", "Olga Tokarczuk"],
+            subject=["fiction", "science fiction"],
+            description="A book used by the serialization benchmark. " * 4,
+            publisher="Wydawnictwo Literackie",
+            publication_year=1961,
+            language="pl",
+            version=1,
+        )
+        for i in range(count)
+    ]
+
+
+async def load_rows(orm: type, count: int) -> list:
+    """A function loading ORM rows of the given model from the configured database."""
+    async with async_session_factory() as session:
+        result = await session.execute(select(orm).limit(count))
+        return list(result.scalars().all())
+
+
+def book(row) -> Book:
+    """A function validating a full book, as the book repository does."""
+    return Book.model_validate(row)
+
+
+def book_with_availability(row) -> BookAvailability:
+    """A function building a book with its copies counters, as the book repository does."""
+    return BookAvailability(**Book.model_validate(row).model_dump(), total_copies=3, available_copies=1)
+
+
+def book_summary(row) -> BookSummary:
+    """A function building a sparse book projection, as the book repository does."""
+    return BookSummary.model_validate({"book_id": row.book_id, "title": row.title, "authors": row.authors})
+
+
+def cases(history: list, users: list, books: list) -> list[tuple[str, list, Callable, Callable, Any, bool]]:
+    """A function listing the benchmarked endpoint shapes.
+
+    Every case is a name, its rows, the previous and the current row builders,
+    the previous `response_model` item type and whether unset fields are excluded.
+    """
+    return [
+        ("history", history, lambda row: HistoryDTO.model_validate(History.model_validate(row)),
+         lambda row: HistoryDTO.from_domain(History.model_validate(row)), HistoryDTO, False),
+        ("user", users, lambda row: UserDTO.model_validate(User.model_validate(row)),
+         lambda row: UserDTO.from_domain(User.model_validate(row)), UserDTO, False),
+        ("book", books, book, book, BOOK_SHAPE, True),
+        ("book+av", books, book_with_availability, book_with_availability, BOOK_SHAPE, True),
+        ("summary", books, book_summary, book_summary, BOOK_SHAPE, True),
+    ]
+
+
+async def previous_path(rows: list, build: Callable, item: Any, exclude_unset: bool) -> bytes:
+    """The previous path: `response_model` validation, `jsonable_encoder`, stdlib json."""
+    field = create_model_field("response", list[item], mode="serialization")
+    items = [build(row) for row in rows]
+    content = await serialize_response(
+        field=field, response_content=items, exclude_unset=exclude_unset, is_coroutine=True
+    )
+    return JSONResponse(content).body
+
+
+async def fast_path(rows: list, build: Callable, exclude_unset: bool) -> bytes:
+    """The current path: the models dumped straight to JSON by `ModelResponse`."""
+    items = [build(row) for row in rows]
+    return ModelResponse(items, exclude_unset=exclude_unset).body
+
+
+async def measure(coroutine: Callable[[], Any], count: int, repeat: int = 10) -> float:
+    """A function returning the best per-row time of a path in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await coroutine()
+        best = min(best, time.perf_counter() - start)
+    return best / max(count, 1) * 1e6
+
+
+async def main(count: int, from_db: bool) -> None:
+    if from_db:
+        engine.echo = False
+        history = await load_rows(HistoryORM, count)
+        users = await load_rows(UserORM, count)
+        books = await load_rows(BookORM, count)
+    else:
+        history, users, books = history_rows(count), user_rows(count), book_rows(count)
+
+    for name, rows, previous, current, item, exclude_unset in cases(history, users, books):
+        if not rows:
+            print(f"{name:>8}: no rows")
+            continue
+        before = await measure(lambda: previous_path(rows, previous, item, exclude_unset), len(rows))
+        after = await measure(lambda: fast_path(rows, current, exclude_unset), len(rows))
+        print(f"{name:>8}: {before:.2f} -> {after:.2f} us/row ({len(rows)} rows)")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--db"]
+    count = int(args[0]) if args else 2_000
+    asyncio.run(main(count, "--db" in sys.argv[1:]))
@@ -12,7 +12,10 @@ DOMAIN_EXCEPTION_MAPPING = {
     BookNotBorrowed: (409, "This copy is not borrowed"),
     EmailAlreadyExist: (409, "This email already exist"),
     BookBorrowed: (409, "One or more copy of this book is currently borrowed"),
-    ISBNAlreadyExist: (409, "This isbn already exist")
+    ISBNAlreadyExist: (409, "This isbn already exist"),
+    InvalidBookData: (422, "Invalid book data"),
+    InvalidCursor: (400, "Invalid pagination cursor"),
+    HoldAlreadyExist: (409, "You are already waiting for this book"),
 }
 
 
@@ -22,7 +25,11 @@ async def domain_exception_handler(request: Request, exc: DomainError):
         (400, "Domain error")
     )
 
+    content = {"detail": message}
+    reason = getattr(exc, "reason", None)
+    if reason:
+        content["reason"] = reason
     return JSONResponse(
         status_code=status,
-        content={"detail": message},
+        content=content,
     )
@@ -1,71 +1,153 @@
 """A module containing book routers"""
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from src.container import Container
 from src.infrastructure.services.ibook import IBookService
-from src.core.domain.book import Book, BookCreate, BookUpdate
+from src.core.domain.book import Book, BookCreate, BookFacets, BookField, BookSummary, BookUpdate, ImportReport, MatchMode
+from src.core.domain.batch import Batch
+from src.core.domain.page import Page
+from src.api.utils.book_import import ImportFormat, parse_import
+from src.api.utils.etag import is_not_modified, make_etag, not_modified
+from src.api.utils.responses import ModelResponse
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.auth.auth import librarian_required
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_BATCH_IDS, MAX_PAGE_SIZE, FUZZY_MATCH_LIMIT
 
 router = APIRouter()
 
+# The book list endpoints return exactly one of three shapes, picked by their
+# arguments; `BookSummary` documents them as it holds the attributes of all.
+BOOK_PAGE_RESPONSES = {
+    200: {
+        "model": Page[BookSummary],
+        "description": (
+            "Whole books (`Book`), with `total_copies` and `available_copies` "
+            "when `with_availability` is set (`BookAvailability`), or only "
+            "`book_id` and the chosen `fields` (`BookSummary`)."
+        ),
+    },
+}
 
-@router.get("/all", response_model=list[Book])
+
+@router.get("/all", response_model=None, response_class=ModelResponse, responses=BOOK_PAGE_RESPONSES)
 @inject
 async def get_all_books(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    with_availability: bool = False,
+    fields: list[BookField] | None = Query(None),
     service: IBookService = Depends(Provide[Container.book_service]),
-) -> list:
-    """An endpoint for getting all books
+) -> ModelResponse:
+    """An endpoint for getting a page of books
     
     Args:
+        limit (int): Maximum number of books on the page.
+        after (str | None): The `next_cursor` of the previous page.
+        with_availability (bool): Whether to add total and available copies counts.
+        fields (list[BookField] | None): The attributes to return besides `book_id`, all when omitted.
         service (IBookService): The injected service dependency.
 
     Returns:
-        list: The book attributes collections.
+        ModelResponse: The page of book attributes with the next page cursor.
     """
-    books = await service.get_all_books()
-    return books
+    books = await service.get_all_books(limit, after, with_availability, fields)
+    return _book_page(books, fields)
+
+
+@router.get("/cache-stats", response_model=dict[str, int])
+@inject
+async def get_cache_stats(
+    service: IBookService = Depends(Provide[Container.book_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> dict:
+    """An endpoint for getting book lookup cache counters. (Intended for Librarian use.)
+    
+    Args:
+        service (IBookService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        dict: The number of cache hits, misses and cached books.
+    """
+    return service.cache_stats()
+
+
+@router.get("/batch", response_model=Batch[Book, int])
+@inject
+async def get_books_by_ids(
+    ids: list[int] = Query(..., min_length=1, max_length=MAX_BATCH_IDS),
+    service: IBookService = Depends(Provide[Container.book_service]),
+) -> Batch:
+    """An endpoint for getting many books at once.
+        `ids` can be repeated, books are returned in the same order.
+    
+    Args:
+        ids (list[int]): The book ids.
+        service (IBookService): The injected service dependency.
 
+    Returns:
+        Batch: The found books with the ids that do not exist.
+    """
+    return await service.get_books_by_ids(ids)
 
 @router.get("/bookid/{book_id}", response_model=Book)
 @inject
 async def get_book_by_id(
     book_id: int,
+    request: Request,
+    response: Response,
     service: IBookService = Depends(Provide[Container.book_service]),
     current_user: UserDTO = Depends(librarian_required)
-) -> dict:
+) -> dict | Response:
     """An endpoint for getting book by id. (Intended for Librarian use.)
+        Answers `304 Not Modified` when `If-None-Match` holds the current ETag.
+        The ETag comes from the version of the (possibly cached) book,
+        edits drop the cached book so its version is never stale.
     
     Args:
         book_id (int): The book id.
+        request (Request): The incoming request.
+        response (Response): The outgoing response.
         service (IBookService): The injected service dependency.
         current_user (UserDTO): The injected user authentication dependency.
 
     Returns:
-        dict: The book attributes.
+        dict | Response: The book attributes or an empty 304 response.
     """
     book = await service.get_book_by_id(book_id)
-    if book:
-        return book.model_dump()
-    raise HTTPException(status_code=404, detail="Book not found")
+    if not book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    etag = make_etag(book.book_id, book.version)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return book.model_dump()
 
 @router.get("/title/{title}", response_model=list[Book])
 @inject
 async def get_by_title(
     title: str,
+    fuzzy: bool = False,
+    limit: int = Query(FUZZY_MATCH_LIMIT, ge=1, le=MAX_PAGE_SIZE),
     service: IBookService = Depends(Provide[Container.book_service]),
 ) -> list:
     """An endpoint for getting book by title.
+        With `fuzzy=true` returns books with similar titles, ignoring
+        letter case, diacritics and typos, most similar first.
     
     Args:
         title (int): The book title.
+        fuzzy (bool): Whether to match similar titles instead of the exact one.
+        limit (int): Maximum number of books returned in fuzzy mode.
         service (IBookService): The injected service dependency.
 
     Returns:
         dict: The book attributes.
     """
+    if fuzzy:
+        return await service.fuzzy_search_by_title(title, limit)
     books = await service.get_book_by_title(title)
     return books
     
@@ -74,20 +156,55 @@ async def get_by_title(
 @inject
 async def get_by_author(
     author: str,
+    fuzzy: bool = False,
+    limit: int = Query(FUZZY_MATCH_LIMIT, ge=1, le=MAX_PAGE_SIZE),
     service: IBookService = Depends(Provide[Container.book_service]),
 ) -> list:
     """An endpoint for getting books by author.
+        With `fuzzy=true` returns books by authors with similar names, ignoring
+        letter case, diacritics and typos, most similar first.
     
     Args:
         author (int): The book author.
+        fuzzy (bool): Whether to match similar author names instead of the exact one.
+        limit (int): Maximum number of books returned in fuzzy mode.
         service (IBookService): The injected service dependency.
 
     Returns:
         list: The book attributes collections.
     """
+    if fuzzy:
+        return await service.fuzzy_search_by_author(author, limit)
     books = await service.get_book_by_author(author)
     return books
 
+@router.get("/search", response_model=None, response_class=ModelResponse, responses=BOOK_PAGE_RESPONSES)
+@inject
+async def search_books(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    with_availability: bool = False,
+    fields: list[BookField] | None = Query(None),
+    service: IBookService = Depends(Provide[Container.book_service]),
+) -> ModelResponse:
+    """An endpoint for full-text searching books.
+        Matches words and word prefixes in title, authors, subject and description.
+    
+    Args:
+        q (str): The search phrase.
+        limit (int): Maximum number of books on the page.
+        after (str | None): The `next_cursor` of the previous page.
+        with_availability (bool): Whether to add total and available copies counts.
+        fields (list[BookField] | None): The attributes to return besides `book_id`, all when omitted.
+        service (IBookService): The injected service dependency.
+
+    Returns:
+        ModelResponse: The page of matching books, best ranked first.
+    """
+    books = await service.search_books(q, limit, after, with_availability, fields)
+    return _book_page(books, fields)
+
 @router.get("/isbn/{isbn}", response_model=Book)
 @inject
 async def get_by_isbn(
@@ -108,37 +225,89 @@ async def get_by_isbn(
         return book.model_dump()
     raise HTTPException(status_code=404, detail="Book not found")
 
-@router.get("/filter", response_model=list[Book])
+@router.get("/filter", response_model=None, response_class=ModelResponse, responses=BOOK_PAGE_RESPONSES)
 @inject
 async def filter_by_category(
-    author: str | None = None,
-    subject: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    author: list[str] | None = Query(None),
+    subject: list[str] | None = Query(None),
     publisher: str | None = None,
     publication_year: int | None = None,
     language: str | None = None,
+    match: MatchMode = MatchMode.all,
+    with_availability: bool = False,
+    fields: list[BookField] | None = Query(None),
     service: IBookService = Depends(Provide[Container.book_service]),
-) -> list:
+) -> ModelResponse:
     """An endpoint filtering books by given atribute/s.
+        `author` and `subject` can be repeated, `match` decides whether
+        a book needs all (AND) or any (OR) of the given values.
     
     Args:
-        author (str | None): The book author.
-        subject (str | None): The book subject.
+        limit (int): Maximum number of books on the page.
+        after (str | None): The `next_cursor` of the previous page.
+        author (list[str] | None): The book authors.
+        subject (list[str] | None): The book subjects.
         publisher (str | None): The book publisher. 
         publication_year (int | None): The book publication year.
         language (str | None): The book language.
+        match (MatchMode): How multiple authors/subjects are combined.
+        with_availability (bool): Whether to add total and available copies counts.
+        fields (list[BookField] | None): The attributes to return besides `book_id`, all when omitted.
         service (IBookService): The injected service dependency.
 
     Returns:
-        list: The book attributes collection.
+        ModelResponse: The page of matching books with the next page cursor.
     """
     books = await service.filter_books(
+        limit=limit,
+        after=after,
         author=author,
         subject=subject,
         publisher=publisher,
         publication_year=publication_year,
         language=language,
+        match=match,
+        with_availability=with_availability,
+        fields=fields,
+    )
+    return _book_page(books, fields)
+
+@router.get("/facets", response_model=BookFacets)
+@inject
+async def get_facets(
+    author: list[str] | None = Query(None),
+    subject: list[str] | None = Query(None),
+    publisher: str | None = None,
+    publication_year: int | None = None,
+    language: str | None = None,
+    match: MatchMode = MatchMode.all,
+    service: IBookService = Depends(Provide[Container.book_service]),
+) -> BookFacets:
+    """An endpoint counting books per subject, language, publisher and publication year.
+        Takes the same filters as `/filter`; results are cached for a short time.
+    
+    Args:
+        author (list[str] | None): The book authors.
+        subject (list[str] | None): The book subjects.
+        publisher (str | None): The book publisher. 
+        publication_year (int | None): The book publication year.
+        language (str | None): The book language.
+        match (MatchMode): How multiple authors/subjects are combined.
+        service (IBookService): The injected service dependency.
+
+    Returns:
+        BookFacets: The book counts per value of every facet.
+    """
+    return await service.get_facets(
+        author=author,
+        subject=subject,
+        publisher=publisher,
+        publication_year=publication_year,
+        language=language,
+        match=match,
     )
-    return books
         
 @router.post("/create", response_model=Book, status_code=201)
 @inject
@@ -166,6 +335,32 @@ async def create_book(
         return book.model_dump()
      raise HTTPException(status_code=404, detail="Book not found")
 
+@router.post("/import", response_model=ImportReport)
+@inject
+async def import_books(
+    request: Request,
+    format: ImportFormat = ImportFormat.jsonl,
+    default_copies_location: str | None = None,
+    service: IBookService = Depends(Provide[Container.book_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> ImportReport:
+    """An endpoint importing books with their copies from a streamed file. (Intended for Librarian use.)
+        The request body is a JSONL or CSV file with `BookImport` records,
+        rejected records are listed in the report together with their line numbers.
+
+    Args:
+        request (Request): The incoming request with the file as its body.
+        format (ImportFormat): The format of the file.
+        default_copies_location (str | None): Location for copies without their own.
+        service (IBookService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        ImportReport: The number of imported books and copies with the rejected records.
+    """
+    records = parse_import(request.stream(), format)
+    return await service.import_books(records, default_copies_location)
+
 @router.patch("/update", response_model=Book)
 @inject
 async def update_book(
@@ -209,3 +404,19 @@ async def delete_book(
      if not result:
         raise HTTPException(status_code=404, detail="Book not found")
      return None
+
+
+def _book_page(books: Page, fields: list[BookField] | None) -> ModelResponse:
+    """A private function encoding a page of books in the shape chosen by the request.
+
+    Whole books (and their counters) are encoded with all attributes, only
+    a `BookSummary` projection leaves out the attributes it did not select.
+
+    Args:
+        books (Page): The page of `Book`, `BookAvailability` or `BookSummary` items.
+        fields (list[BookField] | None): The chosen attributes, whole books when None.
+
+    Returns:
+        ModelResponse: The encoded page.
+    """
+    return ModelResponse(books, exclude_unset=bool(fields))
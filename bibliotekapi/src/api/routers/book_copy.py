@@ -1,13 +1,16 @@
 """A module containing book copy routers"""
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from src.container import Container
+from src.api.utils.etag import is_not_modified, make_etag, not_modified
 from src.infrastructure.services.ibook_copy import IBookCopyService
+from src.core.domain.batch import Batch
 from src.core.domain.book_copy import BookCopy, BookCopyCreate, BookCopyStatus, BookCopyUpdate
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.auth.auth import librarian_required
+from src.infrastructure.utils.consts import MAX_BATCH_IDS, MAX_BULK_COPIES
 
 router = APIRouter()
 
@@ -33,26 +36,55 @@ async def get_book_copies_by_id(
         return book.model_dump()
     raise HTTPException(status_code=404, detail="Book copy not found")
     
+@router.get("/batch", response_model=Batch[BookCopy, int])
+@inject
+async def get_copies_by_ids(
+    ids: list[int] = Query(..., min_length=1, max_length=MAX_BATCH_IDS),
+    service: IBookCopyService = Depends(Provide[Container.book_copy_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> Batch:
+    """An endpoint for getting many book copies at once. (Intended for Librarian use.)
+        `ids` can be repeated, copies are returned in the same order.
+    
+    Args:
+        ids (list[int]): The book copy ids.
+        service (IBookCopyService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        Batch: The found book copies with the ids that do not exist.
+    """
+    return await service.get_copies_by_ids(ids)
+    
 @router.get("/bookid/{book_id}", response_model=list[BookCopy])
 @inject
 async def get_copies_by_book(
     book_id: int,
+    request: Request,
+    response: Response,
     status: BookCopyStatus | None = None,
     service: IBookCopyService = Depends(Provide[Container.book_copy_service]),
     current_user: UserDTO = Depends(librarian_required)
-) -> list:
+) -> list | Response:
     """An endpoint for getting book copies of a specific book.(Intended for Librarian use.)
+        Answers `304 Not Modified` when `If-None-Match` holds the current ETag.
     
     Args:
         book_id: id of the book to retrive copies for.
+        request (Request): The incoming request.
+        response (Response): The outgoing response.
         status (BookCopyStatus | None)
         service (IBookCopyService): The injected service dependency.
         current_user (UserDTO): The injected user authentication dependency.
 
     Returns:
-        list: The book copy attributes collection.
+        list | Response: The book copy attributes collection or an empty 304 response.
     """
+    etag = make_etag(await service.get_copies_fingerprint(book_id, status))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
     copies = await service.get_copies_by_book(book_id,status)
+    response.headers["ETag"] = etag
     return copies
 
 @router.get("/bookid/{book_id}/available-count", response_model=int)
@@ -94,6 +126,29 @@ async def add_book_copy(
         return copy.model_dump()
     raise HTTPException(status_code=404, detail="Copy not found")
 
+@router.post("/create-many", response_model=list[BookCopy], status_code=201)
+@inject
+async def add_book_copies(
+    book_id: int,
+    count: int = Query(ge=1, le=MAX_BULK_COPIES),
+    location: str | None = None,
+    service: IBookCopyService = Depends(Provide[Container.book_copy_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> list:
+    """An endpoint for adding many copies of a book at once. (Intended for Librarian use.)
+    
+    Args:
+        book_id (int): Id of the book.
+        count (int): Number of copies to create.
+        location (str | None): Location of the copies.
+        service (IBookCopyService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        list : The created book copies attributes collection.
+    """
+    return await service.add_book_copies(book_id, location, count)
+
 @router.patch("/update", response_model=BookCopy)
 @inject
 async def update_copy(
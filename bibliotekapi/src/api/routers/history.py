@@ -1,42 +1,122 @@
 """A module containing history routers"""
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
+from src.api.utils.export import ExportFormat, render_export
+from src.api.utils.responses import ModelResponse
 from src.container import Container
 from src.infrastructure.services.ihistory import IHistoryService
-from src.core.domain.history import HistoryCreate, HistoryStatus
+from src.core.domain.history import HistoryCreate, HistoryStatus, OverdueUser
+from src.core.domain.page import Page
 from src.infrastructure.dto.historydto import HistoryDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.auth.auth import librarian_required, get_current_user
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 
 router = APIRouter()
 
-@router.get("/all", response_model=list[HistoryDTO])
+@router.get("/all", response_model=Page[HistoryDTO], response_class=ModelResponse)
 @inject
 async def get_all_history(
     status: HistoryStatus | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
     service: IHistoryService = Depends(Provide[Container.history_service]),
     current_user: UserDTO = Depends(librarian_required)
-) -> list:
-    """The endpoint for getting all history from the repository (Intendend for Librarian use).
+) -> Page:
+    """The endpoint for getting a page of history from the repository (Intendend for Librarian use).
+        Optionally filter by status.
+
+    Args:
+        status: HistoryStatus | None = None: status of a book in history record.
+        limit (int): Maximum number of history records on the page.
+        after (str | None): The `next_cursor` of the previous page.
+        service (IHistoryService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        Page: The page of history data with the next page cursor.
+    """
+    history = await service.get_all_history(status, limit, after)
+    return ModelResponse(history)
+
+@router.get("/overdue", response_model=Page[HistoryDTO], response_class=ModelResponse)
+@inject
+async def get_overdue_history(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    service: IHistoryService = Depends(Provide[Container.history_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> Page:
+    """The endpoint for getting a page of loans past their due date (Intendend for Librarian use).
+
+    Args:
+        limit (int): Maximum number of history records on the page.
+        after (str | None): The `next_cursor` of the previous page.
+        service (IHistoryService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        Page: The page of overdue loans, the longest overdue first, with the next page cursor.
+    """
+    history = await service.get_overdue_history(limit, after)
+    return ModelResponse(history)
+
+@router.get("/overdue/users", response_model=Page[OverdueUser])
+@inject
+async def get_overdue_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    service: IHistoryService = Depends(Provide[Container.history_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> Page:
+    """The endpoint for getting a page of users with loans past their due date (Intendend for Librarian use).
+
+    Args:
+        limit (int): Maximum number of users on the page.
+        after (str | None): The `next_cursor` of the previous page.
+        service (IHistoryService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        Page: The page of users with the count, oldest due date and ids of their overdue loans.
+    """
+    users = await service.get_overdue_users(limit, after)
+    return users
+
+@router.get("/export")
+@inject
+async def export_history(
+    status: HistoryStatus | None = None,
+    format: ExportFormat = ExportFormat.ndjson,
+    service: IHistoryService = Depends(Provide[Container.history_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> StreamingResponse:
+    """The endpoint for exporting all history as a streamed file (Intendend for Librarian use).
         Optionally filter by status.
 
     Args:
         status: HistoryStatus | None = None: status of a book in history record.
+        format (ExportFormat): The export file format, NDJSON or CSV.
         service (IHistoryService): The injected service dependency.
         current_user (UserDTO): The injected user authentication dependency.
 
     Returns:
-        list: The collection of all history data.
+        StreamingResponse: The history records streamed row by row.
     """
-    history = await service.get_all_history(status)
-    return history
+    records = service.export_history(status)
+    return StreamingResponse(
+        render_export(records, format, HistoryDTO),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="history.{format.value}"'},
+    )
     
 
-@router.get("/userid/{user_id}", response_model=list[HistoryDTO])
+@router.get("/userid/{user_id}", response_model=list[HistoryDTO], response_class=ModelResponse)
 @inject
 async def get_history_by_user(
     user_id: UUID4,
@@ -57,10 +137,10 @@ async def get_history_by_user(
         list: The collection of history data for a given user.
     """
     history = await service.get_history_by_user(user_id, status)
-    return history
+    return ModelResponse(history)
 
 
-@router.get("/me", response_model=list[HistoryDTO])
+@router.get("/me", response_model=list[HistoryDTO], response_class=ModelResponse)
 @inject
 async def get_user_history(
     status: HistoryStatus | None = None,
@@ -80,7 +160,7 @@ async def get_user_history(
     """
     user_id = current_user.user_id
     history = await service.get_history_by_user(user_id, status)
-    return history
+    return ModelResponse(history)
 
 @router.patch("/return/{history_id}", response_model=HistoryDTO)
 @inject
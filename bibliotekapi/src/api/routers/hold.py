@@ -0,0 +1,121 @@
+"""A module containing hold (waiting list) routers"""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.container import Container
+from src.infrastructure.services.ihold import IHoldService
+from src.core.domain.hold import HoldStatus
+from src.infrastructure.dto.holddto import HoldDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.auth.auth import librarian_required, get_current_user
+
+
+router = APIRouter()
+
+@router.get("/me", response_model=list[HoldDTO])
+@inject
+async def get_user_holds(
+    status: HoldStatus | None = None,
+    service: IHoldService = Depends(Provide[Container.hold_service]),
+    current_user: UserDTO = Depends(get_current_user)
+) -> list:
+    """The endpoint for getting holds of currently authenticated user, with their places in the queues.
+        Optionally filter by status.
+
+    Args:
+        status (HoldStatus | None): status of hold.
+        service (IHoldService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        list: The collection of hold data for the user.
+    """
+    holds = await service.get_holds_by_user(current_user.user_id, status)
+    return holds
+
+@router.get("/holdid/{hold_id}", response_model=HoldDTO)
+@inject
+async def get_hold_by_id(
+    hold_id: int,
+    service: IHoldService = Depends(Provide[Container.hold_service]),
+    current_user: UserDTO = Depends(get_current_user)
+) -> dict:
+    """The endpoint for getting a hold of currently authenticated user, with its place in the queue.
+
+    Args:
+        hold_id (int): The id of the hold.
+        service (IHoldService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        dict: The hold data if exists.
+    """
+    hold = await service.get_hold_by_id(hold_id)
+    if hold and hold.user_id == current_user.user_id:
+        return hold.model_dump()
+    raise HTTPException(status_code=404, detail="Hold not found")
+
+@router.get("/bookid/{book_id}", response_model=list[HoldDTO])
+@inject
+async def get_book_queue(
+    book_id: int,
+    service: IHoldService = Depends(Provide[Container.hold_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> list:
+    """The endpoint for getting the queue of a book (Intended for Librarian use).
+
+    Args:
+        book_id (int): The id of the book.
+        service (IHoldService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        list: The waiting holds in the queue order.
+    """
+    holds = await service.get_book_queue(book_id)
+    return holds
+
+@router.post("/create", response_model=HoldDTO, status_code=201)
+@inject
+async def place_hold(
+    book_id: int,
+    service: IHoldService = Depends(Provide[Container.hold_service]),
+    current_user: UserDTO = Depends(get_current_user)
+) -> dict:
+    """The endpoint for joining the queue of a book. When a copy is released it is
+        reserved for the first user in the queue, no retries are needed.
+        If a copy is available already, it is reserved right away.
+
+    Args:
+        book_id (int): The id of the book.
+        service (IHoldService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        dict: The new hold with its place in the queue.
+    """
+    hold = await service.place_hold(book_id, current_user.user_id)
+    return hold.model_dump()
+
+@router.patch("/cancel", response_model=HoldDTO)
+@inject
+async def cancel_hold(
+    hold_id: int,
+    service: IHoldService = Depends(Provide[Container.hold_service]),
+    current_user: UserDTO = Depends(get_current_user)
+) -> dict:
+    """The endpoint for leaving the queue of a book.
+
+    Args:
+        hold_id (int): The id of the hold.
+        service (IHoldService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        dict: The canceled hold.
+    """
+    hold = await service.cancel_hold(hold_id, current_user.user_id)
+    if hold:
+        return hold.model_dump()
+    raise HTTPException(status_code=404, detail="Hold not found")
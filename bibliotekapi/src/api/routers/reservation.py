@@ -1,39 +1,68 @@
 """A module containing reservation routers"""
 
+from datetime import datetime
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import UUID4
 
+from src.api.utils.responses import ModelResponse
 from src.container import Container
 from src.infrastructure.services.ireservation import IReservationService
-from src.core.domain.reservation import ReservationCreate, ReservationStatus
+from src.core.domain.reservation import ReservationCreate, ReservationOrder, ReservationStatus
+from src.core.domain.page import Page
 from src.infrastructure.dto.reservationdto import ReservationDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.auth.auth import librarian_required, get_current_user
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 
 router = APIRouter()
 
-@router.get("/all", response_model=list[ReservationDTO])
+@router.get("/all", response_model=Page[ReservationDTO], response_class=ModelResponse)
 @inject
 async def get_all_reservations(
     status: ReservationStatus | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    reserved_from: datetime | None = None,
+    reserved_to: datetime | None = None,
+    expires_before: datetime | None = None,
+    order: ReservationOrder = ReservationOrder.reservation_id,
+    descending: bool = False,
     service: IReservationService = Depends(Provide[Container.reservation_service]),
     current_user: UserDTO = Depends(librarian_required)
-) -> list:
-    """The endpoint for getting a all reservations from the repository (Intended for Librarian use).
-        Optionally filter by status.
+) -> Page:
+    """The endpoint for getting a page of reservations from the repository (Intended for Librarian use).
+        Optionally filter by status and dates, e.g. the pickup shelf is
+        `status=active&order=expiration_date`.
 
     Args:
         status (ReservationStatus | None): status of reservation.
+        limit (int): Maximum number of reservations on the page.
+        after (str | None): The `next_cursor` of the previous page, requested with the same order.
+        reserved_from (datetime | None): The earliest reservation date.
+        reserved_to (datetime | None): The latest reservation date.
+        expires_before (datetime | None): The latest expiration date.
+        order (ReservationOrder): The sort key of the page.
+        descending (bool): Whether to sort in descending order.
         service (IReservationService): The injected service dependency.
         current_user (UserDTO): The injected user authentication dependency.
 
     Returns:
-        list: The collection of reservations data.
+        Page: The page of reservations data with the next page cursor.
     """
-    reservations = await service.get_all_reservations(status)
-    return reservations
+    reservations = await service.get_all_reservations(
+        status,
+        limit,
+        after,
+        reserved_from=reserved_from,
+        reserved_to=reserved_to,
+        expires_before=expires_before,
+        order=order,
+        descending=descending,
+    )
+    return ModelResponse(reservations)
 
 @router.get("/reservationid/{reservation_id}", response_model=ReservationDTO)
 @inject
@@ -57,7 +86,7 @@ async def get_reservation_by_id(
         return reservation.model_dump()
     raise HTTPException(status_code=404, detail="Reservation not found")
 
-@router.get("/userid/{user_id}", response_model=list[ReservationDTO])
+@router.get("/userid/{user_id}", response_model=list[ReservationDTO], response_class=ModelResponse)
 @inject
 async def get_reservations_by_user(
     user_id: UUID4, 
@@ -77,9 +106,9 @@ async def get_reservations_by_user(
         list: The collection of reservation data for a given user.
     """
     reservations = await service.get_reservations_by_user(user_id, status)
-    return reservations
+    return ModelResponse(reservations)
 
-@router.get("/me", response_model=list[ReservationDTO])
+@router.get("/me", response_model=list[ReservationDTO], response_class=ModelResponse)
 @inject
 async def get_user_reservations(
     status: ReservationStatus | None = None,
@@ -99,7 +128,7 @@ async def get_user_reservations(
     """
     user_id = current_user.user_id
     reservations = await service.get_reservations_by_user(user_id, status)
-    return reservations
+    return ModelResponse(reservations)
 
 @router.post("/create", response_model=ReservationDTO, status_code=201)
 @inject
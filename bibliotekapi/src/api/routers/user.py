@@ -1,38 +1,46 @@
 """A module containing user routers"""
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
 from pydantic import UUID4, EmailStr
 from fastapi.security import OAuth2PasswordRequestForm
 
 
+from src.api.utils.responses import ModelResponse
 from src.container import Container
 from src.infrastructure.services.iuser import IUserService
 from src.core.domain.user import UserCreate, UserRole, UserLogin, User
+from src.core.domain.batch import Batch
+from src.core.domain.page import Page
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.auth.auth import librarian_required, get_current_user
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_BATCH_IDS, MAX_PAGE_SIZE
 
 
 router = APIRouter()
 
-@router.get("/all", response_model=list[UserDTO])
+@router.get("/all", response_model=Page[UserDTO], response_class=ModelResponse)
 @inject
 async def get_all_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
     service: IUserService = Depends(Provide[Container.user_service]),
     # current_user: UserDTO = Depends(librarian_required)
-) -> list:
-    """The endpoint for getting all users from the repository (Intended for Librarian use).
+) -> Page:
+    """The endpoint for getting a page of users from the repository (Intended for Librarian use).
 
     Args:
+        limit (int): Maximum number of users on the page.
+        after (str | None): The `next_cursor` of the previous page.
         service (IHistoryService): The injected service dependency.
         current_user (UserDTO): The injected user authentication dependency.
 
     Returns:
-        list: The collection of the all users.
+        Page: The page of users with the next page cursor.
     """
-    users = await service.get_all_users()
-    return users
+    users = await service.get_all_users(limit, after)
+    return ModelResponse(users)
 
 @router.get("/userid", response_model=UserDTO)
 @inject
@@ -56,6 +64,26 @@ async def get_user_by_uuid(
         return user.model_dump()
     raise HTTPException(status_code=404, detail="User not found")
 
+@router.get("/batch", response_model=Batch[UserDTO, UUID4])
+@inject
+async def get_users_by_ids(
+    ids: list[UUID4] = Query(..., min_length=1, max_length=MAX_BATCH_IDS),
+    service: IUserService = Depends(Provide[Container.user_service]),
+    current_user: UserDTO = Depends(librarian_required)
+) -> Batch:
+    """The endpoint for getting many users at once. (Intended for Librarian use).
+        `ids` can be repeated, users are returned in the same order.
+
+    Args:
+        ids (list[UUID4]): The ids of the users.
+        service (IUserService): The injected service dependency.
+        current_user (UserDTO): The injected user authentication dependency.
+
+    Returns:
+        Batch: The found users with the ids that do not exist.
+    """
+    return await service.get_users_by_ids(ids)
+
 @router.get("/email", response_model=UserDTO)
 @inject
 async def get_user_by_email(
@@ -0,0 +1,126 @@
+"""A module containing helpers parsing streamed catalog import files."""
+
+import codecs
+import csv
+import json
+from enum import Enum
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+
+from src.core.domain.book import BookImport
+
+
+LIST_FIELDS = ("authors", "subject")
+LIST_SEPARATOR = ";"
+
+
+class ImportFormat(str, Enum):
+    """Enum representing supported import file formats.
+
+    Attributes:
+        jsonl: Newline delimited JSON, one book per line.
+        csv: Comma separated values with a header row, list fields separated with ";".
+            Quoted values spanning multiple lines are not supported.
+    """
+    jsonl = "jsonl"
+    csv = "csv"
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """A function splitting a stream of utf-8 encoded chunks into lines.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The raw request body chunks.
+
+    Yields:
+        str: The consecutive lines, without line terminators.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _csv_record(header: list[str], line: str) -> dict:
+    """A private function converting a CSV line into an import record.
+
+    Args:
+        header (list[str]): The column names.
+        line (str): The CSV line.
+
+    Raises:
+        ValueError: If the number of values does not match the header.
+
+    Returns:
+        dict: The record without empty values.
+    """
+    values = next(csv.reader([line]))
+    if len(values) != len(header):
+        raise ValueError(f"expected {len(header)} values, got {len(values)}")
+    record = {}
+    for column, value in zip(header, values):
+        value = value.strip()
+        if not value:
+            continue
+        if column in LIST_FIELDS:
+            record[column] = [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+        else:
+            record[column] = value
+    return record
+
+
+def _error_message(error: Exception) -> str:
+    """A private function rendering a parsing or validation error.
+
+    Args:
+        error (Exception): The error raised for a record.
+
+    Returns:
+        str: The human readable message.
+    """
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in error.errors()
+        )
+    return str(error)
+
+
+async def parse_import(
+    chunks: AsyncIterator[bytes],
+    fmt: ImportFormat,
+) -> AsyncIterator[tuple[int, BookImport | str]]:
+    """A function parsing a streamed import file record by record.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The raw request body chunks.
+        fmt (ImportFormat): The format of the file.
+
+    Yields:
+        tuple[int, BookImport | str]: The line number with the validated
+            record or the reason it was rejected.
+    """
+    header = None
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            if fmt is ImportFormat.csv:
+                if header is None:
+                    header = [column.strip() for column in next(csv.reader([line]))]
+                    continue
+                record = _csv_record(header, line)
+            else:
+                record = json.loads(line)
+            result = BookImport.model_validate(record)
+        except (ValueError, csv.Error) as e:
+            result = _error_message(e)
+        yield line_number, result
@@ -0,0 +1,44 @@
+"""A module containing helpers for conditional (ETag) requests."""
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: object) -> str:
+    """A function building a strong entity tag from the given parts.
+
+    Args:
+        *parts (object): Values identifying the representation, e.g. id and version.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """A function checking the `If-None-Match` header of a request against an entity tag.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current entity tag of the resource.
+
+    Returns:
+        bool: Whether the client already holds the current representation.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def not_modified(etag: str) -> Response:
+    """A function building an empty `304 Not Modified` response.
+
+    Args:
+        etag (str): The current entity tag of the resource.
+
+    Returns:
+        Response: The response without a body.
+    """
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,91 @@
+"""A module containing helpers rendering streamed records as export files."""
+
+import csv
+import io
+from enum import Enum
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+
+EXPORT_CHUNK_ROWS = 500
+
+
+class ExportFormat(str, Enum):
+    """Enum representing supported export file formats.
+
+    Attributes:
+        ndjson: Newline delimited JSON, one record per line.
+        csv: Comma separated values with a header row.
+    """
+    ndjson = "ndjson"
+    csv = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """Method returning the HTTP media type of the format."""
+        return "application/x-ndjson" if self is ExportFormat.ndjson else "text/csv"
+
+
+async def to_ndjson(records: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    """A function rendering records as NDJSON chunks.
+
+    Args:
+        records (AsyncIterator[BaseModel]): The records to render.
+
+    Returns:
+        AsyncIterator[str]: The chunks of NDJSON lines.
+    """
+    lines = []
+    async for record in records:
+        lines.append(record.model_dump_json())
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+async def to_csv(records: AsyncIterator[BaseModel], fields: list[str]) -> AsyncIterator[str]:
+    """A function rendering records as CSV chunks with a header row.
+
+    Args:
+        records (AsyncIterator[BaseModel]): The records to render.
+        fields (list[str]): The record fields written as columns.
+
+    Returns:
+        AsyncIterator[str]: The chunks of CSV rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    rows = 0
+    async for record in records:
+        writer.writerow(record.model_dump(mode="json"))
+        rows += 1
+        if rows >= EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    yield buffer.getvalue()
+
+
+def render_export(
+    records: AsyncIterator[BaseModel],
+    fmt: ExportFormat,
+    model: type[BaseModel],
+) -> AsyncIterator[str]:
+    """A function choosing the renderer for the requested export format.
+
+    Args:
+        records (AsyncIterator[BaseModel]): The records to render.
+        fmt (ExportFormat): The requested export format.
+        model (type[BaseModel]): The records model, used for CSV columns.
+
+    Returns:
+        AsyncIterator[str]: The rendered chunks.
+    """
+    if fmt is ExportFormat.csv:
+        return to_csv(records, list(model.model_fields))
+    return to_ndjson(records)
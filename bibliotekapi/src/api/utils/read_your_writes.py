@@ -0,0 +1,50 @@
+"""A module containing the middleware routing reads after writes to the primary database."""
+
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from src.db import read_your_writes
+from src.infrastructure.utils.consts import (
+    READ_PRIMARY_COOKIE,
+    READ_PRIMARY_HEADER,
+    READ_PRIMARY_SECONDS,
+)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+async def read_your_writes_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """A middleware sending reads of clients that wrote recently to the primary.
+
+    A successful write sets a short-lived cookie; while the client sends it back
+    (or the `X-Read-Primary` header), read-only units of work skip the replica.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        call_next (Callable[[Request], Awaitable[Response]]): The next handler.
+
+    Returns:
+        Response: The HTTP response.
+    """
+    primary = (
+        READ_PRIMARY_COOKIE in request.cookies
+        or request.headers.get(READ_PRIMARY_HEADER, "").lower() in ("1", "true")
+    )
+    token = read_your_writes.set(primary)
+    try:
+        response = await call_next(request)
+    finally:
+        read_your_writes.reset(token)
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            "1",
+            max_age=READ_PRIMARY_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
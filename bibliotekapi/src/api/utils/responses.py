@@ -0,0 +1,36 @@
+"""A module containing the fast JSON response used by list endpoints."""
+
+from typing import Any, Mapping
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+
+# Serializes whatever it is given with the (compiled) serializers of the
+# models it contains, honouring their aliases, excludes and custom serializers.
+_ANY_ADAPTER = TypeAdapter(Any)
+
+
+class ModelResponse(JSONResponse):
+    """A response rendering already validated DTOs (or pages of them) with pydantic's serializer.
+
+    Returning it from an endpoint skips FastAPI's `response_model` validation
+    and `jsonable_encoder`, the models are dumped straight to JSON bytes by
+    pydantic-core rather than orjson, which can not encode models itself.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        exclude_unset: bool = False,
+    ):
+        self._exclude_unset = exclude_unset
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        """Method encoding the content into the response body."""
+        return _ANY_ADAPTER.dump_json(content, by_alias=True, exclude_unset=self._exclude_unset)
@@ -1,6 +1,6 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,20 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    # Hot standby serving read-only queries, same name and credentials as the primary.
+    DB_REPLICA_HOST: Optional[str] = None
+    # Seconds between sweeps of expired reservations, 0 disables the sweeper.
+    RESERVATION_SWEEP_INTERVAL: int = 60
+    # Seconds between folds of the copies counters deltas into books, 0 disables them.
+    COPY_COUNTER_FOLD_INTERVAL: int = 5
+    # Seconds between runs of the due date and overdue notifications, 0 disables them.
+    NOTIFICATION_INTERVAL: int = 3600
+    # "smtp" sends e-mails, "file" appends the messages to NOTIFICATION_FILE (JSON lines).
+    NOTIFICATION_TRANSPORT: Literal["smtp", "file"] = "file"
+    NOTIFICATION_FILE: str = "notifications.jsonl"
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    SMTP_SENDER: str = "biblioteka@localhost"
 
 
 config = AppConfig()
\ No newline at end of file
@@ -1,24 +1,51 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory
-
+from dependency_injector.providers import Factory, Object, Selector, Singleton
 
+from src.config import config
 from src.infrastructure.services.book import BookService
 from src.infrastructure.services.book_copy import BookCopyService
 from src.infrastructure.services.history import HistoryService
+from src.infrastructure.services.hold import HoldService
+from src.infrastructure.services.notification import NotificationService
 from src.infrastructure.services.reservation import ReservationService
 from src.infrastructure.services.user import UserService
 from src.infrastructure.services.unit_of_work import UnitOfWork
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.transport import FileTransport, SmtpTransport
+from src.infrastructure.utils.consts import (
+    BOOK_CACHE_SIZE,
+    BOOK_CACHE_TTL,
+    FACET_CACHE_SIZE,
+    FACET_CACHE_TTL,
+)
 
 class Container(DeclarativeContainer):
     """Conntainer class for dependency injecting purposes."""
 
     unit_of_work = Factory(UnitOfWork)
 
+    read_unit_of_work = Factory(UnitOfWork, read_only=True)
+
+    facet_cache = Singleton(
+        TTLCache,
+        maxsize=FACET_CACHE_SIZE,
+        ttl=FACET_CACHE_TTL,
+    )
+
+    book_cache = Singleton(
+        TTLCache,
+        maxsize=BOOK_CACHE_SIZE,
+        ttl=BOOK_CACHE_TTL,
+    )
+
     book_service = Factory(
         BookService,
         uow=unit_of_work,
+        facet_cache=facet_cache,
+        book_cache=book_cache,
+        read_uow=read_unit_of_work,
     )
 
     book_copy_service = Factory(
@@ -29,14 +56,40 @@ class Container(DeclarativeContainer):
     history_service = Factory(
         HistoryService,
         uow=unit_of_work,
+        read_uow=read_unit_of_work,
+    )
+
+    hold_service = Factory(
+        HoldService,
+        uow=unit_of_work,
+        read_uow=read_unit_of_work,
+    )
+
+    notification_transport = Selector(
+        Object(config.NOTIFICATION_TRANSPORT),
+        smtp=Singleton(
+            SmtpTransport,
+            host=config.SMTP_HOST,
+            port=config.SMTP_PORT,
+            sender=config.SMTP_SENDER,
+        ),
+        file=Singleton(FileTransport, path=config.NOTIFICATION_FILE),
+    )
+
+    notification_service = Factory(
+        NotificationService,
+        uow=unit_of_work,
+        transport=notification_transport,
     )
 
     reservation_service = Factory(
         ReservationService,
         uow=unit_of_work,
+        read_uow=read_unit_of_work,
     )
 
     user_service = Factory(
         UserService,
         uow=unit_of_work,
+        read_uow=read_unit_of_work,
     )
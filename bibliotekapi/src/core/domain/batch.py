@@ -0,0 +1,37 @@
+"""Module containing multi-get related domain models."""
+
+from typing import Any, Callable, Generic, Hashable, Iterable, TypeVar
+
+from pydantic import BaseModel, Field
+
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+class Batch(BaseModel, Generic[T, K]):
+    """Model representing the result of looking up many records by their ids.
+
+    Attributes:
+        items: The found records, in the order of the requested ids.
+        missing: The requested ids without a record.
+    """
+    items: list[T] = Field(default_factory=list)
+    missing: list[K] = Field(default_factory=list)
+
+    @classmethod
+    def from_items(cls, ids: Iterable[Hashable], items: Iterable[Any], key: Callable[[Any], Hashable]) -> "Batch":
+        """Method ordering looked up records by the requested ids.
+
+        Args:
+            ids (Iterable[Hashable]): The requested ids (without duplicates).
+            items (Iterable[Any]): The found records, in any order.
+            key (Callable[[Any], Hashable]): The function returning the id of a record.
+
+        Returns:
+            Batch: The records in request order with the missing ids.
+        """
+        by_id = {key(item): item for item in items}
+        return cls(
+            items=[by_id[id_] for id_ in ids if id_ in by_id],
+            missing=[id_ for id_ in ids if id_ not in by_id],
+        )
@@ -1,8 +1,31 @@
 """Module containing book related domain models."""
 
+from enum import Enum
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class MatchMode(str, Enum):
+    """Enum representing how multiple values of an array filter are combined.
+
+    Attributes:
+        all: The book must have every given value (AND).
+        any: The book must have at least one of the given values (OR).
+    """
+    all = "all"
+    any = "any"
+
+class BookField(str, Enum):
+    """Enum representing book attributes that can be selected in list views."""
+    isbn = "isbn"
+    title = "title"
+    authors = "authors"
+    subject = "subject"
+    description = "description"
+    publisher = "publisher"
+    publication_year = "publication_year"
+    language = "language"
+    version = "version"
+
 class BookCreate(BaseModel):
     """Model representing book's DTO attributes."""
     isbn: str | None = None
@@ -17,9 +40,38 @@ class BookCreate(BaseModel):
 class Book(BookCreate):
     """Model representing book's attributes in the database."""
     book_id: int | None = None
+    version: int | None = None
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
 
+class BookAvailability(Book):
+    """Model representing book's attributes with the number of its copies."""
+    total_copies: int = 0
+    available_copies: int = 0
+
+class CounterMismatch(BaseModel):
+    """Model representing a book whose copies counters differ from its copies."""
+    book_id: int
+    total_copies: int
+    available_copies: int
+    actual_total_copies: int
+    actual_available_copies: int
+
+class BookSummary(BaseModel):
+    """Model representing the selected subset of book's attributes."""
+    book_id: int
+    isbn: str | None = None
+    title: str | None = None
+    authors: list[str] | None = None
+    subject: list[str] | None = None
+    description: str | None = None
+    publisher: str | None = None
+    publication_year: int | None = None
+    language: str | None = None
+    version: int | None = None
+    total_copies: int | None = None
+    available_copies: int | None = None
+
 class BookUpdate(BaseModel):
     """Module for updating book."""
     isbn: str | None = None
@@ -32,3 +84,32 @@ class BookUpdate(BaseModel):
     language: str | None = None
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class BookImport(BookCreate):
+    """Model representing a single record of a catalog import."""
+    copies_count: int = Field(1, ge=0)
+    location: str | None = None
+
+class ImportRowError(BaseModel):
+    """Model representing an import record that was rejected."""
+    line: int
+    isbn: str | None = None
+    error: str
+
+class ImportReport(BaseModel):
+    """Model representing the outcome of a catalog import."""
+    imported: int = 0
+    copies: int = 0
+    errors: list[ImportRowError] = Field(default_factory=list)
+
+class FacetCount(BaseModel):
+    """Model representing the number of books sharing a facet value."""
+    value: str | int | None
+    count: int
+
+class BookFacets(BaseModel):
+    """Model representing book counts per value of every catalog facet."""
+    subject: list[FacetCount] = Field(default_factory=list)
+    language: list[FacetCount] = Field(default_factory=list)
+    publisher: list[FacetCount] = Field(default_factory=list)
+    publication_year: list[FacetCount] = Field(default_factory=list)
@@ -1,6 +1,7 @@
 """Module containing book copy related domain model"""
 
 from enum import Enum
+from typing import Literal
 from pydantic import BaseModel, ConfigDict
 
 
@@ -16,6 +17,32 @@ class BookCopyStatus(str, Enum):
     reserved = "reserved"
     borrowed = "borrowed"
 
+class CopyTransition(str, Enum):
+    """Enum representing the allowed changes of a book copy status.
+
+        Attributes:
+            reserve: An available copy is reserved.
+            checkout: An available or reserved copy is borrowed.
+            release: A reserved copy is available again.
+            checkin: A borrowed copy is returned.
+            restore: A reserved or borrowed copy with no active reservation or loan
+                is made available again by a librarian.
+    """
+    reserve = "reserve"
+    checkout = "checkout"
+    release = "release"
+    checkin = "checkin"
+    restore = "restore"
+
+# The statuses a transition applies to and the status it leads to.
+COPY_TRANSITIONS: dict[CopyTransition, tuple[tuple[BookCopyStatus, ...], BookCopyStatus]] = {
+    CopyTransition.reserve: ((BookCopyStatus.available,), BookCopyStatus.reserved),
+    CopyTransition.checkout: ((BookCopyStatus.available, BookCopyStatus.reserved), BookCopyStatus.borrowed),
+    CopyTransition.release: ((BookCopyStatus.reserved,), BookCopyStatus.available),
+    CopyTransition.checkin: ((BookCopyStatus.borrowed,), BookCopyStatus.available),
+    CopyTransition.restore: ((BookCopyStatus.reserved, BookCopyStatus.borrowed), BookCopyStatus.available),
+}
+
 class BookCopyCreate(BaseModel):
     """Model representing book copy's DTO attributes"""
     book_id: int
@@ -29,7 +56,10 @@ class BookCopy(BookCopyCreate):
     model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 class BookCopyUpdate(BaseModel):
-    """Model for updating a book copy"""
+    """Model for updating a book copy.
+        Setting `status` makes a copy left reserved or borrowed available again.
+    """
     location: str | None = None
+    status: Literal[BookCopyStatus.available] | None = None
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
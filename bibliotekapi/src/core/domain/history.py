@@ -39,3 +39,30 @@ class History(HistoryCreate):
             and self.return_date is None
             and self.due_date < datetime.now()
         )
+
+class OverdueUser(BaseModel):
+    """Model representing the overdue loans of a user."""
+    user_id: UUID4
+    overdue_count: int
+    oldest_due_date: datetime
+    history_ids: list[int]
+
+class CheckoutFailure(str, Enum):
+    """
+    Enum representing reasons a copy can not be checked out.
+
+    Attributes:
+        user_not_found: The user does not exist.
+        copy_not_found: The copy does not exist.
+        copy_borrowed: The copy is already borrowed.
+        copy_reserved: The copy is reserved for another user.
+    """
+    user_not_found = "user_not_found"
+    copy_not_found = "copy_not_found"
+    copy_borrowed = "copy_borrowed"
+    copy_reserved = "copy_reserved"
+
+class CheckoutResult(BaseModel):
+    """Model representing the outcome of a checkout, the new history record or the failure reason."""
+    history: History | None = None
+    failure: CheckoutFailure | None = None
@@ -0,0 +1,35 @@
+"""Module containing hold (waiting list) related domain models."""
+
+from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, UUID4
+from datetime import datetime
+
+
+class HoldStatus(str, Enum):
+    """
+    Enum representing possible statuses of a hold on a book.
+
+    Attributes:
+        waiting: The user is waiting in the queue for a copy.
+        fulfilled: A copy was reserved for the user.
+        canceled: The user left the queue.
+    """
+    waiting = "waiting"
+    fulfilled = "fulfilled"
+    canceled = "canceled"
+
+class HoldCreate(BaseModel):
+    """Model representing hold's DTO attributes."""
+    user_id: UUID4
+    book_id: int
+
+class Hold(HoldCreate):
+    """Model representing hold's attributes in the database."""
+    hold_id: int | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now())
+    status: HoldStatus = HoldStatus.waiting
+    reservation_id: int | None = None
+    # Place in the queue (1 is next in line) of a waiting hold, computed on read.
+    position: int | None = None
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
@@ -0,0 +1,32 @@
+"""Module containing loan notification related domain models."""
+
+from enum import Enum
+from pydantic import BaseModel, UUID4
+from datetime import datetime
+
+
+class NotificationKind(str, Enum):
+    """
+    Enum representing kinds of notices sent to patrons about their loans.
+
+    Attributes:
+        due_soon: The loan is due in the next few days.
+        overdue: The loan is past its due date.
+    """
+    due_soon = "due_soon"
+    overdue = "overdue"
+
+class LoanNotice(BaseModel):
+    """Model representing a loan a patron should be notified about."""
+    history_id: int
+    user_id: UUID4
+    email: str
+    username: str
+    title: str
+    due_date: datetime
+
+class Message(BaseModel):
+    """Model representing a rendered notification message."""
+    recipient: str
+    subject: str
+    body: str
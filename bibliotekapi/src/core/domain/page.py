@@ -0,0 +1,18 @@
+"""Module containing pagination related domain models."""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """Model representing a single page of a cursor paginated collection.
+
+    Attributes:
+        items: The records of the current page.
+        next_cursor: The opaque cursor of the next page, None on the last page.
+    """
+    items: list[T]
+    next_cursor: str | None = None
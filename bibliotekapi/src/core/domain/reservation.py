@@ -18,6 +18,19 @@ class ReservationStatus(str, Enum):
     canceled = "canceled"
     collected = "collected"
 
+class ReservationOrder(str, Enum):
+    """
+    Enum representing sort keys of reservation lists.
+
+    Attributes:
+        reservation_id: In the order the reservations were made.
+        reservation_date: By the date the copy was reserved.
+        expiration_date: By the date the reservation expires, e.g. for the pickup shelf.
+    """
+    reservation_id = "reservation_id"
+    reservation_date = "reservation_date"
+    expiration_date = "expiration_date"
+
 class ReservationCreate(BaseModel):
     """Model representing reservation's DTO attributes."""
     user_id: UUID4
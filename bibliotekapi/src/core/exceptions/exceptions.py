@@ -14,7 +14,10 @@ class BookNotFound(DomainError):
     pass
 
 class CopyNotAvailable(DomainError):
-    pass
+    """Raised when a copy can not be lent, optionally with a machine readable reason."""
+    def __init__(self, reason: str | None = None):
+        super().__init__(reason)
+        self.reason = reason
 
 class BookNotAvailable(DomainError):
     pass
@@ -29,4 +32,16 @@ class BookBorrowed(DomainError):
     pass
 
 class ISBNAlreadyExist(DomainError):
-    pass
\ No newline at end of file
+    pass
+
+class InvalidBookData(DomainError):
+    """Raised when the data storage rejects a book, with the reason given by the database."""
+    def __init__(self, reason: str | None = None):
+        super().__init__(reason)
+        self.reason = reason
+
+class InvalidCursor(DomainError):
+    pass
+
+class HoldAlreadyExist(DomainError):
+    pass
@@ -2,18 +2,28 @@
 
 from abc import ABC, abstractmethod
 
-from src.core.domain.book import BookCreate, Book
+from src.core.domain.book import BookCreate, Book, BookFacets, BookField, BookSummary, CounterMismatch, MatchMode
+from src.core.domain.page import Page
 
 
 class IBookRepository(ABC):
     """An abstract class representing protocol of book repository"""
 
     @abstractmethod
-    async def get_all_books(self) -> list[Book]:
-        """The abstract getting all books from the data storage.
+    async def get_all_books(
+        self, limit: int, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
+        """The abstract getting a page of books from the data storage.
+
+        Args:
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[Book]: The collection of the all books.
+            Page[Book]: The page of books ordered by id.
         """
 
     @abstractmethod
@@ -27,6 +37,28 @@ class IBookRepository(ABC):
             Book | None: The book data if exists.
         """
 
+    @abstractmethod
+    async def get_books_by_ids(self, book_ids: list[int]) -> list[Book]:
+        """The abstract getting many books from the data storage at once.
+
+        Args:
+            book_ids (list[int]): The ids of the books.
+
+        Returns:
+            list[Book]: The existing books, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_book_version(self, book_id: int) -> int | None:
+        """The abstract getting the current version of a book from the data storage.
+
+        Args:
+            book_id (int): The id of the book.
+
+        Returns:
+            int | None: The version of the book if exists.
+        """
+
     @abstractmethod
     async def get_book_by_title(self, title: str) -> list[Book]:
         """The abstract getting book by the title from the data storage.
@@ -49,6 +81,51 @@ class IBookRepository(ABC):
             list[Book]: The collection of the all books written  by this author
         """
 
+    @abstractmethod
+    async def fuzzy_search_by_title(self, title: str, limit: int) -> list[Book]:
+        """The abstract getting books with a title similar to the given one from the data storage.
+            Ignores letter case, diacritics and small typos.
+
+        Args:
+            title (str): The (possibly misspelled or partial) title of the book.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[Book]: The collection of similar books, most similar first.
+        """
+
+    @abstractmethod
+    async def fuzzy_search_by_author(self, author: str, limit: int) -> list[Book]:
+        """The abstract getting books with an author similar to the given one from the data storage.
+            Ignores letter case, diacritics and small typos.
+
+        Args:
+            author (str): The (possibly misspelled or partial) author name.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[Book]: The collection of books by similar authors, most similar first.
+        """
+
+    @abstractmethod
+    async def search_books(
+        self, query: str, limit: int, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
+        """The abstract full-text searching books in the data storage.
+            Matches title, authors, subject and description, including word prefixes.
+
+        Args:
+            query (str): The search phrase.
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
+
+        Returns:
+            Page[Book]: The page of matching books, best ranked first.
+        """
+
     @abstractmethod
     async def get_book_by_isbn(self, isbn: str) -> Book | None:
         """The abstract getting book by isbn from the data storage.
@@ -63,24 +140,59 @@ class IBookRepository(ABC):
     
     @abstractmethod
     async def filter_books(
-        self, 
-        author: str | None = None,
-        subject: str | None = None,
+        self,
+        limit: int,
+        after: str | None = None,
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
         publisher: str | None = None,
         publication_year: int | None = None,
         language: str | None = None,
-    ) -> list[Book]:
+        match: MatchMode = MatchMode.all,
+        with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
         """The abstract getting filtered books by chosen parameter
         
         Args:
-            author: str | None = None,
-            subject: str | None = None,
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
             publisher: str | None = None,
             publication_year: int | None = None,
             language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[Book]: The collection of the all books which match the parameters.
+            Page[Book]: The page of books which match the parameters, ordered by id.
+        """
+
+    @abstractmethod
+    async def get_facets(
+        self, 
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
+        publisher: str | None = None,
+        publication_year: int | None = None,
+        language: str | None = None,
+        match: MatchMode = MatchMode.all,
+    ) -> BookFacets:
+        """The abstract counting books per facet value for the chosen filters.
+            Facets are subject, language, publisher and publication year.
+        
+        Args:
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
+            publisher: str | None = None,
+            publication_year: int | None = None,
+            language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+        
+        Returns:
+            BookFacets: The book counts per value of every facet, most frequent first.
         """
 
     @abstractmethod
@@ -93,6 +205,60 @@ class IBookRepository(ABC):
             Book | None: The newly created book.
         """
 
+    @abstractmethod
+    async def add_books(self, books: list[BookCreate]) -> list[int]:
+        """The abstract adding many books to the data storage at once.
+
+        Args:
+            books (list[BookCreate]): The attributes of the books.
+
+        Raises:
+            ISBNAlreadyExist: If one of the ISBNs was inserted in the meantime.
+            InvalidBookData: If the data storage rejected one of the books for another reason.
+
+        Returns:
+            list[int]: The ids of the newly created books, in the order of `books`.
+        """
+
+    @abstractmethod
+    async def get_existing_isbns(self, isbns: list[str]) -> set[str]:
+        """The abstract checking which of the ISBNs are already in the data storage.
+
+        Args:
+            isbns (list[str]): The ISBNs to check.
+
+        Returns:
+            set[str]: The ISBNs that already exist.
+        """
+
+    @abstractmethod
+    async def find_counter_mismatches(self) -> list[CounterMismatch]:
+        """The abstract comparing the books copies counters with their copies in the data storage.
+
+        Returns:
+            list[CounterMismatch]: The books whose counters are wrong.
+        """
+
+    @abstractmethod
+    async def reset_counters(self, mismatches: list[CounterMismatch]) -> None:
+        """The abstract overwriting the books copies counters with the actual numbers.
+
+        Args:
+            mismatches (list[CounterMismatch]): The books with wrong counters.
+        """
+
+    @abstractmethod
+    async def fold_copy_counters(self, limit: int) -> int:
+        """The abstract adding the oldest pending copies counters deltas to their books
+            and removing them.
+
+        Args:
+            limit (int): Maximum number of deltas to fold.
+
+        Returns:
+            int: The number of folded deltas.
+        """
+
     @abstractmethod
     async def update_book(self, book_id: int, data: Book) -> Book | None:
         """The abstarct updating book data in the data storage.
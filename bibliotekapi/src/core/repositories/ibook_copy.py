@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 
-from src.core.domain.book_copy import BookCopyCreate, BookCopy, BookCopyStatus
+from src.core.domain.book_copy import BookCopyCreate, BookCopy, BookCopyStatus, CopyTransition
 
 
 class IBookCopyRepository(ABC):
@@ -29,6 +29,17 @@ class IBookCopyRepository(ABC):
             BookCopy | None: The book copy data if exists.
         """
 
+    @abstractmethod
+    async def get_copies_by_ids(self, copy_ids: list[int]) -> list[BookCopy]:
+        """The abstract getting many book copies from the data storage at once.
+
+        Args:
+            copy_ids (list[int]): The ids of the book copies.
+
+        Returns:
+            list[BookCopy]: The existing book copies, in no particular order.
+        """
+
     @abstractmethod
     async def get_copies_by_book(self, book_id: int, status: BookCopyStatus | None = None) -> list[BookCopy]:
         """The abstract getting book copies of a specific book from the data storage.
@@ -42,6 +53,44 @@ class IBookCopyRepository(ABC):
             list[BookCopy]: The collection of the all copies of a specific book.
         """
 
+    @abstractmethod
+    async def get_copies_fingerprint(self, book_id: int, status: BookCopyStatus | None = None) -> str:
+        """The abstract getting a digest of ids and versions of a specific book copies.
+            Optionally filter by status.
+
+        Args:
+            book_id (int): The id of the book to compute the digest for.
+            status (BookCopyStatus | None): status of the copy e.g available.
+
+        Returns:
+            str: The digest, changing whenever a copy is added, removed or updated.
+        """
+
+    @abstractmethod
+    async def transition_copy(self, copy_id: int, transition: CopyTransition) -> BookCopy | None:
+        """The abstract changing the status of a copy, only if the transition applies to its current status.
+
+        Args:
+            copy_id (int): The id of the book copy.
+            transition (CopyTransition): The status change.
+
+        Returns:
+            BookCopy | None: The updated copy, None if it does not exist or the transition does not apply.
+        """
+
+    @abstractmethod
+    async def claim_available_copy(self, book_id: int, transition: CopyTransition) -> BookCopy | None:
+        """The abstract atomically claiming one copy of a book the transition applies to.
+            Concurrent callers never claim the same copy.
+
+        Args:
+            book_id (int): The id of the book.
+            transition (CopyTransition): The status change of the claimed copy e.g reserve.
+
+        Returns:
+            BookCopy | None: The claimed copy, None if no copy is available.
+        """
+
     @abstractmethod
     async def add_book_copy(self, data: BookCopyCreate) -> BookCopy | None:
         """The abstract adding new book copy to the data storage.
@@ -52,6 +101,30 @@ class IBookCopyRepository(ABC):
             BookCopy | None: The newly created book copy.
         """
 
+    @abstractmethod
+    async def add_book_copies(self, book_id: int, location: str | None, count: int) -> list[BookCopy]:
+        """The abstract adding many copies of a book to the data storage at once.
+
+        Args:
+            book_id (int): The id of the book.
+            location (str | None): The location of the copies.
+            count (int): Number of copies to create.
+
+        Returns:
+            list[BookCopy]: The newly created book copies.
+        """
+
+    @abstractmethod
+    async def add_copies(self, copies: list[BookCopyCreate]) -> int:
+        """The abstract adding many book copies, of any books, to the data storage at once.
+
+        Args:
+            copies (list[BookCopyCreate]): The attributes of the book copies.
+
+        Returns:
+            int: The number of created copies.
+        """
+
     @abstractmethod
     async def update_book_copy(self, copy_id: int, data: BookCopy) -> BookCopy | None:
         """The abstarct updating book copy  data in the data storage.
@@ -65,11 +138,13 @@ class IBookCopyRepository(ABC):
         """
 
     @abstractmethod
-    async def delete_book_copy(self, copy_id: int) -> bool:
+    async def delete_book_copy(self, copy_id: int, status: BookCopyStatus | None = None) -> bool:
         """The abstarct removing book copy from the data storage.
+            Optionally only if the copy has the given status.
 
         Args:
             copy_id (int): The boo copy id.
+            status (BookCopyStatus | None): The status the copy must have e.g available.
 
         Returns:
             bool: Success of the operation.
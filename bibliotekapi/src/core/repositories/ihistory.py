@@ -1,24 +1,72 @@
 """Module containing history repository implementation"""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
 from pydantic import UUID4
 
-from src.core.domain.history import HistoryCreate, History, HistoryStatus
+from src.core.domain.history import CheckoutResult, HistoryCreate, History, HistoryStatus, OverdueUser
+from src.core.domain.page import Page
 
 
 class IHistoryRepository(ABC):
     """An abstract class representing protocol of history repository."""
 
     @abstractmethod
-    async def get_all_history(self, status: HistoryStatus | None = None) -> list[History]:
-        """The abstract getting a all history from the data storage.
+    async def get_all_history(
+        self,
+        limit: int,
+        after: str | None = None,
+        status: HistoryStatus | None = None,
+    ) -> Page[History]:
+        """The abstract getting a page of history from the data storage.
             Optionally filter by status
         
         Args:
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
             status (HistoryStatus | None): History status.
         
         Returns:
-            list[History]: The collection of all history data.
+            Page[History]: The page of history data ordered by id.
+        """
+
+    @abstractmethod
+    def stream_history(self, status: HistoryStatus | None = None) -> AsyncIterator[History]:
+        """The abstract streaming all history from the data storage record by record.
+            Optionally filter by status.
+
+        Args:
+            status (HistoryStatus | None): History status.
+
+        Returns:
+            AsyncIterator[History]: The iterator over history data ordered by id.
+        """
+
+    @abstractmethod
+    async def get_overdue_history(self, now: datetime, limit: int, after: str | None = None) -> Page[History]:
+        """The abstract getting a page of loans past their due date from the data storage.
+
+        Args:
+            now (datetime): The time the due dates are compared against.
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[History]: The page of overdue loans, the longest overdue first.
+        """
+
+    @abstractmethod
+    async def get_overdue_users(self, now: datetime, limit: int, after: str | None = None) -> Page[OverdueUser]:
+        """The abstract getting a page of users with loans past their due date from the data storage.
+
+        Args:
+            now (datetime): The time the due dates are compared against.
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[OverdueUser]: The page of users with their overdue loans, ordered by user id.
         """
 
     @abstractmethod
@@ -66,6 +114,19 @@ class IHistoryRepository(ABC):
             History | None: The newly created history record.
         """
 
+    @abstractmethod
+    async def checkout(self, user_id: UUID4, copy_id: int) -> CheckoutResult:
+        """The abstract lending a copy to a user at once: the copy becomes borrowed,
+            the user's active reservation of it collected and a history record is added.
+
+        Args:
+            user_id (UUID4): The user id.
+            copy_id (int): The copy id.
+
+        Returns:
+            CheckoutResult: The new history record or the reason the copy can not be lent.
+        """
+
     @abstractmethod
     async def update_history(self, history_id: int, data: History) -> History | None:
         """The abstarct updating history data in the data storage.
@@ -0,0 +1,102 @@
+"""Module containing hold repository abstractions"""
+
+from abc import ABC, abstractmethod
+from pydantic import UUID4
+
+from src.core.domain.hold import Hold, HoldStatus
+
+
+class IHoldRepository(ABC):
+    """An abstract class representing protocol of hold repository."""
+
+    @abstractmethod
+    async def get_hold_by_id(self, hold_id: int) -> Hold | None:
+        """The abstract getting a hold from the data storage.
+
+        Args:
+            hold_id (int): The id of the hold.
+
+        Returns:
+            Hold | None: The hold data with its place in the queue if exists.
+        """
+
+    @abstractmethod
+    async def get_holds_by_user(self, user_id: UUID4, status: HoldStatus | None = None) -> list[Hold]:
+        """The abstract getting holds of a given user from the data storage.
+            Optionally filter by status.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            status (HoldStatus | None): The hold status.
+
+        Returns:
+            list[Hold]: The collection of holds with their places in the queues.
+        """
+
+    @abstractmethod
+    async def get_book_queue(self, book_id: int) -> list[Hold]:
+        """The abstract getting the waiting holds of a book in the queue order.
+
+        Args:
+            book_id (int): The id of the book.
+
+        Returns:
+            list[Hold]: The waiting holds with their places in the queue.
+        """
+
+    @abstractmethod
+    async def has_waiting_hold(self, book_id: int, user_id: UUID4) -> bool:
+        """The abstract checking whether a user is waiting in the queue of a book.
+
+        Args:
+            book_id (int): The id of the book.
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            bool: Whether the user has a waiting hold on the book.
+        """
+
+    @abstractmethod
+    async def lock_queue(self, book_id: int) -> None:
+        """The abstract taking the transaction lock of a book's queue.
+
+        Args:
+            book_id (int): The id of the book.
+        """
+
+    @abstractmethod
+    async def add_hold(self, data: Hold) -> Hold:
+        """The abstract adding new hold to the data storage.
+
+        Args:
+            data (Hold): The attributes of the hold.
+
+        Raises:
+            HoldAlreadyExist: If the user is already waiting for the book.
+
+        Returns:
+            Hold: The newly created hold.
+        """
+
+    @abstractmethod
+    async def cancel_hold(self, hold_id: int, user_id: UUID4) -> Hold | None:
+        """The abstract canceling a waiting hold of a given user.
+
+        Args:
+            hold_id (int): The id of the hold.
+            user_id (UUID4): The id of the user owning the hold.
+
+        Returns:
+            Hold | None: The canceled hold, None if no such waiting hold exists.
+        """
+
+    @abstractmethod
+    async def allocate_copy(self, copy_id: int) -> Hold | None:
+        """The abstract reserving a released, available copy for the next hold in its book queue.
+
+        Args:
+            copy_id (int): The id of the released copy.
+
+        Returns:
+            Hold | None: The fulfilled hold, None if nobody is waiting for the book.
+        """
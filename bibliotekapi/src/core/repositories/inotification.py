@@ -0,0 +1,68 @@
+"""Module containing notification repository abstractions"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.core.domain.notification import LoanNotice, NotificationKind
+from src.core.domain.page import Page
+
+
+class INotificationRepository(ABC):
+    """An abstract class representing protocol of notification repository."""
+
+    @abstractmethod
+    async def get_pending_notices(
+        self,
+        kind: NotificationKind,
+        due_from: datetime | None,
+        due_to: datetime,
+        limit: int,
+        after: str | None = None,
+    ) -> Page[LoanNotice]:
+        """The abstract getting a page of current loans due in a given range
+            that were not notified about with a given kind yet.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            due_from (datetime | None): The inclusive lower bound of the due date, if any.
+            due_to (datetime): The exclusive upper bound of the due date.
+            limit (int): Maximum number of loans on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[LoanNotice]: The page of loans ordered by due date.
+        """
+
+    @abstractmethod
+    async def claim_notices(self, kind: NotificationKind, history_ids: list[int], now: datetime) -> list[int]:
+        """The abstract inserting idempotency markers of notices about to be sent.
+            Loans already claimed (e.g. by a concurrent or an earlier run) are skipped.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            history_ids (list[int]): The ids of the loans.
+            now (datetime): The time of the claim.
+
+        Returns:
+            list[int]: The ids of the loans claimed by this call.
+        """
+
+    @abstractmethod
+    async def mark_sent(self, kind: NotificationKind, history_ids: list[int], now: datetime) -> None:
+        """The abstract marking claimed notices as sent.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            history_ids (list[int]): The ids of the loans.
+            now (datetime): The time of sending.
+        """
+
+    @abstractmethod
+    async def release_notices(self, kind: NotificationKind, history_ids: list[int]) -> None:
+        """The abstract removing markers of claimed notices that failed to be sent,
+            so the next run retries them.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            history_ids (list[int]): The ids of the loans.
+        """
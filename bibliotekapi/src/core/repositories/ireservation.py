@@ -1,20 +1,43 @@
 """Module containing reservation repository implementation"""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pydantic import UUID4
 
-from src.core.domain.reservation import ReservationCreate, Reservation, ReservationStatus
+from src.core.domain.reservation import ReservationCreate, Reservation, ReservationOrder, ReservationStatus
+from src.core.domain.page import Page
 
 
 class IReservationRepository(ABC):
     """An abstract class representing protocol of reservation repository."""
 
     @abstractmethod
-    async def get_all_reservations(self) -> list[Reservation]:
-        """The abstract getting a all reservations from the data storage.
-        
+    async def get_all_reservations(
+        self,
+        limit: int,
+        after: str | None = None,
+        status: ReservationStatus | None = None,
+        reserved_from: datetime | None = None,
+        reserved_to: datetime | None = None,
+        expires_before: datetime | None = None,
+        order: ReservationOrder = ReservationOrder.reservation_id,
+        descending: bool = False,
+    ) -> Page[Reservation]:
+        """The abstract getting a page of reservations from the data storage.
+            Optionally filter by status and dates.
+
+        Args:
+            limit (int): Maximum number of reservations on the page.
+            after (str | None): The cursor of the previous page.
+            status (ReservationStatus | None): The reservation status.
+            reserved_from (datetime | None): The earliest reservation date.
+            reserved_to (datetime | None): The latest reservation date.
+            expires_before (datetime | None): The latest expiration date.
+            order (ReservationOrder): The sort key of the page.
+            descending (bool): Whether to sort in descending order.
+
         Returns:
-            list[Reservation]: The collection of reservations data.
+            Page[Reservation]: The page of reservations data.
         """
 
     @abstractmethod
@@ -76,6 +99,30 @@ class IReservationRepository(ABC):
             Reservation | None: The updated reservation record.
         """
 
+    @abstractmethod
+    async def cancel_and_release(self, reservation_id: int) -> Reservation | None:
+        """The abstract canceling an active reservation and releasing its reserved copy at once.
+
+        Args:
+            reservation_id (int): The reservation id.
+
+        Returns:
+            Reservation | None: The canceled reservation, None if no such active reservation exists.
+        """
+
+    @abstractmethod
+    async def expire_reservations(self, now: datetime, limit: int) -> tuple[int, list[int]]:
+        """The abstract canceling a batch of active reservations expired before the given time
+            and releasing their reserved copies.
+
+        Args:
+            now (datetime): The time the reservations are compared against.
+            limit (int): Maximum number of reservations in the batch.
+
+        Returns:
+            tuple[int, list[int]]: The number of canceled reservations and the ids of the released copies.
+        """
+
     @abstractmethod
     async def delete_reservation(self, reservation_id: int) -> bool:
        """The abstarct removing reservation from the data storage.
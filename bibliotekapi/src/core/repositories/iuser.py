@@ -4,17 +4,22 @@ from abc import ABC, abstractmethod
 from pydantic import UUID4
 
 from src.core.domain.user import User, UserCreate
+from src.core.domain.page import Page
 
 
 class IUserRepository(ABC):
     """An abstarct repository class for user."""
 
     @abstractmethod
-    async def get_all_users(self) -> list[User]:
-       """The abstract getting all users from the data storage.
+    async def get_all_users(self, limit: int, after: str | None = None) -> Page[User]:
+       """The abstract getting a page of users from the data storage.
+
+        Args:
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
         
         Returns:
-            list[User]: The collection of the all users.
+            Page[User]: The page of users ordered by id.
         """
 
     @abstractmethod
@@ -28,6 +33,17 @@ class IUserRepository(ABC):
             User | None: The user data if exists.
         """
 
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: list[UUID4]) -> list[User]:
+        """The abstract getting many users from the data storage at once.
+
+        Args:
+            user_ids (list[UUID4]): The ids of the users.
+
+        Returns:
+            list[User]: The existing users, in no particular order.
+        """
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> User | None:
         """The abstract getting a user by email from the data storage.
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import uuid
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from typing import List
 from enum import Enum as sEnum
 
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import ForeignKey, String, Enum, ARRAY
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, AsyncAttrs, create_async_engine
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR, ARRAY
+from sqlalchemy import DDL, BigInteger, ForeignKey, String, Enum, Computed, Index, event, func, literal_column, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, AsyncAttrs, create_async_engine
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -18,6 +19,7 @@ from sqlalchemy.orm import (
     relationship,
 )
 from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.exc import OperationalError, DatabaseError
 from asyncpg.exceptions import CannotConnectNowError, ConnectionDoesNotExistError
 
@@ -37,6 +39,15 @@ class ReservationStatus(sEnum):
     canceled = "canceled"
     collected = "collected"
 
+class HoldStatus(sEnum):
+    waiting = "waiting"
+    fulfilled = "fulfilled"
+    canceled = "canceled"
+
+class NotificationKind(sEnum):
+    due_soon = "due_soon"
+    overdue = "overdue"
+
 class UserRole(sEnum):
     user = "user"
     librarian = "librarian"
@@ -44,6 +55,41 @@ class UserRole(sEnum):
 class Base(AsyncAttrs, DeclarativeBase):
     pass
 
+# Database objects created ahead of the tables by `init_db`, one statement each.
+DB_PREREQUISITES = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    # Case and diacritics insensitive text used by the trigram (fuzzy) indexes,
+    # e.g. "Łódź" -> "lodz". unaccent() itself is only STABLE, hence the wrappers.
+    """
+    CREATE OR REPLACE FUNCTION normalize_text(value text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS $$
+        SELECT public.unaccent('public.unaccent'::regdictionary, lower(value))
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION book_authors_text(authors text[]) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS $$
+        SELECT normalize_text(array_to_string(authors, ' '))
+    $$
+    """,
+    # Weighted full-text document of a book (title > authors > subject > description).
+    # Declared IMMUTABLE so it can back the generated `book.search_vector` column.
+    """
+    CREATE OR REPLACE FUNCTION book_search_document(
+        title text, authors text[], subject text[], description text
+    ) RETURNS tsvector
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(array_to_string(authors, ' '), '')), 'B')
+            || setweight(to_tsvector('simple', coalesce(array_to_string(subject, ' '), '')), 'C')
+            || setweight(to_tsvector('simple', coalesce(description, '')), 'D')
+    $$
+    """,
+)
+for statement in DB_PREREQUISITES:
+    event.listen(Base.metadata, "before_create", DDL(statement))
+
 class Book(Base):
     __tablename__ = "book"
 
@@ -56,9 +102,42 @@ class Book(Base):
     publisher: Mapped[str | None] 
     publication_year: Mapped[int | None]
     language: Mapped[str] = mapped_column(default="pl", nullable=False)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("book_search_document(title, authors, subject, description)", persisted=True),
+        deferred=True,
+    )
+    # Copies counters as of the last fold of `book_copy_counter_delta`, the current
+    # numbers are these plus the book's pending deltas. Never set them from the application.
+    total_copies: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    available_copies: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    # Bumped on every UPDATE, used as the strong ETag of the book.
+    version: Mapped[int] = mapped_column(
+        default=1, server_default="1", onupdate=literal_column("version + 1"), nullable=False
+    )
 
     copies: Mapped[List[BookCopy]] = relationship("BookCopy", back_populates="book", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_book_search_vector", search_vector, postgresql_using="gin"),
+        Index("ix_book_authors", authors, postgresql_using="gin"),
+        Index("ix_book_subject", subject, postgresql_using="gin"),
+        Index(
+            "ix_book_title_trgm",
+            func.normalize_text(title).label("title_trgm"),
+            postgresql_using="gin",
+            postgresql_ops={"title_trgm": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_book_authors_trgm",
+            func.book_authors_text(authors).label("authors_trgm"),
+            postgresql_using="gin",
+            postgresql_ops={"authors_trgm": "gin_trgm_ops"},
+        ),
+    )
+    # Read the bumped version back (RETURNING) instead of lazy loading it later.
+    __mapper_args__ = {"eager_defaults": True}
+
 class BookCopy(Base):
     __tablename__ = "book_copy"
 
@@ -66,11 +145,102 @@ class BookCopy(Base):
     book_id: Mapped[int] = mapped_column(ForeignKey("book.book_id"))
     status: Mapped[BookCopyStatus] = mapped_column(Enum(BookCopyStatus), default=BookCopyStatus.available, nullable=False)
     location: Mapped[str | None]
+    # Bumped on every UPDATE (e.g. status change), part of the book copies ETag.
+    version: Mapped[int] = mapped_column(
+        default=1, server_default="1", onupdate=literal_column("version + 1"), nullable=False
+    )
 
     book: Mapped[Book] = relationship("Book", back_populates="copies")
     histories: Mapped[List[History]] = relationship("History", back_populates="copy")
     reservations: Mapped[List[Reservation]] = relationship("Reservation", back_populates="copy")
 
+    __table_args__ = (
+        Index("ix_book_copy_book_id_status", book_id, status),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+class BookCopyCounterDelta(Base):
+    __tablename__ = "book_copy_counter_delta"
+
+    # Appended by the `book_copy_counters` trigger instead of updating the (hot) book row,
+    # summed on read and folded into `book` in the background.
+    delta_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    book_id: Mapped[int] = mapped_column(ForeignKey("book.book_id", ondelete="CASCADE"))
+    total: Mapped[int] = mapped_column(nullable=False)
+    available: Mapped[int] = mapped_column(nullable=False)
+
+    __table_args__ = (
+        Index("ix_book_copy_counter_delta_book_id", book_id),
+    )
+
+# Records the change of `book` copies counters of every statement on `book_copy`
+# (bulk inserts add one row per book). Only inserts, so concurrent circulation
+# of the same title never waits on a shared row.
+COPY_COUNTERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION book_copy_counters() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO book_copy_counter_delta (book_id, total, available)
+        SELECT book_id, count(*), count(*) FILTER (WHERE status = 'available')
+        FROM new_copies GROUP BY book_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO book_copy_counter_delta (book_id, total, available)
+        SELECT book_id, -count(*), -count(*) FILTER (WHERE status = 'available')
+        FROM old_copies GROUP BY book_id;
+    ELSE
+        INSERT INTO book_copy_counter_delta (book_id, total, available)
+        SELECT book_id, sum(total), sum(available)
+        FROM (
+            SELECT book_id, 1 AS total, (status = 'available')::int AS available FROM new_copies
+            UNION ALL
+            SELECT book_id, -1, -(status = 'available')::int FROM old_copies
+        ) AS changes
+        GROUP BY book_id
+        HAVING sum(total) <> 0 OR sum(available) <> 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+COPY_COUNTERS_TRIGGERS = {
+    "book_copy_counters_insert": """
+    CREATE TRIGGER book_copy_counters_insert AFTER INSERT ON book_copy
+    REFERENCING NEW TABLE AS new_copies
+    FOR EACH STATEMENT EXECUTE FUNCTION book_copy_counters()
+    """,
+    "book_copy_counters_update": """
+    CREATE TRIGGER book_copy_counters_update AFTER UPDATE ON book_copy
+    REFERENCING OLD TABLE AS old_copies NEW TABLE AS new_copies
+    FOR EACH STATEMENT EXECUTE FUNCTION book_copy_counters()
+    """,
+    "book_copy_counters_delete": """
+    CREATE TRIGGER book_copy_counters_delete AFTER DELETE ON book_copy
+    REFERENCING OLD TABLE AS old_copies
+    FOR EACH STATEMENT EXECUTE FUNCTION book_copy_counters()
+    """,
+}
+# Run by `init_db` when the triggers are missing (a new database or one created
+# before the counters), after they are created. Creating a trigger locks out writes
+# to `book_copy` until commit, so the recount can not miss a concurrent change.
+COPY_COUNTERS_BACKFILL = (
+    "ALTER TABLE book ADD COLUMN IF NOT EXISTS total_copies integer NOT NULL DEFAULT 0",
+    "ALTER TABLE book ADD COLUMN IF NOT EXISTS available_copies integer NOT NULL DEFAULT 0",
+    "DELETE FROM book_copy_counter_delta",
+    """
+    UPDATE book SET
+        total_copies = actual.total,
+        available_copies = actual.available
+    FROM (
+        SELECT book.book_id, count(book_copy.copy_id) AS total,
+            count(book_copy.copy_id) FILTER (WHERE book_copy.status = 'available') AS available
+        FROM book LEFT JOIN book_copy ON book_copy.book_id = book.book_id
+        GROUP BY book.book_id
+    ) AS actual
+    WHERE book.book_id = actual.book_id
+    """,
+)
+
 class History(Base):
     __tablename__ = "history"
 
@@ -85,6 +255,16 @@ class History(Base):
     copy: Mapped[BookCopy] = relationship("BookCopy", back_populates="histories")
     user: Mapped[User] = relationship("User", back_populates="histories")
 
+    __table_args__ = (
+        # Only current loans can be overdue, the returned ones (the bulk of the table) are left out.
+        Index(
+            "ix_history_borrowed_due_date",
+            due_date,
+            history_id,
+            postgresql_where=status == HistoryStatus.borrowed,
+        ),
+    )
+
 class Reservation(Base):
     __tablename__ = "reservation"
 
@@ -98,6 +278,84 @@ class Reservation(Base):
     copy: Mapped[BookCopy] = relationship("BookCopy", back_populates="reservations")
     user: Mapped[User] = relationship("User", back_populates="reservations")
 
+    __table_args__ = (
+        # Reservation lists filtered by status, ordered and paginated by date (then id).
+        Index("ix_reservation_status_reservation_date", status, reservation_date, reservation_id),
+        # Only active reservations can expire, the sweeper scans just these.
+        Index(
+            "ix_reservation_active_expiration_date",
+            expiration_date,
+            postgresql_where=status == ReservationStatus.active,
+        ),
+    )
+
+class Hold(Base):
+    __tablename__ = "hold"
+
+    # Ascending ids give the first come, first served order of a book's queue.
+    hold_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    book_id: Mapped[int] = mapped_column(ForeignKey("book.book_id", ondelete="CASCADE"))
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.user_id", ondelete="CASCADE"))
+    created_at: Mapped[datetime] = mapped_column(default=lambda:datetime.now(), nullable=False)
+    status: Mapped[HoldStatus] = mapped_column(Enum(HoldStatus), default=HoldStatus.waiting, nullable=False)
+    reservation_id: Mapped[int | None] = mapped_column(ForeignKey("reservation.reservation_id", ondelete="SET NULL"))
+    # The number of a waiting hold in its book's queue: numbers grow with the queue,
+    # have no gaps from its head on and the place of a hold is its number less the head's plus one.
+    queue_seq: Mapped[int | None]
+
+    __table_args__ = (
+        # The queue of a book: next in line and the place of a hold are index range scans.
+        Index(
+            "ix_hold_waiting_book_id_hold_id",
+            book_id,
+            hold_id,
+            postgresql_where=status == HoldStatus.waiting,
+        ),
+        Index(
+            "uq_hold_waiting_book_id_user_id",
+            book_id,
+            user_id,
+            unique=True,
+            postgresql_where=status == HoldStatus.waiting,
+        ),
+        Index("ix_hold_user_id", user_id),
+    )
+
+HOLD_QUEUE_BACKFILL = (
+    "ALTER TABLE hold ADD COLUMN IF NOT EXISTS queue_seq integer",
+    """
+    UPDATE hold SET queue_seq = numbered.queue_seq
+    FROM (
+        SELECT hold_id, row_number() OVER (PARTITION BY book_id ORDER BY hold_id) AS queue_seq
+        FROM hold WHERE status = 'waiting'
+    ) AS numbered
+    WHERE hold.hold_id = numbered.hold_id
+    """,
+)
+
+# Columns added to tables that `create_all` skips when they already exist.
+SCHEMA_UPGRADE_COLUMNS = (
+    "ALTER TABLE book ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1",
+    "ALTER TABLE book_copy ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1",
+    "ALTER TABLE book ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (book_search_document(title, authors, subject, description)) STORED",
+)
+
+class Notification(Base):
+    __tablename__ = "notification"
+
+    # A row is the idempotency marker of a notice, inserted before it is sent.
+    notification_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    history_id: Mapped[int] = mapped_column(ForeignKey("history.history_id", ondelete="CASCADE"))
+    kind: Mapped[NotificationKind] = mapped_column(Enum(NotificationKind), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=lambda:datetime.now(), nullable=False)
+    sent_at: Mapped[datetime | None]
+
+    __table_args__ = (
+        # At most one notice of a kind per loan, also backing the "not yet notified" anti-join.
+        Index("uq_notification_history_id_kind", history_id, kind, unique=True),
+    )
+
 class User(Base):
     __tablename__ = "user"
 
@@ -124,6 +382,84 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only sessions go to the replica when one is configured, to the primary otherwise.
+if config.DB_REPLICA_HOST:
+    replica_db_url = (
+        f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+        f"@{config.DB_REPLICA_HOST}/{config.DB_NAME}"
+        )
+    replica_engine = create_async_engine(replica_db_url, echo=True, pool_pre_ping=True,)
+else:
+    replica_engine = engine
+async_replica_session_factory = async_sessionmaker(
+    replica_engine,
+    expire_on_commit=False,
+)
+
+# Set for requests of clients that wrote recently, their reads skip the replica.
+read_your_writes: ContextVar[bool] = ContextVar("read_your_writes", default=False)
+
+async def install_copy_counters(conn: AsyncConnection) -> None:
+    """Function installing the copies counters idempotently.
+        The trigger function is always replaced. The counter columns and the triggers
+        are added, and the counters recounted, only if the triggers are missing, so
+        databases created before the counters get them on the next start.
+
+    Args:
+        conn (AsyncConnection): The connection, in the transaction creating the schema.
+    """
+    # Application instances starting together install the counters one at a time.
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('book_copy_counters'))"))
+    installed = set((await conn.scalars(
+        text(
+            "SELECT tgname FROM pg_trigger "
+            "WHERE tgrelid = 'book_copy'::regclass AND NOT tgisinternal"
+        )
+    )).all())
+    await conn.execute(DDL(COPY_COUNTERS_FUNCTION))
+    if installed.issuperset(COPY_COUNTERS_TRIGGERS):
+        return
+    for name, statement in COPY_COUNTERS_TRIGGERS.items():
+        await conn.execute(DDL(f"DROP TRIGGER IF EXISTS {name} ON book_copy"))
+        await conn.execute(DDL(statement))
+    for statement in COPY_COUNTERS_BACKFILL:
+        await conn.execute(DDL(statement))
+
+async def install_hold_queue(conn: AsyncConnection) -> None:
+    """Function numbering the hold queues idempotently.
+        Databases created before the queue numbers get the column, and their
+        waiting holds numbered in the order they were placed, on the next start.
+
+    Args:
+        conn (AsyncConnection): The connection, in the transaction creating the schema.
+    """
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('hold_queue_seq'))"))
+    numbered = await conn.scalar(
+        text(
+            "SELECT EXISTS (SELECT FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = 'hold' AND column_name = 'queue_seq')"
+        )
+    )
+    if numbered:
+        return
+    for statement in HOLD_QUEUE_BACKFILL:
+        await conn.execute(DDL(statement))
+
+async def upgrade_schema(conn: AsyncConnection) -> None:
+    """Function upgrading an existing schema idempotently.
+        `create_all` skips the tables that exist together with their indexes, so
+        databases created before a column or an index was declared get them here.
+
+    Args:
+        conn (AsyncConnection): The connection, in the transaction creating the schema.
+    """
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('schema_upgrade'))"))
+    for statement in SCHEMA_UPGRADE_COLUMNS:
+        await conn.execute(DDL(statement))
+    for table in Base.metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            await conn.execute(CreateIndex(index, if_not_exists=True))
+
 async def init_db(retries: int = 5, delay: int = 5) -> None:
     """Function initializing the DB.
 
@@ -136,6 +472,9 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
         try:
             async with engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
+                await install_copy_counters(conn)
+                await install_hold_queue(conn)
+                await upgrade_schema(conn)
             return
         except(
             OperationalError,
@@ -0,0 +1,34 @@
+"""A module containing hold DTO model."""
+
+from pydantic import UUID4, BaseModel, ConfigDict
+from datetime import datetime
+
+from src.core.domain.hold import HoldStatus
+
+
+class HoldDTO(BaseModel):
+    """A DTO model for hold record."""
+    hold_id: int
+    book_id: int
+    user_id: UUID4
+    created_at: datetime
+    status: HoldStatus
+    reservation_id: int | None
+    position: int | None
+
+    @classmethod
+    def from_domain(cls, hold):
+        return cls(
+            hold_id=hold.hold_id,
+            book_id=hold.book_id,
+            user_id=hold.user_id,
+            created_at=hold.created_at,
+            status=hold.status,
+            reservation_id=hold.reservation_id,
+            position=hold.position
+        )
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
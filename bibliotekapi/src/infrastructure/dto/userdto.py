@@ -13,6 +13,17 @@ class UserDTO(BaseModel):
     membership_number: str | None = None
     role: UserRole = UserRole.user
 
+    @classmethod
+    def from_domain(cls, user):
+        """Method building the DTO from an already validated domain user, skipping re-validation."""
+        return cls.model_construct(
+            user_id=user.user_id,
+            username=user.username,
+            email=user.email,
+            membership_number=None,
+            role=user.role,
+        )
+
     model_config = ConfigDict(
         from_attributes=True,
         extra="ignore",
@@ -1,11 +1,26 @@
 """Module containing book repository implementation"""
 
-from sqlalchemy import select, update, delete
+import re
+
+from sqlalchemy import Row, Select, select, insert, update, delete, func, or_, true, tuple_, any_, literal, Integer, String, REAL
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.core.repositories.ibook import IBookRepository
-from src.core.domain.book import Book as BookDomain, BookCreate
-from src.db import Book as BookORM
+from src.core.domain.book import Book as BookDomain, BookAvailability, BookCreate, BookFacets, BookField, BookSummary, CounterMismatch, FacetCount, MatchMode
+from src.core.domain.book_copy import BookCopyStatus
+from src.core.domain.page import Page
+from src.core.exceptions.exceptions import InvalidBookData, ISBNAlreadyExist
+from src.db import Book as BookORM, BookCopy as BookCopyORM, BookCopyCounterDelta as CounterDeltaORM
+from src.infrastructure.utils.pagination import paginate
+
+# Taken by the counters fold, concurrent folds of overlapping books could deadlock.
+COUNTER_FOLD_LOCK_KEY = 1_012
+# The name PostgreSQL gives the unique constraint of `book.isbn`.
+ISBN_CONSTRAINT = "book_isbn_key"
+UNIQUE_VIOLATION = "23505"
 
 class BookRepository(IBookRepository):
     """A class implementing the book repository."""
@@ -13,15 +28,32 @@ class BookRepository(IBookRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
     
-    async def get_all_books(self) -> list[BookDomain]:
-        """The method getting all books from the data storage.
+    async def get_all_books(
+        self, limit: int, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[BookDomain | BookSummary]:
+        """The method getting a page of books from the data storage.
+
+        Args:
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[BookDomain]: The collection of the all books.
+            Page[BookDomain]: The page of books ordered by id.
         """
-        stmt = select(BookORM)
-        books = (await self._session.scalars(stmt)).all()
-        return [BookDomain.model_validate(book) for book in books] 
+        stmt = self._select_books(fields)
+        if with_availability:
+            stmt = self._with_availability(stmt)
+        return await paginate(
+            self._session,
+            stmt,
+            keys=[BookORM.book_id],
+            limit=limit,
+            after=after,
+            to_item=lambda row: self._to_book(row, with_availability, fields),
+        )
 
     async def get_book_by_id(self, book_id: int) -> BookDomain | None:
         """The method getting a book from the data storage.
@@ -35,6 +67,31 @@ class BookRepository(IBookRepository):
         book = await self._get_by_id(book_id)
         return BookDomain.model_validate(book) if  book else None
 
+    async def get_books_by_ids(self, book_ids: list[int]) -> list[BookDomain]:
+        """The method getting many books from the data storage at once.
+
+        Args:
+            book_ids (list[int]): The ids of the books.
+
+        Returns:
+            list[BookDomain]: The existing books, in no particular order.
+        """
+        stmt = select(BookORM).where(BookORM.book_id == any_(literal(book_ids, ARRAY(Integer))))
+        books = (await self._session.scalars(stmt)).all()
+        return [BookDomain.model_validate(book) for book in books]
+
+    async def get_book_version(self, book_id: int) -> int | None:
+        """The method getting the current version of a book from the data storage.
+
+        Args:
+            book_id (int): The id of the book.
+
+        Returns:
+            int | None: The version of the book if exists.
+        """
+        stmt = select(BookORM.version).where(BookORM.book_id == book_id)
+        return await self._session.scalar(stmt)
+
     async def get_book_by_title(self, title: str) -> list[BookDomain]:
         """The method getting book by the title from the data storage.
         
@@ -57,10 +114,72 @@ class BookRepository(IBookRepository):
         Returns:
             list[Book]: The collection of the all books written  by this author
         """
-        stmt = select(BookORM).where(BookORM.authors.any(author))
+        stmt = select(BookORM).where(BookORM.authors.contains([author]))
         books = (await self._session.scalars(stmt)).all()
         return [BookDomain.model_validate(book) for book in books]
 
+    async def fuzzy_search_by_title(self, title: str, limit: int) -> list[BookDomain]:
+        """The method getting books with a title similar to the given one from the data storage.
+            Uses trigram word similarity over the normalized title (GIN `ix_book_title_trgm`).
+
+        Args:
+            title (str): The (possibly misspelled or partial) title of the book.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[BookDomain]: The collection of similar books, most similar first.
+        """
+        return await self._fuzzy_search(func.normalize_text(BookORM.title), title, limit)
+
+    async def fuzzy_search_by_author(self, author: str, limit: int) -> list[BookDomain]:
+        """The method getting books with an author similar to the given one from the data storage.
+            Uses trigram word similarity over the normalized authors (GIN `ix_book_authors_trgm`).
+
+        Args:
+            author (str): The (possibly misspelled or partial) author name.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[BookDomain]: The collection of books by similar authors, most similar first.
+        """
+        return await self._fuzzy_search(func.book_authors_text(BookORM.authors), author, limit)
+
+    async def search_books(
+        self, query: str, limit: int, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[BookDomain | BookSummary]:
+        """The method full-text searching books in the data storage.
+            Every word of the query must match a word prefix in title, authors,
+            subject or description. Uses the GIN index on `search_vector`.
+
+        Args:
+            query (str): The search phrase.
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
+
+        Returns:
+            Page[BookDomain]: The page of matching books, best ranked first.
+        """
+        words = re.findall(r"\w+", query)
+        if not words:
+            return Page(items=[], next_cursor=None)
+        tsquery = func.to_tsquery("simple", " & ".join(f"{word}:*" for word in words))
+        rank = func.ts_rank(BookORM.search_vector, tsquery, type_=REAL)
+        stmt = self._select_books(fields).where(BookORM.search_vector.bool_op("@@")(tsquery))
+        if with_availability:
+            stmt = self._with_availability(stmt)
+        return await paginate(
+            self._session,
+            stmt,
+            keys=[rank, BookORM.book_id],
+            limit=limit,
+            after=after,
+            to_item=lambda row: self._to_book(row, with_availability, fields),
+            descending=True,
+        )
+
     async def get_book_by_isbn(self, isbn: str) -> BookDomain | None:
         """The method getting book by isbn from the data storage.
         
@@ -75,45 +194,106 @@ class BookRepository(IBookRepository):
         return BookDomain.model_validate(book) if book else None 
     
     async def filter_books(
-        self, 
-        author: str | None = None,
-        subject: str | None = None,
+        self,
+        limit: int,
+        after: str | None = None,
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
         publisher: str | None = None,
         publication_year: int | None = None,
         language: str | None = None,
-    ) -> list[BookDomain]:
+        match: MatchMode = MatchMode.all,
+        with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[BookDomain | BookSummary]:
         """The method getting filtered books by chosen parameter
         
         Args:
-            author: str | None = None,
-            subject: str | None = None,
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
             publisher: str | None = None,
             publication_year: int | None = None,
             language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[BookDomain]: The collection of the all books which match the parameters.
+            Page[BookDomain]: The page of books which match the parameters, ordered by id.
         """
-        stmt = select(BookORM)
-        conditions = []
+        stmt = self._select_books(fields)
+        conditions = self._filter_conditions(author, subject, publisher, publication_year, language, match)
 
-        if author:
-            conditions.append(BookORM.authors.any(author))
-        if subject:
-            conditions.append(BookORM.subject.any(subject))
-        if publisher:
-            conditions.append(BookORM.publisher == publisher)
-        if publication_year:
-            conditions.append(BookORM.publication_year == publication_year)
-        if language:
-            conditions.append(BookORM.language == language)
+        if conditions:
+            stmt = stmt.where(*conditions)
+        if with_availability:
+            stmt = self._with_availability(stmt)
 
+        return await paginate(
+            self._session,
+            stmt,
+            keys=[BookORM.book_id],
+            limit=limit,
+            after=after,
+            to_item=lambda row: self._to_book(row, with_availability, fields),
+        )
+
+    async def get_facets(
+        self, 
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
+        publisher: str | None = None,
+        publication_year: int | None = None,
+        language: str | None = None,
+        match: MatchMode = MatchMode.all,
+    ) -> BookFacets:
+        """The method counting books per facet value for the chosen filters.
+            Facets are subject, language, publisher and publication year.
+        
+        Args:
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
+            publisher: str | None = None,
+            publication_year: int | None = None,
+            language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+        
+        Returns:
+            BookFacets: The book counts per value of every facet, most frequent first.
+        """
+        subjects = func.unnest(BookORM.subject).table_valued("value").render_derived(name="subjects")
+        facet_columns = {
+            "subject": subjects.c.value,
+            "language": BookORM.language,
+            "publisher": BookORM.publisher,
+            "publication_year": BookORM.publication_year,
+        }
+        stmt = (
+            select(
+                *facet_columns.values(),
+                *[func.grouping(column) for column in facet_columns.values()],
+                func.count(BookORM.book_id.distinct()),
+            )
+            .select_from(BookORM)
+            .outerjoin(subjects, true())
+            .group_by(func.grouping_sets(*[tuple_(column) for column in facet_columns.values()]))
+        )
+        conditions = self._filter_conditions(author, subject, publisher, publication_year, language, match)
         if conditions:
             stmt = stmt.where(*conditions)
 
-        result = await self._session.scalars(stmt)
-        books = result.all()
-        return [BookDomain.model_validate(book) for book in books]
+        facets = BookFacets()
+        names = list(facet_columns)
+        for row in await self._session.execute(stmt):
+            values, grouped, count = row[:len(names)], row[len(names):-1], row[-1]
+            # GROUPING() is 0 only for the column the row is grouped by.
+            index = grouped.index(0)
+            getattr(facets, names[index]).append(FacetCount(value=values[index], count=count))
+        for name in names:
+            getattr(facets, name).sort(key=lambda facet: facet.count, reverse=True)
+        return facets
 
     async def add_book(self, data: BookCreate, copies_count: int = 1) -> BookDomain | None:
         """The method adding new book to the data storage.
@@ -131,6 +311,162 @@ class BookRepository(IBookRepository):
         return BookDomain.model_validate(new_book)  if new_book else None
             
 
+    async def add_books(self, books: list[BookCreate]) -> list[int]:
+        """The method adding many books to the data storage at once
+            with multi-row INSERT ... RETURNING statements.
+
+        Args:
+            books (list[BookCreate]): The attributes of the books.
+
+        Raises:
+            ISBNAlreadyExist: If one of the ISBNs was inserted in the meantime.
+            InvalidBookData: If the database rejected one of the books for another reason.
+
+        Returns:
+            list[int]: The ids of the newly created books, in the order of `books`.
+        """
+        if not books:
+            return []
+        stmt = insert(BookORM).returning(BookORM.book_id, sort_by_parameter_order=True)
+        try:
+            book_ids = await self._session.scalars(stmt, [book.model_dump() for book in books])
+        except IntegrityError as e:
+            if self._is_isbn_violation(e):
+                raise ISBNAlreadyExist() from e
+            raise InvalidBookData(self._error_reason(e)) from e
+        except DBAPIError as e:
+            raise InvalidBookData(self._error_reason(e)) from e
+        return list(book_ids)
+
+    async def get_existing_isbns(self, isbns: list[str]) -> set[str]:
+        """The method checking which of the ISBNs are already in the data storage.
+
+        Args:
+            isbns (list[str]): The ISBNs to check.
+
+        Returns:
+            set[str]: The ISBNs that already exist.
+        """
+        if not isbns:
+            return set()
+        stmt = select(BookORM.isbn).where(BookORM.isbn == any_(literal(isbns, ARRAY(String))))
+        return set((await self._session.scalars(stmt)).all())
+
+    async def find_counter_mismatches(self) -> list[CounterMismatch]:
+        """The method comparing the books copies counters with their copies in the data storage.
+
+        Returns:
+            list[CounterMismatch]: The books whose counters are wrong.
+        """
+        actual = (
+            select(
+                BookCopyORM.book_id,
+                func.count(BookCopyORM.copy_id).label("total_copies"),
+                func.count(BookCopyORM.copy_id)
+                .filter(BookCopyORM.status == BookCopyStatus.available)
+                .label("available_copies"),
+            )
+            .group_by(BookCopyORM.book_id)
+            .subquery("actual")
+        )
+        actual_total = func.coalesce(actual.c.total_copies, 0)
+        actual_available = func.coalesce(actual.c.available_copies, 0)
+        total_copies, available_copies = self._copy_counters()
+        stmt = (
+            select(
+                BookORM.book_id,
+                total_copies.label("total_copies"),
+                available_copies.label("available_copies"),
+                actual_total.label("actual_total_copies"),
+                actual_available.label("actual_available_copies"),
+            )
+            .outerjoin(actual, actual.c.book_id == BookORM.book_id)
+            .where(or_(total_copies != actual_total, available_copies != actual_available))
+            .order_by(BookORM.book_id)
+        )
+        rows = (await self._session.execute(stmt)).mappings().all()
+        return [CounterMismatch.model_validate(dict(row)) for row in rows]
+
+    async def reset_counters(self, mismatches: list[CounterMismatch]) -> None:
+        """The method overwriting the books copies counters with the actual numbers.
+            The copies are recounted and the pending deltas dropped in a single
+            statement, so both see the same snapshot and changes committed
+            in the meantime are kept in their deltas.
+
+        Args:
+            mismatches (list[CounterMismatch]): The books with wrong counters.
+        """
+        if not mismatches:
+            return
+        book_ids = literal([mismatch.book_id for mismatch in mismatches], ARRAY(Integer))
+        pending = (
+            delete(CounterDeltaORM)
+            .where(CounterDeltaORM.book_id == any_(book_ids))
+            .cte("pending")
+        )
+        copies = select(func.count(BookCopyORM.copy_id)).where(BookCopyORM.book_id == BookORM.book_id)
+        stmt = (
+            update(BookORM)
+            .where(BookORM.book_id == any_(book_ids))
+            .values(
+                total_copies=copies.scalar_subquery(),
+                available_copies=copies.where(BookCopyORM.status == BookCopyStatus.available).scalar_subquery(),
+                # counters are not part of the book representation, keep its ETag
+                version=BookORM.version,
+            )
+            .add_cte(pending)
+        )
+        await self._session.execute(stmt)
+
+    async def fold_copy_counters(self, limit: int) -> int:
+        """The method adding the oldest pending copies counters deltas to their books
+            and removing them, in a single statement. Skipped when another fold is running.
+
+        Args:
+            limit (int): Maximum number of deltas to fold.
+
+        Returns:
+            int: The number of folded deltas.
+        """
+        if not await self._session.scalar(select(func.pg_try_advisory_xact_lock(COUNTER_FOLD_LOCK_KEY))):
+            return 0
+        batch = (
+            select(CounterDeltaORM.delta_id)
+            .order_by(CounterDeltaORM.delta_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        moved = (
+            delete(CounterDeltaORM)
+            .where(CounterDeltaORM.delta_id.in_(select(batch.c.delta_id)))
+            .returning(CounterDeltaORM.book_id, CounterDeltaORM.total, CounterDeltaORM.available)
+            .cte("moved")
+        )
+        summed = (
+            select(
+                moved.c.book_id,
+                func.sum(moved.c.total).label("total"),
+                func.sum(moved.c.available).label("available"),
+            )
+            .group_by(moved.c.book_id)
+            .cte("summed")
+        )
+        folded = (
+            update(BookORM)
+            .where(BookORM.book_id == summed.c.book_id)
+            .values(
+                total_copies=BookORM.total_copies + summed.c.total,
+                available_copies=BookORM.available_copies + summed.c.available,
+                # counters are not part of the book representation, keep its ETag
+                version=BookORM.version,
+            )
+            .returning(BookORM.book_id)
+            .cte("folded")
+        )
+        stmt = select(func.count()).select_from(moved).add_cte(folded)
+        return await self._session.scalar(stmt)
+
     async def update_book(self, book_id: int, data: BookDomain) -> BookDomain | None:
         """The method updating book data in the data storage.
         
@@ -165,6 +501,150 @@ class BookRepository(IBookRepository):
             return True
         return False
 
+    def _filter_conditions(
+        self,
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
+        publisher: str | None = None,
+        publication_year: int | None = None,
+        language: str | None = None,
+        match: MatchMode = MatchMode.all,
+    ) -> list:
+        """A private method building the WHERE conditions of the book filters.
+            Array filters use `@>` (all) or `&&` (any), both served by the GIN indexes.
+
+        Returns:
+            list: The SQL conditions to AND together.
+        """
+        conditions = []
+
+        for column, values in ((BookORM.authors, author), (BookORM.subject, subject)):
+            if values:
+                if match == MatchMode.any:
+                    conditions.append(column.overlap(values))
+                else:
+                    conditions.append(column.contains(values))
+        if publisher:
+            conditions.append(BookORM.publisher == publisher)
+        if publication_year:
+            conditions.append(BookORM.publication_year == publication_year)
+        if language:
+            conditions.append(BookORM.language == language)
+        return conditions
+
+    async def _fuzzy_search(self, document, phrase: str, limit: int) -> list[BookDomain]:
+        """A private method getting books whose normalized document contains words similar to the phrase.
+
+        Args:
+            document: The indexed, normalized text expression of the book.
+            phrase (str): The searched phrase.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[BookDomain]: The collection of matching books, most similar first.
+        """
+        normalized = func.normalize_text(phrase)
+        similarity = func.word_similarity(normalized, document)
+        stmt = (
+            select(BookORM)
+            .where(normalized.bool_op("<%")(document))
+            .order_by(similarity.desc(), BookORM.book_id)
+            .limit(limit)
+        )
+        books = (await self._session.scalars(stmt)).all()
+        return [BookDomain.model_validate(book) for book in books]
+
+    def _select_books(self, fields: list[BookField] | None) -> Select:
+        """A private method building a select of whole books or of the chosen columns only.
+
+        Args:
+            fields (list[BookField] | None): The attributes to select, whole books when None.
+
+        Returns:
+            Select: The statement selecting books.
+        """
+        if not fields:
+            return select(BookORM)
+        return select(*self._summary_columns(fields))
+
+    def _summary_columns(self, fields: list[BookField]) -> list:
+        """A private method getting the columns of the chosen book attributes.
+
+        Args:
+            fields (list[BookField]): The attributes to select.
+
+        Returns:
+            list: The `book_id` column followed by the chosen columns.
+        """
+        return [BookORM.book_id, *(getattr(BookORM, field.value) for field in dict.fromkeys(fields))]
+
+    def _with_availability(self, stmt: Select) -> Select:
+        """A private method adding total and available copies counts of every book to a statement.
+
+        Args:
+            stmt (Select): The statement selecting books.
+
+        Returns:
+            Select: The statement with `total_copies` and `available_copies` columns.
+        """
+        total_copies, available_copies = self._copy_counters()
+        return stmt.add_columns(total_copies.label("total_copies"), available_copies.label("available_copies"))
+
+    def _copy_counters(self) -> tuple[ColumnElement[int], ColumnElement[int]]:
+        """A private method building the current copies counters of a book: the folded
+            counters kept on the book plus its pending deltas (usually none or a few,
+            found on the `book_id` index).
+
+        Returns:
+            tuple[ColumnElement[int], ColumnElement[int]]: The total and available copies counts.
+        """
+        return (
+            BookORM.total_copies + self._pending_delta(CounterDeltaORM.total),
+            BookORM.available_copies + self._pending_delta(CounterDeltaORM.available),
+        )
+
+    def _pending_delta(self, column: ColumnElement[int]) -> ColumnElement[int]:
+        """A private method summing a column of the pending counters deltas of a book.
+
+        Args:
+            column (ColumnElement[int]): The delta column.
+
+        Returns:
+            ColumnElement[int]: The correlated sum, 0 without pending deltas.
+        """
+        return (
+            select(func.coalesce(func.sum(column), 0))
+            .where(CounterDeltaORM.book_id == BookORM.book_id)
+            .scalar_subquery()
+        )
+
+    def _to_book(
+        self, row: Row, with_availability: bool, fields: list[BookField] | None = None
+    ) -> BookDomain | BookSummary:
+        """A private method mapping a result row to a book.
+
+        Args:
+            row (Row): The row starting with the book or its chosen columns (and its copies counts).
+            with_availability (bool): Whether the row contains the copies counts.
+            fields (list[BookField] | None): The chosen attributes, whole books when None.
+
+        Returns:
+            BookDomain | BookSummary: The book, a `BookAvailability` if the counts
+                were selected or a `BookSummary` if only some attributes were.
+        """
+        if fields:
+            columns = [column.key for column in self._summary_columns(fields)]
+            if with_availability:
+                columns += ["total_copies", "available_copies"]
+            return BookSummary.model_validate(dict(zip(columns, row)))
+        if not with_availability:
+            return BookDomain.model_validate(row[0])
+        return BookAvailability(
+            **BookDomain.model_validate(row[0]).model_dump(),
+            total_copies=row[1],
+            available_copies=row[2],
+        )
+
     async def _get_by_id(self, book_id: int) -> BookORM| None:
         """A private method getting book from the DB based on its ID.
 
@@ -175,5 +655,30 @@ class BookRepository(IBookRepository):
             BookORM | None: Book record if exists.
         """
         return await self._session.get(BookORM, book_id)
-        
-    
+
+    def _is_isbn_violation(self, error: IntegrityError) -> bool:
+        """A private method checking if an error is a unique violation of the ISBN.
+
+        Args:
+            error (IntegrityError): The error raised by the database.
+
+        Returns:
+            bool: Whether the ISBN is already taken.
+        """
+        cause = error.orig.__cause__ if error.orig is not None else None
+        return (
+            getattr(error.orig, "sqlstate", None) == UNIQUE_VIOLATION
+            and getattr(cause, "constraint_name", None) == ISBN_CONSTRAINT
+        )
+
+    def _error_reason(self, error: DBAPIError) -> str:
+        """A private method extracting the database message of an error.
+
+        Args:
+            error (DBAPIError): The error raised by the database.
+
+        Returns:
+            str: The message of the underlying driver error.
+        """
+        cause = error.orig.__cause__ if error.orig is not None else None
+        return str(cause or error.orig)
@@ -1,11 +1,13 @@
 """Module containing book copy repository implementation"""
 
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import Integer, select, insert, update, delete, func, any_, literal, literal_column
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.repositories.ibook_copy import IBookCopyRepository
-from src.core.domain.book_copy import BookCopy as BookCopyDomain, BookCopyCreate, BookCopyStatus
-from src.db import BookCopy as BookCopyORM
+from src.core.domain.book_copy import BookCopy as BookCopyDomain, BookCopyCreate, BookCopyStatus, CopyTransition
+from src.db import Book as BookORM, BookCopy as BookCopyORM, BookCopyCounterDelta as CounterDeltaORM
+from src.infrastructure.utils.copy_transitions import copy_transition
 
 
 class BookCopyRepository(IBookCopyRepository):
@@ -22,13 +24,15 @@ class BookCopyRepository(IBookCopyRepository):
 
             Returns:
                 int: The number of available copies of the book.
+            Reads the counter kept on the book by primary key, plus the book's
+            pending deltas not folded into it yet.
         """
-        
-        stmt = (
-            select(func.count(BookCopyORM.copy_id))
-            .where(BookCopyORM.book_id==book_id,
-                BookCopyORM.status==BookCopyStatus.available)
+        pending = (
+            select(func.coalesce(func.sum(CounterDeltaORM.available), 0))
+            .where(CounterDeltaORM.book_id==book_id)
+            .scalar_subquery()
         )
+        stmt = select(BookORM.available_copies + pending).where(BookORM.book_id==book_id)
         return await self._session.scalar(stmt) or 0
 
     async def get_book_copy_by_id(self, copy_id: int) -> BookCopyDomain | None:
@@ -42,6 +46,19 @@ class BookCopyRepository(IBookCopyRepository):
         copy = await self._get_by_id(copy_id)
         return BookCopyDomain.model_validate(copy) if  copy else None
     
+    async def get_copies_by_ids(self, copy_ids: list[int]) -> list[BookCopyDomain]:
+        """The method getting many book copies from the data storage at once.
+
+        Args:
+            copy_ids (list[int]): The ids of the book copies.
+
+        Returns:
+            list[BookCopyDomain]: The existing book copies, in no particular order.
+        """
+        stmt = select(BookCopyORM).where(BookCopyORM.copy_id == any_(literal(copy_ids, ARRAY(Integer))))
+        copies = (await self._session.scalars(stmt)).all()
+        return [BookCopyDomain.model_validate(copy) for copy in copies]
+
     async def get_copies_by_book(self, book_id: int, status: BookCopyStatus | None = None) -> list[BookCopyDomain]:
         """The method getting book copies of a specific book from the data storage.
             Optionally filter by status.
@@ -59,6 +76,78 @@ class BookCopyRepository(IBookCopyRepository):
         copies = (await self._session.scalars(stmt)).all()
         return [BookCopyDomain.model_validate(copy) for copy in copies]
 
+    async def get_copies_fingerprint(self, book_id: int, status: BookCopyStatus | None = None) -> str:
+        """The method getting a digest of ids and versions of a specific book copies.
+            Optionally filter by status. Computed in the DB, no copy rows are transferred.
+
+        Args:
+            book_id (int): The id of the book to compute the digest for.
+            status (BookCopyStatus | None): status of the copy e.g available.
+
+        Returns:
+            str: The digest, changing whenever a copy is added, removed or updated.
+        """
+        pairs = func.string_agg(
+            func.concat(BookCopyORM.copy_id, ":", BookCopyORM.version),
+            aggregate_order_by(literal_column("','"), BookCopyORM.copy_id),
+        )
+        stmt = select(func.md5(func.coalesce(pairs, ""))).where(BookCopyORM.book_id==book_id)
+        if status is not None:
+            stmt = stmt.where(BookCopyORM.status==status)
+        return await self._session.scalar(stmt)
+
+    async def transition_copy(self, copy_id: int, transition: CopyTransition) -> BookCopyDomain | None:
+        """The method changing the status of a copy with a conditional UPDATE ... RETURNING
+            statement, only if the transition applies to its current status. Concurrent
+            transitions of the same copy can not overwrite each other, the later one
+            finds the status changed and updates no row.
+
+        Args:
+            copy_id (int): The id of the book copy.
+            transition (CopyTransition): The status change.
+
+        Returns:
+            BookCopyDomain | None: The updated copy, None if it does not exist or the transition does not apply.
+        """
+        applies, status = copy_transition(transition)
+        stmt = (
+            update(BookCopyORM)
+            .where(BookCopyORM.copy_id==copy_id, applies)
+            .values(status=status)
+            .returning(BookCopyORM)
+        )
+        copy = await self._session.scalar(stmt)
+        return BookCopyDomain.model_validate(copy) if copy else None
+
+    async def claim_available_copy(self, book_id: int, transition: CopyTransition) -> BookCopyDomain | None:
+        """The method atomically claiming one copy of a book the transition applies to in
+            a single UPDATE ... RETURNING statement. The copy is picked with FOR UPDATE SKIP LOCKED,
+            so concurrent claims skip rows locked by each other instead of waiting on them.
+
+        Args:
+            book_id (int): The id of the book.
+            transition (CopyTransition): The status change of the claimed copy e.g reserve.
+
+        Returns:
+            BookCopyDomain | None: The claimed copy, None if no copy is available.
+        """
+        applies, status = copy_transition(transition)
+        candidate = (
+            select(BookCopyORM.copy_id)
+            .where(BookCopyORM.book_id==book_id, applies)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(BookCopyORM)
+            .where(BookCopyORM.copy_id==candidate, applies)
+            .values(status=status)
+            .returning(BookCopyORM)
+        )
+        copy = await self._session.scalar(stmt)
+        return BookCopyDomain.model_validate(copy) if copy else None
+
     async def add_book_copy(self, data: BookCopyCreate) -> BookCopyDomain | None:
         """The method adding new book copy to the data storage.
             
@@ -72,6 +161,39 @@ class BookCopyRepository(IBookCopyRepository):
         await self._session.flush()
         return BookCopyDomain.model_validate(new_copy) if new_copy else None
 
+    async def add_book_copies(self, book_id: int, location: str | None, count: int) -> list[BookCopyDomain]:
+        """The method adding many copies of a book to the data storage at once
+            with a multi-row INSERT ... RETURNING statement.
+
+        Args:
+            book_id (int): The id of the book.
+            location (str | None): The location of the copies.
+            count (int): Number of copies to create.
+
+        Returns:
+            list[BookCopyDomain]: The newly created book copies.
+        """
+        if not count or count < 1:
+            return []
+        stmt = insert(BookCopyORM).returning(BookCopyORM, sort_by_parameter_order=True)
+        copies = await self._session.scalars(stmt, [{"book_id": book_id, "location": location}] * count)
+        return [BookCopyDomain.model_validate(copy) for copy in copies]
+
+    async def add_copies(self, copies: list[BookCopyCreate]) -> int:
+        """The method adding many book copies, of any books, to the data storage at once
+            with multi-row INSERT statements.
+
+        Args:
+            copies (list[BookCopyCreate]): The attributes of the book copies.
+
+        Returns:
+            int: The number of created copies.
+        """
+        if not copies:
+            return 0
+        await self._session.execute(insert(BookCopyORM), [copy.model_dump() for copy in copies])
+        return len(copies)
+
     async def update_book_copy(self, copy_id: int, data: BookCopyDomain) -> BookCopyDomain | None:
         """The method updating book copy  data in the data storage.
         
@@ -90,16 +212,27 @@ class BookCopyRepository(IBookCopyRepository):
             return BookCopyDomain.model_validate(copy)
         return None
 
-    async def delete_book_copy(self, copy_id: int) -> bool:
+    async def delete_book_copy(self, copy_id: int, status: BookCopyStatus | None = None) -> bool:
         """The method removing book copy from the data storage.
+            Optionally only if the copy has the given status, checked on the locked row,
+            so a copy reserved concurrently (e.g for a waiting hold) is kept.
 
         Args:
             copy_id (int): The book copy id.
+            status (BookCopyStatus | None): The status the copy must have e.g available.
 
         Returns:
             bool: Success of the operation.
         """
-        copy = await self._get_by_id(copy_id)
+        if status is None:
+            copy = await self._get_by_id(copy_id)
+        else:
+            stmt = (
+                select(BookCopyORM)
+                .where(BookCopyORM.copy_id==copy_id, BookCopyORM.status==status)
+                .with_for_update()
+            )
+            copy = await self._session.scalar(stmt)
         if copy:
             await self._session.delete(copy)
             await self._session.flush()
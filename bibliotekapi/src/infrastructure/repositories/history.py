@@ -1,12 +1,24 @@
 """Module containing history repository implementation"""
 
-from sqlalchemy import select, delete
+from typing import AsyncIterator
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, insert, update, delete, func, exists, literal, and_, or_, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import UUID4
 
 from src.core.repositories.ihistory import IHistoryRepository
-from src.core.domain.history import History as HistoryDomain, HistoryCreate, HistoryStatus
-from src.db import History as HistoryORM
+from src.core.domain.book_copy import BookCopyStatus, CopyTransition
+from src.core.domain.history import CheckoutFailure, CheckoutResult, History as HistoryDomain, HistoryCreate, HistoryStatus, OverdueUser
+from src.core.domain.reservation import ReservationStatus
+from src.core.domain.page import Page
+from src.db import BookCopy as BookCopyORM, History as HistoryORM, Reservation as ReservationORM, User as UserORM
+from src.infrastructure.utils.copy_transitions import copy_transition
+from src.infrastructure.utils.pagination import paginate
+from src.infrastructure.utils.consts import LOAN_DAYS, STREAM_BATCH_SIZE
 
 class HistoryRepository(IHistoryRepository):
     """A class implementing the history repository"""
@@ -14,19 +26,109 @@ class HistoryRepository(IHistoryRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
         
-    async def get_all_history(self, status: HistoryStatus | None = None) -> list[HistoryDomain]:
-        """The method getting a all history from the data storage.
+    async def get_all_history(
+        self,
+        limit: int,
+        after: str | None = None,
+        status: HistoryStatus | None = None,
+    ) -> Page[HistoryDomain]:
+        """The method getting a page of history from the data storage.
+            Optionally filter by status.
+
+        Args:
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
+            status (HistoryStatus | None): History status.
         
         Returns:
-            list[HistoryDomain]: The collection of all history data.
+            Page[HistoryDomain]: The page of history data ordered by id.
         """
         stmt = select(HistoryORM)
         if status is not None:
             stmt = stmt.where(HistoryORM.status==status)
-        history = (await self._session.scalars(stmt)).all()
-        return [HistoryDomain.model_validate(h) for h in history]
+        return await paginate(
+            self._session,
+            stmt,
+            keys=[HistoryORM.history_id],
+            limit=limit,
+            after=after,
+            to_item=lambda row: HistoryDomain.model_validate(row[0]),
+        )
+
+    async def stream_history(self, status: HistoryStatus | None = None) -> AsyncIterator[HistoryDomain]:
+        """The method streaming all history from the data storage record by record.
+            Rows are fetched through a server-side cursor in batches,
+            so memory usage does not depend on the size of the table.
+
+        Args:
+            status (HistoryStatus | None): History status.
+
+        Returns:
+            AsyncIterator[HistoryDomain]: The iterator over history data ordered by id.
+        """
+        stmt = (
+            select(HistoryORM)
+            .order_by(HistoryORM.history_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        if status is not None:
+            stmt = stmt.where(HistoryORM.status==status)
+        result = await self._session.stream_scalars(stmt)
+        async for h in result:
+            yield HistoryDomain.model_validate(h)
+
+    async def get_overdue_history(self, now: datetime, limit: int, after: str | None = None) -> Page[HistoryDomain]:
+        """The method getting a page of loans past their due date from the data storage.
+            Filtered and paginated in the DB on the partial (due_date, history_id) index.
+
+        Args:
+            now (datetime): The time the due dates are compared against.
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
 
+        Returns:
+            Page[HistoryDomain]: The page of overdue loans, the longest overdue first.
+        """
+        stmt = select(HistoryORM).where(self._is_overdue(now))
+        return await paginate(
+            self._session,
+            stmt,
+            keys=[HistoryORM.due_date, HistoryORM.history_id],
+            limit=limit,
+            after=after,
+            to_item=lambda row: HistoryDomain.model_validate(row[0]),
+        )
 
+    async def get_overdue_users(self, now: datetime, limit: int, after: str | None = None) -> Page[OverdueUser]:
+        """The method getting a page of users with loans past their due date from the data storage.
+            The overdue loans are grouped by user in the DB.
+
+        Args:
+            now (datetime): The time the due dates are compared against.
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[OverdueUser]: The page of users with their overdue loans, ordered by user id.
+        """
+        stmt = (
+            select(
+                HistoryORM.user_id,
+                func.count().label("overdue_count"),
+                func.min(HistoryORM.due_date).label("oldest_due_date"),
+                func.array_agg(aggregate_order_by(HistoryORM.history_id, HistoryORM.due_date)).label("history_ids"),
+            )
+            .where(self._is_overdue(now))
+            .group_by(HistoryORM.user_id)
+        )
+        return await paginate(
+            self._session,
+            stmt,
+            keys=[HistoryORM.user_id],
+            limit=limit,
+            after=after,
+            to_item=lambda row: OverdueUser.model_validate(row._mapping),
+        )
 
     async def get_history_by_id(self, history_id: int) -> HistoryDomain | None:
         """The method getting a single history record from the data storage.
@@ -87,6 +189,93 @@ class HistoryRepository(IHistoryRepository):
         await self._session.flush()
         return HistoryDomain.model_validate(new_history) if new_history else None
 
+    async def checkout(self, user_id: UUID4, copy_id: int) -> CheckoutResult:
+        """The method lending a copy to a user in a single statement of chained CTEs:
+            a conditional UPDATE of the copy, which succeeds only for an available copy
+            or one reserved by the user, feeds the reservation update and the history INSERT.
+            The states read alongside explain a failure.
+
+        Args:
+            user_id (UUID4): The user id.
+            copy_id (int): The copy id.
+
+        Returns:
+            CheckoutResult: The new history record or the reason the copy can not be lent.
+        """
+        now = datetime.now()
+        user = select(UserORM.user_id).where(UserORM.user_id==user_id).cte("checkout_user")
+        copy = select(BookCopyORM.status).where(BookCopyORM.copy_id==copy_id).cte("checkout_copy")
+        reservation = (
+            select(ReservationORM.reservation_id)
+            .where(
+                ReservationORM.user_id==user_id,
+                ReservationORM.copy_id==copy_id,
+                ReservationORM.status==ReservationStatus.active,
+            )
+            .cte("checkout_reservation")
+        )
+        applies, status = copy_transition(CopyTransition.checkout)
+        borrowed = (
+            update(BookCopyORM)
+            .where(
+                BookCopyORM.copy_id==copy_id,
+                exists(select(user.c.user_id)),
+                applies,
+                # A reserved copy is lent only to the user holding its reservation.
+                or_(
+                    BookCopyORM.status!=BookCopyStatus.reserved,
+                    exists(select(reservation.c.reservation_id)),
+                ),
+            )
+            .values(status=status)
+            .returning(BookCopyORM.copy_id)
+            .cte("borrowed")
+        )
+        collected = (
+            update(ReservationORM)
+            .where(
+                ReservationORM.reservation_id.in_(select(reservation.c.reservation_id)),
+                exists(select(borrowed.c.copy_id)),
+            )
+            .values(status=ReservationStatus.collected)
+            .returning(ReservationORM.reservation_id)
+            .cte("collected")
+        )
+        new_history = (
+            insert(HistoryORM)
+            .from_select(
+                ["copy_id", "user_id", "borrowed_date", "due_date", "status"],
+                select(
+                    borrowed.c.copy_id,
+                    literal(user_id, UserORM.user_id.type),
+                    literal(now, HistoryORM.borrowed_date.type),
+                    literal(now + timedelta(days=LOAN_DAYS), HistoryORM.due_date.type),
+                    literal(HistoryStatus.borrowed, HistoryORM.status.type),
+                ),
+            )
+            .returning(*HistoryORM.__table__.c)
+            .cte("new_history")
+        )
+        one_row = select(literal(1).label("one")).subquery("one_row")
+        stmt = select(
+            exists(select(user.c.user_id)).label("user_found"),
+            select(copy.c.status).scalar_subquery().label("copy_status"),
+            # Referenced so the reservation update is rendered.
+            select(func.count()).select_from(collected).scalar_subquery().label("collected"),
+            *new_history.c,
+        ).select_from(one_row.outerjoin(new_history, true()))
+        row = (await self._session.execute(stmt)).one()
+        if row.history_id is not None:
+            return CheckoutResult(history=HistoryDomain.model_validate(row._mapping))
+        if not row.user_found:
+            return CheckoutResult(failure=CheckoutFailure.user_not_found)
+        if row.copy_status is None:
+            return CheckoutResult(failure=CheckoutFailure.copy_not_found)
+        if row.copy_status.value == BookCopyStatus.reserved:
+            return CheckoutResult(failure=CheckoutFailure.copy_reserved)
+        # Borrowed, or borrowed by a concurrent checkout after the copy state was read.
+        return CheckoutResult(failure=CheckoutFailure.copy_borrowed)
+
     async def update_history(self, history_id: int, data: HistoryDomain) -> HistoryDomain | None:
         """The method updating history data in the data storage.
         
@@ -146,5 +335,19 @@ class HistoryRepository(IHistoryRepository):
             HistoryORM | None: History record if exists.
         """
         return await self._session.get(HistoryORM, history_id)
-        
-    
\ No newline at end of file
+
+    def _is_overdue(self, now: datetime) -> ColumnElement[bool]:
+        """A private method building the condition of an overdue loan,
+            matching the partial index on borrowed loans.
+
+        Args:
+            now (datetime): The time the due dates are compared against.
+
+        Returns:
+            ColumnElement[bool]: The filter condition.
+        """
+        return and_(
+            HistoryORM.status==HistoryStatus.borrowed,
+            HistoryORM.return_date.is_(None),
+            HistoryORM.due_date < now,
+        )
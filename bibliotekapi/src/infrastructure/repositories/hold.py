@@ -0,0 +1,304 @@
+"""Module containing hold repository implementation."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import Row, Select, case, select, insert, update, func, exists, literal
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import UUID4
+
+from src.core.repositories.ihold import IHoldRepository
+from src.core.domain.book_copy import CopyTransition
+from src.core.domain.hold import Hold as HoldDomain, HoldStatus
+from src.core.domain.reservation import ReservationStatus
+from src.core.exceptions.exceptions import HoldAlreadyExist
+from src.db import BookCopy as BookCopyORM, Hold as HoldORM, Reservation as ReservationORM
+from src.infrastructure.utils.consts import RESERVATION_DAYS
+from src.infrastructure.utils.copy_transitions import copy_transition
+
+# Taken with the book id by every change of a book's queue: placing, canceling and
+# fulfilling holds of one book happen one at a time.
+HOLD_QUEUE_LOCK_KEY = 1_019
+# The name of the unique index stopping a user from waiting twice for one book.
+WAITING_HOLD_INDEX = "uq_hold_waiting_book_id_user_id"
+UNIQUE_VIOLATION = "23505"
+
+
+class HoldRepository(IHoldRepository):
+    """A class implementing hold repository."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_hold_by_id(self, hold_id: int) -> HoldDomain | None:
+        """The method getting a hold from the data storage.
+
+        Args:
+            hold_id (int): The id of the hold.
+
+        Returns:
+            HoldDomain | None: The hold data with its place in the queue if exists.
+        """
+        stmt = self._select_holds().where(HoldORM.hold_id==hold_id)
+        row = (await self._session.execute(stmt)).first()
+        return self._to_hold(row) if row else None
+
+    async def get_holds_by_user(self, user_id: UUID4, status: HoldStatus | None = None) -> list[HoldDomain]:
+        """The method getting holds of a given user from the data storage.
+            Optionally filter by status.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            status (HoldStatus | None): The hold status.
+
+        Returns:
+            list[HoldDomain]: The collection of holds with their places in the queues.
+        """
+        stmt = self._select_holds().where(HoldORM.user_id==user_id).order_by(HoldORM.hold_id)
+        if status is not None:
+            stmt = stmt.where(HoldORM.status==status)
+        rows = (await self._session.execute(stmt)).all()
+        return [self._to_hold(row) for row in rows]
+
+    async def get_book_queue(self, book_id: int) -> list[HoldDomain]:
+        """The method getting the waiting holds of a book in the queue order.
+
+        Args:
+            book_id (int): The id of the book.
+
+        Returns:
+            list[HoldDomain]: The waiting holds with their places in the queue.
+        """
+        stmt = (
+            select(HoldORM, func.row_number().over(order_by=HoldORM.hold_id))
+            .where(HoldORM.book_id==book_id, HoldORM.status==HoldStatus.waiting)
+            .order_by(HoldORM.hold_id)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        return [self._to_hold(row) for row in rows]
+
+    async def has_waiting_hold(self, book_id: int, user_id: UUID4) -> bool:
+        """The method checking whether a user is waiting in the queue of a book.
+
+        Args:
+            book_id (int): The id of the book.
+            user_id (UUID4): The id of the user.
+
+        Returns:
+            bool: Whether the user has a waiting hold on the book.
+        """
+        stmt = select(
+            exists().where(
+                HoldORM.book_id==book_id,
+                HoldORM.user_id==user_id,
+                HoldORM.status==HoldStatus.waiting,
+            )
+        )
+        return await self._session.scalar(stmt)
+
+    async def lock_queue(self, book_id: int) -> None:
+        """The method taking the transaction lock of a book's queue.
+            Held until the end of the transaction, re-taking it is a no-op.
+
+        Args:
+            book_id (int): The id of the book.
+        """
+        await self._session.execute(select(func.pg_advisory_xact_lock(HOLD_QUEUE_LOCK_KEY, book_id)))
+
+    async def add_hold(self, data: HoldDomain) -> HoldDomain:
+        """The method adding new hold to the data storage.
+            A waiting hold is numbered after the last one in its book's queue.
+
+        Args:
+            data (HoldDomain): The attributes of the hold.
+
+        Raises:
+            HoldAlreadyExist: If the user is already waiting for the book.
+
+        Returns:
+            HoldDomain: The newly created hold.
+        """
+        new_hold = HoldORM(**data.model_dump(exclude={"hold_id", "position"}))
+        if data.status == HoldStatus.waiting:
+            await self.lock_queue(data.book_id)
+            last = (
+                select(HoldORM.queue_seq)
+                .where(HoldORM.book_id==data.book_id, HoldORM.status==HoldStatus.waiting)
+                .order_by(HoldORM.hold_id.desc())
+                .limit(1)
+                .scalar_subquery()
+            )
+            new_hold.queue_seq = await self._session.scalar(select(func.coalesce(last, 0) + 1))
+        self._session.add(new_hold)
+        try:
+            await self._session.flush()
+        except IntegrityError as e:
+            if self._is_waiting_hold_violation(e):
+                raise HoldAlreadyExist() from e
+            raise
+        return await self.get_hold_by_id(new_hold.hold_id)
+
+    async def cancel_hold(self, hold_id: int, user_id: UUID4) -> HoldDomain | None:
+        """The method canceling a waiting hold of a given user
+            with a conditional UPDATE ... RETURNING statement.
+            The holds behind it in the queue move one place up.
+
+        Args:
+            hold_id (int): The id of the hold.
+            user_id (UUID4): The id of the user owning the hold.
+
+        Returns:
+            HoldDomain | None: The canceled hold, None if no such waiting hold exists.
+        """
+        book_id = await self._session.scalar(select(HoldORM.book_id).where(HoldORM.hold_id==hold_id))
+        if book_id is None:
+            return None
+        # Locked before the hold row, as allocations lock the queue before its head.
+        await self.lock_queue(book_id)
+        stmt = (
+            update(HoldORM)
+            .where(
+                HoldORM.hold_id==hold_id,
+                HoldORM.user_id==user_id,
+                HoldORM.status==HoldStatus.waiting,
+            )
+            .values(status=HoldStatus.canceled, queue_seq=None)
+            .returning(HoldORM)
+        )
+        hold = await self._session.scalar(stmt)
+        if not hold:
+            return None
+        ahead = HoldORM.__table__.alias("ahead")
+        await self._session.execute(
+            update(HoldORM)
+            .where(
+                HoldORM.book_id==hold.book_id,
+                HoldORM.status==HoldStatus.waiting,
+                HoldORM.hold_id > hold.hold_id,
+                # Places count from the head, leaving it needs no renumbering.
+                exists().where(
+                    ahead.c.book_id==hold.book_id,
+                    ahead.c.status==HoldStatus.waiting,
+                    ahead.c.hold_id < hold.hold_id,
+                ),
+            )
+            .values(queue_seq=HoldORM.queue_seq - 1)
+        )
+        return HoldDomain.model_validate(hold)
+
+    async def allocate_copy(self, copy_id: int) -> HoldDomain | None:
+        """The method reserving a released, available copy for the next hold in its book queue.
+            The queue lock of the book is taken first, so a hold placed concurrently either
+            claims the copy itself or is already waiting here. Then a single statement of
+            chained CTEs locks the oldest waiting hold, reserves the copy, creates the
+            reservation and marks the hold as fulfilled.
+
+        Args:
+            copy_id (int): The id of the released copy.
+
+        Returns:
+            HoldDomain | None: The fulfilled hold, None if nobody is waiting for the book.
+        """
+        now = datetime.now()
+        book_id = await self._session.scalar(select(BookCopyORM.book_id).where(BookCopyORM.copy_id==copy_id))
+        if book_id is None:
+            return None
+        await self.lock_queue(book_id)
+        next_hold = (
+            select(HoldORM.hold_id, HoldORM.user_id)
+            .where(HoldORM.book_id==book_id, HoldORM.status==HoldStatus.waiting)
+            .order_by(HoldORM.hold_id)
+            .limit(1)
+            .with_for_update()
+            .cte("next_hold")
+        )
+        applies, status = copy_transition(CopyTransition.reserve)
+        reserved_copy = (
+            update(BookCopyORM)
+            .where(
+                BookCopyORM.copy_id==copy_id,
+                applies,
+                exists(select(next_hold.c.hold_id)),
+            )
+            .values(status=status)
+            .returning(BookCopyORM.copy_id)
+            .cte("reserved_copy")
+        )
+        new_reservation = (
+            insert(ReservationORM)
+            .from_select(
+                ["copy_id", "user_id", "reservation_date", "expiration_date", "status"],
+                select(
+                    reserved_copy.c.copy_id,
+                    next_hold.c.user_id,
+                    literal(now, ReservationORM.reservation_date.type),
+                    literal(now + timedelta(days=RESERVATION_DAYS), ReservationORM.expiration_date.type),
+                    literal(ReservationStatus.active, ReservationORM.status.type),
+                ),
+            )
+            .returning(ReservationORM.reservation_id)
+            .cte("new_reservation")
+        )
+        fulfilled = (
+            update(HoldORM)
+            .where(HoldORM.hold_id.in_(select(next_hold.c.hold_id)))
+            .values(
+                status=HoldStatus.fulfilled,
+                reservation_id=select(new_reservation.c.reservation_id).scalar_subquery(),
+                queue_seq=None,
+            )
+            .where(exists(select(new_reservation.c.reservation_id)))
+            .returning(*HoldORM.__table__.c)
+            .cte("fulfilled")
+        )
+        row = (await self._session.execute(select(fulfilled))).first()
+        return HoldDomain.model_validate(row._mapping) if row else None
+
+    def _select_holds(self) -> Select:
+        """A private method building a select of holds with the places in the queue
+            of the waiting ones. The place is the hold's number less the number of the
+            head of its queue, found first on the partial (book_id, hold_id) index.
+
+        Returns:
+            Select: The select statement of holds and their places.
+        """
+        head = HoldORM.__table__.alias("head")
+        head_seq = (
+            select(head.c.queue_seq)
+            .where(head.c.book_id==HoldORM.book_id, head.c.status==HoldStatus.waiting)
+            .order_by(head.c.hold_id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        position = HoldORM.queue_seq - head_seq + 1
+        return select(HoldORM, case((HoldORM.status==HoldStatus.waiting, position)).label("position"))
+
+    def _is_waiting_hold_violation(self, error: IntegrityError) -> bool:
+        """A private method checking if an error is a unique violation of the waiting holds index.
+
+        Args:
+            error (IntegrityError): The error raised by the database.
+
+        Returns:
+            bool: Whether the user is already waiting for the book.
+        """
+        cause = error.orig.__cause__ if error.orig is not None else None
+        return (
+            getattr(error.orig, "sqlstate", None) == UNIQUE_VIOLATION
+            and getattr(cause, "constraint_name", None) == WAITING_HOLD_INDEX
+        )
+
+    def _to_hold(self, row: Row) -> HoldDomain:
+        """A private method mapping a hold row to the domain model.
+
+        Args:
+            row (Row): The row of the hold and its place in the queue.
+
+        Returns:
+            HoldDomain: The hold, the place is set for the waiting holds only.
+        """
+        hold, position = row
+        result = HoldDomain.model_validate(hold)
+        if result.status == HoldStatus.waiting:
+            result.position = position
+        return result
@@ -0,0 +1,141 @@
+"""Module containing notification repository implementation."""
+
+from datetime import datetime
+
+from sqlalchemy import select, update, delete, exists
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repositories.inotification import INotificationRepository
+from src.core.domain.history import HistoryStatus
+from src.core.domain.notification import LoanNotice, NotificationKind
+from src.core.domain.page import Page
+from src.db import (
+    Book as BookORM,
+    BookCopy as BookCopyORM,
+    History as HistoryORM,
+    Notification as NotificationORM,
+    User as UserORM,
+)
+from src.infrastructure.utils.pagination import paginate
+
+
+class NotificationRepository(INotificationRepository):
+    """A class implementing notification repository."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_pending_notices(
+        self,
+        kind: NotificationKind,
+        due_from: datetime | None,
+        due_to: datetime,
+        limit: int,
+        after: str | None = None,
+    ) -> Page[LoanNotice]:
+        """The method getting a page of current loans due in a given range
+            that were not notified about with a given kind yet.
+            The loans are scanned in the order of the partial (due_date, history_id)
+            index, the sent notices are excluded with an anti-join on their markers.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            due_from (datetime | None): The inclusive lower bound of the due date, if any.
+            due_to (datetime): The exclusive upper bound of the due date.
+            limit (int): Maximum number of loans on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[LoanNotice]: The page of loans ordered by due date.
+        """
+        notified = exists().where(
+            NotificationORM.history_id==HistoryORM.history_id,
+            NotificationORM.kind==kind,
+        )
+        # history_id and due_date are added by `paginate` as the sort keys.
+        stmt = (
+            select(HistoryORM.user_id, UserORM.email, UserORM.username, BookORM.title)
+            .join(UserORM, UserORM.user_id==HistoryORM.user_id)
+            .join(BookCopyORM, BookCopyORM.copy_id==HistoryORM.copy_id)
+            .join(BookORM, BookORM.book_id==BookCopyORM.book_id)
+            .where(
+                HistoryORM.status==HistoryStatus.borrowed,
+                HistoryORM.return_date.is_(None),
+                HistoryORM.due_date < due_to,
+                ~notified,
+            )
+        )
+        if due_from is not None:
+            stmt = stmt.where(HistoryORM.due_date >= due_from)
+        return await paginate(
+            self._session,
+            stmt,
+            keys=[HistoryORM.due_date, HistoryORM.history_id],
+            limit=limit,
+            after=after,
+            to_item=lambda row: LoanNotice.model_validate(row._mapping),
+        )
+
+    async def claim_notices(self, kind: NotificationKind, history_ids: list[int], now: datetime) -> list[int]:
+        """The method inserting idempotency markers of notices about to be sent.
+            Loans already claimed (e.g. by a concurrent or an earlier run) are skipped
+            by the unique (history_id, kind) index.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            history_ids (list[int]): The ids of the loans.
+            now (datetime): The time of the claim.
+
+        Returns:
+            list[int]: The ids of the loans claimed by this call.
+        """
+        if not history_ids:
+            return []
+        stmt = (
+            insert(NotificationORM)
+            .values([
+                {"history_id": history_id, "kind": kind, "created_at": now}
+                for history_id in history_ids
+            ])
+            .on_conflict_do_nothing(index_elements=[NotificationORM.history_id, NotificationORM.kind])
+            .returning(NotificationORM.history_id)
+        )
+        return list((await self._session.scalars(stmt)).all())
+
+    async def mark_sent(self, kind: NotificationKind, history_ids: list[int], now: datetime) -> None:
+        """The method marking claimed notices as sent.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            history_ids (list[int]): The ids of the loans.
+            now (datetime): The time of sending.
+        """
+        if not history_ids:
+            return
+        stmt = (
+            update(NotificationORM)
+            .where(NotificationORM.history_id.in_(history_ids), NotificationORM.kind==kind)
+            .values(sent_at=now)
+        )
+        await self._session.execute(stmt)
+
+    async def release_notices(self, kind: NotificationKind, history_ids: list[int]) -> None:
+        """The method removing markers of claimed notices that failed to be sent,
+            so the next run retries them.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            history_ids (list[int]): The ids of the loans.
+        """
+        if not history_ids:
+            return
+        stmt = (
+            delete(NotificationORM)
+            .where(
+                NotificationORM.history_id.in_(history_ids),
+                NotificationORM.kind==kind,
+                NotificationORM.sent_at.is_(None),
+            )
+        )
+        await self._session.execute(stmt)
@@ -1,12 +1,19 @@
 """Module containing reservation repository implementation."""
 
-from sqlalchemy import select, delete
+from datetime import datetime
+
+from sqlalchemy import func, select, update, delete
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import UUID4
 
 from src.core.repositories.ireservation import IReservationRepository
-from src.core.domain.reservation import Reservation as ReservationDomain, ReservationCreate, ReservationStatus
-from src.db import Reservation as ReservationORM
+from src.core.domain.reservation import Reservation as ReservationDomain, ReservationCreate, ReservationOrder, ReservationStatus
+from src.core.domain.page import Page
+from src.core.domain.book_copy import CopyTransition
+from src.db import BookCopy as BookCopyORM, Reservation as ReservationORM
+from src.infrastructure.utils.copy_transitions import copy_transition
+from src.infrastructure.utils.pagination import paginate
 
 
 class ReservationRepository(IReservationRepository):
@@ -15,15 +22,55 @@ class ReservationRepository(IReservationRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_all_reservations(self) -> list[ReservationDomain]:
-        """The method getting a all reservations from the data storage.
-        
+    async def get_all_reservations(
+        self,
+        limit: int,
+        after: str | None = None,
+        status: ReservationStatus | None = None,
+        reserved_from: datetime | None = None,
+        reserved_to: datetime | None = None,
+        expires_before: datetime | None = None,
+        order: ReservationOrder = ReservationOrder.reservation_id,
+        descending: bool = False,
+    ) -> Page[ReservationDomain]:
+        """The method getting a page of reservations from the data storage.
+            Optionally filter by status and dates. Filtering, ordering and
+            pagination are done in the DB.
+
+        Args:
+            limit (int): Maximum number of reservations on the page.
+            after (str | None): The cursor of the previous page.
+            status (ReservationStatus | None): The reservation status.
+            reserved_from (datetime | None): The earliest reservation date.
+            reserved_to (datetime | None): The latest reservation date.
+            expires_before (datetime | None): The latest expiration date.
+            order (ReservationOrder): The sort key of the page.
+            descending (bool): Whether to sort in descending order.
+
         Returns:
-            list[ReservationDomain]: The collection of reservations data.
+            Page[ReservationDomain]: The page of reservations data, ties ordered by id.
         """
         stmt = select(ReservationORM)
-        reservations = (await self._session.scalars(stmt)).all()
-        return [ReservationDomain.model_validate(reservation) for reservation in reservations]
+        if status is not None:
+            stmt = stmt.where(ReservationORM.status==status)
+        if reserved_from is not None:
+            stmt = stmt.where(ReservationORM.reservation_date >= reserved_from)
+        if reserved_to is not None:
+            stmt = stmt.where(ReservationORM.reservation_date <= reserved_to)
+        if expires_before is not None:
+            stmt = stmt.where(ReservationORM.expiration_date <= expires_before)
+        keys = [ReservationORM.reservation_id]
+        if order is not ReservationOrder.reservation_id:
+            keys.insert(0, getattr(ReservationORM, order.value))
+        return await paginate(
+            self._session,
+            stmt,
+            keys=keys,
+            limit=limit,
+            after=after,
+            to_item=lambda row: ReservationDomain.model_validate(row[0]),
+            descending=descending,
+        )
 
 
     async def get_reservation_by_id(self, reservation_id: int) -> ReservationDomain | None:
@@ -120,6 +167,85 @@ class ReservationRepository(IReservationRepository):
             return True
        return  False
 
+    async def cancel_and_release(self, reservation_id: int) -> ReservationDomain | None:
+        """The method canceling an active reservation and releasing its reserved copy
+            in a single statement, an UPDATE ... RETURNING CTE feeding the copy update.
+
+        Args:
+            reservation_id (int): The reservation id.
+
+        Returns:
+            ReservationDomain | None: The canceled reservation, None if no such active reservation exists.
+        """
+        canceled = (
+            update(ReservationORM)
+            .where(
+                ReservationORM.reservation_id==reservation_id,
+                ReservationORM.status==ReservationStatus.active,
+            )
+            .values(status=ReservationStatus.canceled)
+            .returning(*ReservationORM.__table__.c)
+            .cte("canceled")
+        )
+        applies, status = copy_transition(CopyTransition.release)
+        released = (
+            update(BookCopyORM)
+            .where(BookCopyORM.copy_id.in_(select(canceled.c.copy_id)), applies)
+            .values(status=status)
+            .returning(BookCopyORM.copy_id)
+            .cte("released")
+        )
+        # The copies CTE has to be referenced, otherwise it is not rendered.
+        stmt = select(canceled, select(released.c.copy_id).scalar_subquery().label("released_copy_id"))
+        row = (await self._session.execute(stmt)).first()
+        return ReservationDomain.model_validate(row._mapping) if row else None
+
+    async def expire_reservations(self, now: datetime, limit: int) -> tuple[int, list[int]]:
+        """The method canceling a batch of active reservations expired before the given time
+            and releasing their reserved copies, in a single statement of chained
+            UPDATE ... RETURNING CTEs. Rows locked by concurrent transactions are skipped.
+
+        Args:
+            now (datetime): The time the reservations are compared against.
+            limit (int): Maximum number of reservations in the batch.
+
+        Returns:
+            tuple[int, list[int]]: The number of canceled reservations and the ids of the released copies,
+                ordered by their book.
+        """
+        expired = (
+            select(ReservationORM.reservation_id)
+            .where(ReservationORM.status==ReservationStatus.active, ReservationORM.expiration_date < now)
+            .order_by(ReservationORM.expiration_date)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("expired")
+        )
+        canceled = (
+            update(ReservationORM)
+            .where(ReservationORM.reservation_id.in_(select(expired.c.reservation_id)))
+            .values(status=ReservationStatus.canceled)
+            .returning(ReservationORM.copy_id)
+            .cte("canceled")
+        )
+        applies, status = copy_transition(CopyTransition.release)
+        released = (
+            update(BookCopyORM)
+            .where(BookCopyORM.copy_id.in_(select(canceled.c.copy_id)), applies)
+            .values(status=status)
+            .returning(BookCopyORM.copy_id, BookCopyORM.book_id)
+            .cte("released")
+        )
+        # Ordered by book, so allocating the copies takes the queue locks in one order.
+        stmt = select(
+            select(func.count()).select_from(canceled).scalar_subquery(),
+            select(
+                func.array_agg(aggregate_order_by(released.c.copy_id, released.c.book_id, released.c.copy_id))
+            ).scalar_subquery(),
+        )
+        canceled_count, copy_ids = (await self._session.execute(stmt)).one()
+        return canceled_count, copy_ids or []
+
     async def delete_reservation_by_user(self, user_id: UUID4) -> bool:
        """The method removing reservation for a user from the data storage.
 
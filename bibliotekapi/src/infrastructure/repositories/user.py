@@ -1,13 +1,16 @@
 """Module containing user repository implementation"""
 
 
-from sqlalchemy import select
+from sqlalchemy import select, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import UUID4
 
 from src.infrastructure.utils.password import hash_password
 from src.core.repositories.iuser import IUserRepository
 from src.core.domain.user import User as UserDomain, UserCreate
+from src.core.domain.page import Page
+from src.infrastructure.utils.pagination import paginate
 
 from src.db import User as UserORM
 
@@ -17,15 +20,25 @@ class UserRepository(IUserRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_all_users(self) -> list[UserDomain]:
-       """The method getting all users from the data storage.
+    async def get_all_users(self, limit: int, after: str | None = None) -> Page[UserDomain]:
+       """The method getting a page of users from the data storage.
+
+        Args:
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
         
         Returns:
-            list[UserDomain]: The collection of the all users.
+            Page[UserDomain]: The page of users ordered by id.
         """
        stmt = select(UserORM)
-       users = (await self._session.scalars(stmt)).all()
-       return [UserDomain.model_validate(user) for user in users]
+       return await paginate(
+           self._session,
+           stmt,
+           keys=[UserORM.user_id],
+           limit=limit,
+           after=after,
+           to_item=lambda row: UserDomain.model_validate(row[0]),
+       )
        
 
     async def get_user_by_uuid(self, user_id: UUID4) -> UserDomain | None:
@@ -42,6 +55,19 @@ class UserRepository(IUserRepository):
             return UserDomain.model_validate(user)
         return None
 
+    async def get_users_by_ids(self, user_ids: list[UUID4]) -> list[UserDomain]:
+        """The method getting many users from the data storage at once.
+
+        Args:
+            user_ids (list[UUID4]): The ids of the users.
+
+        Returns:
+            list[UserDomain]: The existing users, in no particular order.
+        """
+        stmt = select(UserORM).where(UserORM.user_id == any_(literal(user_ids, ARRAY(UUID(as_uuid=True)))))
+        users = (await self._session.scalars(stmt)).all()
+        return [UserDomain.model_validate(user) for user in users]
+
     async def get_user_by_email(self, email: str) -> UserDomain | None:
         """The method getting a user by email from the data storage.
 
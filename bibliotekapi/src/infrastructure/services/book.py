@@ -1,26 +1,52 @@
 """Module containing book service implementations"""
 
-from src.core.domain.book import Book, BookCreate, BookUpdate
+from typing import AsyncIterator
+
+from src.core.domain.book import Book, BookCreate, BookFacets, BookField, BookImport, CounterMismatch, BookSummary, BookUpdate, ImportReport, ImportRowError, MatchMode
 from src.core.domain.book_copy import BookCopyCreate, BookCopyStatus
+from src.core.domain.batch import Batch
+from src.core.domain.page import Page
 from src.core.repositories.ibook import IBookRepository
 from src.infrastructure.services.ibook import IBookService
-from src.core.exceptions.exceptions import BookBorrowed, ISBNAlreadyExist
+from src.core.exceptions.exceptions import BookBorrowed, InvalidBookData, ISBNAlreadyExist
 from src.infrastructure.services.iunit_of_work import IUnitOfWork
+from src.infrastructure.utils.icache import ICache
+from src.infrastructure.utils.consts import COUNTER_FOLD_BATCH_SIZE, DEFAULT_PAGE_SIZE, FUZZY_MATCH_LIMIT, IMPORT_BATCH_SIZE
 
 class BookService(IBookService):
     """A class implementing the book service"""
 
-    def __init__(self, uow: IUnitOfWork):
+    def __init__(
+        self,
+        uow: IUnitOfWork,
+        facet_cache: ICache,
+        book_cache: ICache,
+        read_uow: IUnitOfWork | None = None,
+    ):
         self._uow = uow
+        # Lookups feeding the book cache stay on the primary, a lagging
+        # replica row would otherwise be cached for the whole TTL.
+        self._read_uow = read_uow or uow
+        self._facet_cache = facet_cache
+        self._book_cache = book_cache
     
-    async def get_all_books(self) -> list[Book]:
-        """The method getting all books from the repository.
+    async def get_all_books(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
+        """The method getting a page of books from the repository.
+
+        Args:
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[Book]: The collection of the all books.
+            Page[Book]: The page of books.
         """
-        async with self._uow:
-            return await self._uow.book_repository.get_all_books()
+        async with self._read_uow:
+            return await self._read_uow.book_repository.get_all_books(limit, after, with_availability, fields)
 
 
     async def get_book_by_id(self, book_id: int) -> Book | None:
@@ -32,8 +58,37 @@ class BookService(IBookService):
         Returns:
             Book | None: The book data if exists.
         """
-        async with self._uow:
-            return await self._uow.book_repository.get_book_by_id(book_id)
+        book = self._book_cache.get(("id", book_id))
+        if book is None:
+            generation = self._book_cache.generation()
+            async with self._uow:
+                book = await self._uow.book_repository.get_book_by_id(book_id)
+            if book:
+                self._book_cache.set(("id", book_id), book, generation)
+        return book
+
+    async def get_books_by_ids(self, book_ids: list[int]) -> Batch[Book, int]:
+        """The method getting many books from the repository at once.
+            Books missing in the lookup cache are read with a single query.
+
+        Args:
+            book_ids (list[int]): The ids of the books.
+
+        Returns:
+            Batch[Book, int]: The books in the order of `book_ids` with the ids not found.
+        """
+        book_ids = list(dict.fromkeys(book_ids))
+        books = [book for book_id in book_ids if (book := self._book_cache.get(("id", book_id)))]
+        cached = {book.book_id for book in books}
+        uncached = [book_id for book_id in book_ids if book_id not in cached]
+        if uncached:
+            generation = self._book_cache.generation()
+            async with self._uow:
+                found = await self._uow.book_repository.get_books_by_ids(uncached)
+            for book in found:
+                self._book_cache.set(("id", book.book_id), book, generation)
+            books.extend(found)
+        return Batch.from_items(book_ids, books, key=lambda book: book.book_id)
 
     async def get_book_by_title(self, title: str) -> list[Book]:
         """The method getting book by the title from the repository.
@@ -44,8 +99,8 @@ class BookService(IBookService):
         Returns:
             list[Book]: The collection of the all books with this title
         """
-        async with self._uow:
-            return await self._uow.book_repository.get_book_by_title(title)
+        async with self._read_uow:
+            return await self._read_uow.book_repository.get_book_by_title(title)
 
     async def get_book_by_author(self, author: str) -> list[Book]:
         """The method getting book by the author from the repository.
@@ -56,9 +111,54 @@ class BookService(IBookService):
         Returns:
             list[Book]: The collection of the all books written  by this author
         """
-        async with self._uow:
-            return await self._uow.book_repository.get_book_by_author(author)
+        async with self._read_uow:
+            return await self._read_uow.book_repository.get_book_by_author(author)
         
+    async def fuzzy_search_by_title(self, title: str, limit: int = FUZZY_MATCH_LIMIT) -> list[Book]:
+        """The method getting books with a title similar to the given one from the repository.
+
+        Args:
+            title (str): The (possibly misspelled or partial) title of the book.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[Book]: The collection of similar books, most similar first.
+        """
+        async with self._read_uow:
+            return await self._read_uow.book_repository.fuzzy_search_by_title(title, limit)
+
+    async def fuzzy_search_by_author(self, author: str, limit: int = FUZZY_MATCH_LIMIT) -> list[Book]:
+        """The method getting books with an author similar to the given one from the repository.
+
+        Args:
+            author (str): The (possibly misspelled or partial) author name.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[Book]: The collection of books by similar authors, most similar first.
+        """
+        async with self._read_uow:
+            return await self._read_uow.book_repository.fuzzy_search_by_author(author, limit)
+
+    async def search_books(
+        self, query: str, limit: int = DEFAULT_PAGE_SIZE, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
+        """The method full-text searching books in the repository.
+
+        Args:
+            query (str): The search phrase.
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
+
+        Returns:
+            Page[Book]: The page of matching books, best ranked first.
+        """
+        async with self._read_uow:
+            return await self._read_uow.book_repository.search_books(query, limit, after, with_availability, fields)
+
     async def get_book_by_isbn(self, isbn: str) -> Book | None:
         """The method getting book by isbn from the repository.
         
@@ -68,31 +168,95 @@ class BookService(IBookService):
         Returns:
             Book | None: The book data if exist.
         """
+        # The isbn entry only points at the book id, so edits invalidate a single entry.
+        book_id = self._book_cache.get(("isbn", isbn))
+        if book_id is not None:
+            book = self._book_cache.get(("id", book_id))
+            if book and book.isbn == isbn:
+                return book
+        generation = self._book_cache.generation()
         async with self._uow:
-            return await self._uow.book_repository.get_book_by_isbn(isbn)
+            book = await self._uow.book_repository.get_book_by_isbn(isbn)
+        if book:
+            self._book_cache.set(("id", book.book_id), book, generation)
+            self._book_cache.set(("isbn", isbn), book.book_id, generation)
+        return book
     
     async def filter_books(
-        self, 
-        author: str | None = None,
-        subject: str | None = None,
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
         publisher: str | None = None,
         publication_year: int | None = None,
         language: str | None = None,
-    ) -> list[Book]:
+        match: MatchMode = MatchMode.all,
+        with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
         """The method getting filtered books by chosen parameter
         
         Args:
-            author: str | None = None,
-            subject: str | None = None,
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
             publisher: str | None = None,
             publication_year: int | None = None,
             language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[Book]: The collection of the all books which match the parameters.
+            Page[Book]: The page of books which match the parameters, ordered by id.
         """
-        async with self._uow:
-            return await self._uow.book_repository.filter_books(author, subject, publisher, publication_year, language)
+        async with self._read_uow:
+            return await self._read_uow.book_repository.filter_books(
+                limit, after, author, subject, publisher, publication_year, language, match, with_availability, fields
+            )
+
+
+    async def get_facets(
+        self, 
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
+        publisher: str | None = None,
+        publication_year: int | None = None,
+        language: str | None = None,
+        match: MatchMode = MatchMode.all,
+    ) -> BookFacets:
+        """The method counting books per facet value for the chosen filters.
+            Facets are subject, language, publisher and publication year.
+        
+        Args:
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
+            publisher: str | None = None,
+            publication_year: int | None = None,
+            language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+        
+        Returns:
+            BookFacets: The book counts per value of every facet, most frequent first.
+        """
+        key = (
+            tuple(sorted(author or ())),
+            tuple(sorted(subject or ())),
+            publisher,
+            publication_year,
+            language,
+            match,
+        )
+        facets = self._facet_cache.get(key)
+        if facets is None:
+            async with self._read_uow:
+                facets = await self._read_uow.book_repository.get_facets(
+                    author, subject, publisher, publication_year, language, match
+                )
+            self._facet_cache.set(key, facets)
+        return facets
 
 
     async def add_book(self, data: BookCreate, default_copies_location, copies_count: int = 1) -> Book | None:
@@ -110,10 +274,40 @@ class BookService(IBookService):
             if await self._uow.book_repository.get_book_by_isbn(data.isbn):
                 raise ISBNAlreadyExist()
             book = await self._uow.book_repository.add_book(data)
-            if copies_count > 0:
-                for i in range(copies_count):
-                    await self._uow.copy_repository.add_book_copy(BookCopyCreate(book_id=book.book_id,location=default_copies_location))
-            return book
+            await self._uow.copy_repository.add_book_copies(book.book_id, default_copies_location, copies_count)
+        self._invalidate(book.book_id)
+        return book
+
+    async def import_books(
+        self,
+        records: AsyncIterator[tuple[int, BookImport | str]],
+        default_copies_location: str | None = None,
+    ) -> ImportReport:
+        """The method importing a stream of books with their copies to the repository (Intended for librarian).
+            Records are written in batches, each batch in its own transaction.
+
+        Args:
+            records (AsyncIterator[tuple[int, BookImport | str]]): The line numbers with
+                validated records or the reasons they were rejected.
+            default_copies_location (str | None): The location of copies without their own.
+
+        Returns:
+            ImportReport: The number of imported books and copies with the rejected records.
+        """
+        report = ImportReport()
+        batch = []
+        async for line, record in records:
+            if isinstance(record, str):
+                report.errors.append(ImportRowError(line=line, error=record))
+                continue
+            batch.append((line, record))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await self._import_batch(batch, default_copies_location, report)
+                batch = []
+        if batch:
+            await self._import_batch(batch, default_copies_location, report)
+        report.errors.sort(key=lambda error: error.line)
+        return report
 
     async def update_book(self, book_id: int, data: BookUpdate) -> Book | None:
         """The method updating book data in the repository (Intended for librarian).
@@ -129,10 +323,10 @@ class BookService(IBookService):
             if await self._uow.book_repository.get_book_by_isbn(data.isbn):
                 raise ISBNAlreadyExist()
             updated_book = await self._uow.book_repository.update_book(book_id, data)
-            if not updated_book:
-                return None
-            return updated_book
-
+        self._invalidate(book_id)
+        if not updated_book:
+            return None
+        return updated_book
 
     async def remove_book(self, book_id: int) -> bool:
         """The method removing book and all its copies (BookCopy)  from the repository.
@@ -148,12 +342,126 @@ class BookService(IBookService):
             unavailable = [c for c in copies if c.status != BookCopyStatus.available]
             if unavailable:
                 raise BookBorrowed()
-            return await self._uow.book_repository.delete_book(book_id)
+            deleted = await self._uow.book_repository.delete_book(book_id)
+        self._invalidate(book_id)
+        return deleted
 
-    
+    async def reconcile_counters(self, fix: bool = False) -> list[CounterMismatch]:
+        """The method verifying the books copies counters against their copies.
 
-    
-    
+        Args:
+            fix (bool): Whether to overwrite the wrong counters.
+
+        Returns:
+            list[CounterMismatch]: The books whose counters were wrong.
+        """
+        async with self._uow:
+            mismatches = await self._uow.book_repository.find_counter_mismatches()
+            if fix:
+                await self._uow.book_repository.reset_counters(mismatches)
+        return mismatches
+
+    async def fold_copy_counters(self, batch_size: int = COUNTER_FOLD_BATCH_SIZE) -> int:
+        """The method folding all pending copies counters deltas into their books.
+            Every batch is committed in its own transaction, keeping book row locks short.
+
+        Args:
+            batch_size (int): Maximum number of deltas folded in one transaction.
+
+        Returns:
+            int: The number of folded deltas.
+        """
+        folded = 0
+        while True:
+            async with self._uow:
+                count = await self._uow.book_repository.fold_copy_counters(batch_size)
+            folded += count
+            if count < batch_size:
+                return folded
 
+    def cache_stats(self) -> dict[str, int]:
+        """The method returning the book lookup cache counters.
 
-    
\ No newline at end of file
+        Returns:
+            dict[str, int]: The number of hits, misses and cached entries.
+        """
+        return self._book_cache.stats()
+
+    async def _import_batch(
+        self,
+        batch: list[tuple[int, BookImport]],
+        default_copies_location: str | None,
+        report: ImportReport,
+    ) -> None:
+        """A private method writing a batch of imported books and their copies.
+            Books with an ISBN already in the catalog (or earlier in the batch) are rejected.
+            If the database rejects a book of the batch (e.g. its ISBN was inserted
+            concurrently), the batch is written again row by row to report the failing rows.
+
+        Args:
+            batch (list[tuple[int, BookImport]]): The line numbers with the records.
+            default_copies_location (str | None): The location of copies without their own.
+            report (ImportReport): The report updated with the outcome of the batch.
+        """
+        isbns = [book.isbn for _, book in batch if book.isbn]
+        async with self._uow:
+            existing = await self._uow.book_repository.get_existing_isbns(isbns)
+            accepted = []
+            for line, book in batch:
+                if book.isbn:
+                    if book.isbn in existing:
+                        report.errors.append(ImportRowError(line=line, isbn=book.isbn, error="ISBN already exists"))
+                        continue
+                    existing.add(book.isbn)
+                accepted.append((line, book))
+            try:
+                await self._import_rows(accepted, default_copies_location, report)
+            except (ISBNAlreadyExist, InvalidBookData):
+                for line, book in accepted:
+                    try:
+                        await self._import_rows([(line, book)], default_copies_location, report)
+                    except ISBNAlreadyExist:
+                        report.errors.append(ImportRowError(line=line, isbn=book.isbn, error="ISBN already exists"))
+                    except InvalidBookData as e:
+                        report.errors.append(ImportRowError(line=line, isbn=book.isbn, error=e.reason or "Invalid book data"))
+
+    async def _import_rows(
+        self,
+        rows: list[tuple[int, BookImport]],
+        default_copies_location: str | None,
+        report: ImportReport,
+    ) -> None:
+        """A private method inserting books with their copies in a savepoint,
+            a failure rolls back only these rows.
+
+        Args:
+            rows (list[tuple[int, BookImport]]): The line numbers with the records.
+            default_copies_location (str | None): The location of copies without their own.
+            report (ImportReport): The report updated once the rows are written.
+
+        Raises:
+            ISBNAlreadyExist: If one of the ISBNs was inserted in the meantime.
+            InvalidBookData: If the database rejected one of the books.
+        """
+        async with self._uow.savepoint():
+            book_ids = await self._uow.book_repository.add_books(
+                [BookCreate.model_validate(book.model_dump(exclude={"copies_count", "location"})) for _, book in rows]
+            )
+            copies = [
+                BookCopyCreate(book_id=book_id, location=book.location or default_copies_location)
+                for book_id, (_, book) in zip(book_ids, rows)
+                for _ in range(book.copies_count)
+            ]
+            copies_count = await self._uow.copy_repository.add_copies(copies)
+        report.imported += len(rows)
+        report.copies += copies_count
+
+    def _invalidate(self, book_id: int) -> None:
+        """A private method dropping a book from the lookup cache.
+            Called after the unit of work is committed, so the next read sees the change;
+            reads started before it skip caching what they read.
+
+        Args:
+            book_id (int): The book id.
+        """
+        self._book_cache.delete(("id", book_id))
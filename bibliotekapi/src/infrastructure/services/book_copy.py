@@ -1,10 +1,11 @@
 """Module containing book copy service implementation"""
 
-from src.core.domain.book_copy import BookCopy, BookCopyCreate, BookCopyStatus, BookCopyUpdate
+from src.core.domain.batch import Batch
+from src.core.domain.book_copy import BookCopy, BookCopyCreate, BookCopyStatus, BookCopyUpdate, CopyTransition
 from src.core.repositories.ibook_copy import IBookCopyRepository
 from src.infrastructure.services.ibook_copy import IBookCopyService
 from src.infrastructure.services.iunit_of_work import IUnitOfWork
-from src.core.exceptions.exceptions import CopyNotAvailable
+from src.core.exceptions.exceptions import BookNotFound, CopyNotAvailable
 
 class BookCopyService(IBookCopyService):
     """A class implementing the book copy service"""
@@ -37,6 +38,20 @@ class BookCopyService(IBookCopyService):
             return await self._uow.copy_repository.get_book_copy_by_id(copy_id)
 
 
+    async def get_copies_by_ids(self, copy_ids: list[int]) -> Batch[BookCopy, int]:
+        """The method getting many book copies from the repository at once. (Intended for librarian use).
+
+        Args:
+            copy_ids (list[int]): The ids of the book copies.
+
+        Returns:
+            Batch[BookCopy, int]: The copies in the order of `copy_ids` with the ids not found.
+        """
+        copy_ids = list(dict.fromkeys(copy_ids))
+        async with self._uow:
+            copies = await self._uow.copy_repository.get_copies_by_ids(copy_ids)
+        return Batch.from_items(copy_ids, copies, key=lambda copy: copy.copy_id)
+
     async def get_copies_by_book(self, book_id: int, status: BookCopyStatus | None = None, ) -> list[BookCopy]:
         """The method getting book copies of a specific book from the repository. (Intended for librarian use).
             Optionally filter by status.
@@ -51,8 +66,23 @@ class BookCopyService(IBookCopyService):
         async with self._uow:
             return await self._uow.copy_repository.get_copies_by_book(book_id, status)
 
+    async def get_copies_fingerprint(self, book_id: int, status: BookCopyStatus | None = None) -> str:
+        """The method getting a digest of a specific book copies from the repository.
+            Optionally filter by status.
+
+        Args:
+            book_id (int): The id of the book to compute the digest for.
+            status (BookCopyStatus | None): status of the copy e.g available.
+
+        Returns:
+            str: The digest, changing whenever a copy is added, removed or updated.
+        """
+        async with self._uow:
+            return await self._uow.copy_repository.get_copies_fingerprint(book_id, status)
+
     async def add_book_copy(self, data: BookCopyCreate) -> BookCopy | None:
         """The method adding new book copy to the repository. (Intended for librarian use).
+            The copy is reserved for the next user waiting for the book, if any.
             
         Args:
             data (BookCopyCreate): The attributes of the book copy.
@@ -63,22 +93,63 @@ class BookCopyService(IBookCopyService):
             new_copy = await self._uow.copy_repository.add_book_copy(data)
             if not new_copy:
                 return None
+            await self._allocate_to_holds([new_copy])
             return new_copy
 
+    async def add_book_copies(self, book_id: int, location: str | None, count: int) -> list[BookCopy]:
+        """The method adding many copies of a book to the repository at once. (Intended for librarian).
+            The copies are reserved for the users waiting for the book, in the queue order.
+
+        Args:
+            book_id (int): The id of the book.
+            location (str | None): The location of the copies.
+            count (int): Number of copies to create.
+
+        Raises:
+            BookNotFound: If the book does not exist.
+
+        Returns:
+            list[BookCopy]: The newly created book copies.
+        """
+        async with self._uow:
+            if await self._uow.book_repository.get_book_version(book_id) is None:
+                raise BookNotFound()
+            copies = await self._uow.copy_repository.add_book_copies(book_id, location, count)
+            await self._allocate_to_holds(copies)
+            return copies
+
     async def update_book_copy(self, copy_id: int, data: BookCopyUpdate) -> BookCopy | None:
         """The abstract updating book copy  data in the repository.(Intended for librarian use).
+            A status change is applied as the `restore` transition, with a conditional update,
+            and the restored copy is reserved for the next user waiting for the book, if any.
         
         Args:
             copy_id (int): The book copy  id.
             data (BookCopyUpdate): The attributes of the book copy.
 
+        Raises:
+            CopyNotAvailable: If the copy still backs an active reservation or loan.
+
         Returns:
             BookCopy | None: The updated book copy.
         """
         async with self._uow:
-            updated_copy = await self._uow.copy_repository.update_book_copy(copy_id, data)
+            updated_copy = None
+            if data.status is not None:
+                updated_copy = await self._uow.copy_repository.transition_copy(copy_id, CopyTransition.restore)
+                if updated_copy:
+                    await self._allocate_to_holds([updated_copy])
+                else:
+                    current = await self._uow.copy_repository.get_book_copy_by_id(copy_id)
+                    if not current:
+                        return None
+                    if current.status != data.status:
+                        raise CopyNotAvailable(reason="copy_in_use")
+            if "location" in data.model_fields_set:
+                updated_copy = await self._uow.copy_repository.update_book_copy(
+                    copy_id, BookCopyUpdate(location=data.location))
             if not updated_copy:
-                return None
+                return await self._uow.copy_repository.get_book_copy_by_id(copy_id)
             return updated_copy
 
     async def remove_book_copy(self, copy_id: int) -> bool:
@@ -91,10 +162,20 @@ class BookCopyService(IBookCopyService):
             bool: Success of the operation.
         """
         async with self._uow:
-            available = await self._uow.copy_repository.get_book_copy_by_id(copy_id)
-            if available.status != BookCopyStatus.available:
-                raise CopyNotAvailable()
-            copy = await self._uow.copy_repository.delete_book_copy(copy_id)
-            if not copy:
+            if await self._uow.copy_repository.delete_book_copy(copy_id, BookCopyStatus.available):
+                return True
+            if not await self._uow.copy_repository.get_book_copy_by_id(copy_id):
                 return False
-            return True
\ No newline at end of file
+            raise CopyNotAvailable()
+
+    async def _allocate_to_holds(self, copies: list[BookCopy]) -> None:
+        """A private method reserving new or restored copies of a book for the users waiting for it.
+            Stops at the first copy nobody is waiting for.
+
+        Args:
+            copies (list[BookCopy]): The new, available copies of one book.
+        """
+        for copy in copies:
+            if not await self._uow.hold_repository.allocate_copy(copy.copy_id):
+                return
+            copy.status = BookCopyStatus.reserved
@@ -2,34 +2,98 @@
 
 from pydantic import UUID4
 from datetime import datetime, timedelta
+from typing import AsyncIterator
 
 from src.infrastructure.dto.historydto import HistoryDTO
-from src.core.domain.history import HistoryCreate, HistoryStatus
-from src.core.domain.book_copy import BookCopyStatus
-from src.core.domain.reservation import ReservationStatus
+from src.core.domain.history import CheckoutFailure, HistoryStatus, OverdueUser
+from src.core.domain.book_copy import CopyTransition
+from src.core.domain.page import Page
 from src.core.repositories.ihistory import IHistoryRepository
 from src.infrastructure.services.iunit_of_work import IUnitOfWork
 from src.infrastructure.services.ihistory import IHistoryService
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE
 from src.core.exceptions.exceptions import CopyNotFound, UserNotFound, CopyNotAvailable, BookNotBorrowed
 
 class HistoryService(IHistoryService):
     """A class implementing history service"""
 
-    def __init__(self, uow: IUnitOfWork ):
-            self._uow = uow
-
-    async def get_all_history(self, status: HistoryStatus | None = None) -> list[HistoryDTO]:
-        """The method getting all history from the repository (Intendend for Librarian use).
+    def __init__(self, uow: IUnitOfWork, read_uow: IUnitOfWork | None = None):
+        self._uow = uow
+        self._read_uow = read_uow or uow
+
+    async def get_all_history(
+        self,
+        status: HistoryStatus | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Page[HistoryDTO]:
+        """The method getting a page of history from the repository (Intendend for Librarian use).
             Optionally filter by status.
 
         Args:
             status: HistoryStatus | None = None: status of a book in history record.
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
+        Returns:
+            Page[HistoryDTO]: The page of history data.
+        """
+        async with self._read_uow:
+            page = await self._read_uow.history_repository.get_all_history(limit=limit, after=after, status=status)
+            return Page(
+                items=[HistoryDTO.from_domain(h) for h in page.items],
+                next_cursor=page.next_cursor,
+            )
+
+    async def export_history(self, status: HistoryStatus | None = None) -> AsyncIterator[HistoryDTO]:
+        """The method streaming all history from the repository for export (Intendend for Librarian use).
+            Optionally filter by status. The unit of work stays open until the iterator is exhausted.
+
+        Args:
+            status: HistoryStatus | None = None: status of a book in history record.
+        Returns:
+            AsyncIterator[HistoryDTO]: The iterator over all history data.
+        """
+        async with self._read_uow:
+            async for h in self._read_uow.history_repository.stream_history(status):
+                yield HistoryDTO.from_domain(h)
+
+    async def get_overdue_history(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Page[HistoryDTO]:
+        """The method getting a page of loans past their due date (Intended for Librarian use).
+
+        Args:
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[HistoryDTO]: The page of overdue loans, the longest overdue first.
+        """
+        async with self._read_uow:
+            page = await self._read_uow.history_repository.get_overdue_history(datetime.now(), limit, after)
+            return Page(
+                items=[HistoryDTO.from_domain(h) for h in page.items],
+                next_cursor=page.next_cursor,
+            )
+
+    async def get_overdue_users(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Page[OverdueUser]:
+        """The method getting a page of users with loans past their due date (Intended for Librarian use).
+
+        Args:
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
+
         Returns:
-            list[HistoryDTO]: The collection of all history data.
+            Page[OverdueUser]: The page of users with their overdue loans.
         """
-        async with self._uow:
-            history = await self._uow.history_repository.get_all_history(status)
-            return [HistoryDTO.model_validate(h) for h in history]
+        async with self._read_uow:
+            return await self._read_uow.history_repository.get_overdue_users(datetime.now(), limit, after)
 
     async def get_history_by_user(self, user_id: UUID4, status: HistoryStatus | None = None) -> list[HistoryDTO]:
        """The method getting a history for a given user from the repository (Intendend for Librarian use).
@@ -42,9 +106,9 @@ class HistoryService(IHistoryService):
         Returns:
             list[HistoryDTO]: The collection of history data for a given user.
         """
-       async with self._uow:
-        history = await self._uow.history_repository.get_history_by_user(user_id, status)
-        return [HistoryDTO.model_validate(h) for h in history]
+       async with self._read_uow:
+        history = await self._read_uow.history_repository.get_history_by_user(user_id, status)
+        return [HistoryDTO.from_domain(h) for h in history]
 
     async def get_user_history(self, user_id: UUID4, status: HistoryStatus | None = None) -> list[HistoryDTO]:
        """The method getting a borrowing history for the currently authenticated user.
@@ -57,15 +121,21 @@ class HistoryService(IHistoryService):
         Returns:
             list[HistoryDTO]: The collection of history data for a given user.
         """
-       async with self._uow:
-        history = await self._uow.history_repository.get_history_by_user(user_id, status)
-        return [HistoryDTO.model_validate(h) for h in history]
+       async with self._read_uow:
+        history = await self._read_uow.history_repository.get_history_by_user(user_id, status)
+        return [HistoryDTO.from_domain(h) for h in history]
 
     async def mark_as_returned(self, history_id: int) -> HistoryDTO | None:
        """The method changing borrowed book status to returned (Intended for librarian).
+            The copy is checked in with a conditional update, so concurrent returns
+            of the same copy can not both succeed.
 
         Args:
             history_id (int): The history record id.    
+
+        Raises:
+            BookNotBorrowed: If the record or its copy is not borrowed anymore.
+            CopyNotFound: If the copy does not exist.
         
         Returns:
             HistoryDTO | None: Updated history data.
@@ -74,47 +144,43 @@ class HistoryService(IHistoryService):
             history = await self._uow.history_repository.get_history_by_id(history_id)
             if not history:
                 return None
-            history.status = HistoryStatus.returned
-            copy = await self._uow.copy_repository.get_book_copy_by_id(history.copy_id)
+            if history.status != HistoryStatus.borrowed:
+                raise BookNotBorrowed()
+            copy = await self._uow.copy_repository.transition_copy(history.copy_id, CopyTransition.checkin)
             if not copy:
-                raise CopyNotFound()
-            copy.status = BookCopyStatus.available
-            await self._uow.copy_repository.update_book_copy(copy.copy_id, copy)
+                if not await self._uow.copy_repository.get_book_copy_by_id(history.copy_id):
+                    raise CopyNotFound()
+                raise BookNotBorrowed()
+            await self._uow.hold_repository.allocate_copy(copy.copy_id)
+            history.status = HistoryStatus.returned
             updated_history = await self._uow.history_repository.update_history(history_id, history)
-            return HistoryDTO.model_validate(updated_history) if updated_history else None
+            return HistoryDTO.from_domain(updated_history) if updated_history else None
             
     async def mark_as_borrowed(self, user_id: UUID4, copy_id: int) -> HistoryDTO | None:
        """The method marking book as borrowed in history record.
+            The checkout is a single atomic statement.
 
         Args:
             user_id (UUID4): The user id.
             copy_id (int): The book id.
 
+        Raises:
+            UserNotFound: If the user does not exist.
+            CopyNotFound: If the copy does not exist.
+            CopyNotAvailable: If the copy is borrowed or reserved for another user, with the reason.
+
         Returns:
             HistoryDTO | None: New history data.
         """
        async with self._uow:
-            user = await self._uow.user_repository.get_user_by_uuid(user_id)
-            copy = await self._uow.copy_repository.get_book_copy_by_id(copy_id)
-            
-            if not user:
+            result = await self._uow.history_repository.checkout(user_id, copy_id)
+            if result.failure is CheckoutFailure.user_not_found:
                 raise UserNotFound()
-            if not copy:
+            if result.failure is CheckoutFailure.copy_not_found:
                 raise CopyNotFound()
-            reservation = await self._uow.reservation_repository.get_reservation_by_user_and_copy(
-            user_id, copy_id)
-            if copy.status == BookCopyStatus.borrowed:
-                raise CopyNotAvailable()
-            if copy.status == BookCopyStatus.reserved and not reservation:
-                raise CopyNotAvailable()
-            copy.status = BookCopyStatus.borrowed
-            await self._uow.copy_repository.update_book_copy(copy_id, copy)
-            history = await self._uow.history_repository.add_history(HistoryCreate(user_id=user_id, copy_id=copy_id))
-            reservation = await self._uow.reservation_repository.get_reservation_by_user_and_copy(user_id, copy_id)
-            if reservation:
-                    reservation.status = ReservationStatus.collected
-                    await self._uow.reservation_repository.update_reservation(reservation.reservation_id, reservation)
-            return HistoryDTO.model_validate(history) if history else None
+            if result.failure:
+                raise CopyNotAvailable(reason=result.failure)
+            return HistoryDTO.from_domain(result.history)
             
     async def prolong_borrowing_period(self, history_id: int, period: int = 7 ) -> HistoryDTO | None:
        """The method extending the borrowing due date.
@@ -134,5 +200,5 @@ class HistoryService(IHistoryService):
                 raise BookNotBorrowed()
             history.due_date = history.due_date + timedelta(days=period)
             updated_history = await self._uow.history_repository.update_history(history_id, history)
-            return HistoryDTO.model_validate(updated_history)
+            return HistoryDTO.from_domain(updated_history)
             
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""Module containing hold service implementation"""
+
+from pydantic import UUID4
+
+from src.core.domain.book_copy import CopyTransition
+from src.core.domain.hold import Hold, HoldStatus
+from src.core.domain.reservation import ReservationCreate
+from src.core.exceptions.exceptions import BookNotFound, HoldAlreadyExist, UserNotFound
+from src.infrastructure.dto.holddto import HoldDTO
+from src.infrastructure.services.ihold import IHoldService
+from src.infrastructure.services.iunit_of_work import IUnitOfWork
+
+
+class HoldService(IHoldService):
+    """Class implementing hold service."""
+
+    def __init__(self, uow: IUnitOfWork, read_uow: IUnitOfWork | None = None):
+        self._uow = uow
+        self._read_uow = read_uow or uow
+
+    async def get_hold_by_id(self, hold_id: int) -> HoldDTO | None:
+        """The method getting a hold from the repository.
+
+        Args:
+            hold_id (int): The id of the hold.
+
+        Returns:
+            HoldDTO | None: The hold data with its place in the queue if exists.
+        """
+        async with self._read_uow:
+            hold = await self._read_uow.hold_repository.get_hold_by_id(hold_id)
+            return HoldDTO.from_domain(hold) if hold else None
+
+    async def get_holds_by_user(self, user_id: UUID4, status: HoldStatus | None = None) -> list[HoldDTO]:
+        """The method getting holds of a given user from the repository.
+            Optionally filter by status.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            status (HoldStatus | None): The hold status.
+
+        Returns:
+            list[HoldDTO]: The collection of holds with their places in the queues.
+        """
+        async with self._read_uow:
+            holds = await self._read_uow.hold_repository.get_holds_by_user(user_id, status)
+            return [HoldDTO.from_domain(hold) for hold in holds]
+
+    async def get_book_queue(self, book_id: int) -> list[HoldDTO]:
+        """The method getting the queue of a book (Intended for Librarian use).
+
+        Args:
+            book_id (int): The id of the book.
+
+        Returns:
+            list[HoldDTO]: The waiting holds in the queue order.
+        """
+        async with self._read_uow:
+            holds = await self._read_uow.hold_repository.get_book_queue(book_id)
+            return [HoldDTO.from_domain(hold) for hold in holds]
+
+    async def place_hold(self, book_id: int, user_id: UUID4) -> HoldDTO:
+        """The method placing a user in the queue of a book.
+            If a copy is available, it is reserved right away and the hold is fulfilled.
+
+        Args:
+            book_id (int): The id of the book.
+            user_id (UUID4): The id of the user.
+
+        Raises:
+            HoldAlreadyExist: If the user is already waiting for the book.
+
+        Returns:
+            HoldDTO: The new hold with its place in the queue.
+        """
+        async with self._uow:
+            user = await self._uow.user_repository.get_user_by_uuid(user_id=user_id)
+            if not user:
+                raise UserNotFound()
+            book = await self._uow.book_repository.get_book_by_id(book_id=book_id)
+            if not book:
+                raise BookNotFound()
+            # A copy released meanwhile is either claimed here or, once the hold
+            # is waiting, allocated to it: allocations take the same lock.
+            await self._uow.hold_repository.lock_queue(book_id)
+            if await self._uow.hold_repository.has_waiting_hold(book_id, user_id):
+                raise HoldAlreadyExist()
+            hold = Hold(user_id=user_id, book_id=book_id)
+            copy = await self._uow.copy_repository.claim_available_copy(book_id, CopyTransition.reserve)
+            if copy:
+                reservation = await self._uow.reservation_repository.add_reservation(
+                    ReservationCreate(user_id=user_id, copy_id=copy.copy_id))
+                hold.status = HoldStatus.fulfilled
+                hold.reservation_id = reservation.reservation_id
+            hold = await self._uow.hold_repository.add_hold(hold)
+            return HoldDTO.from_domain(hold)
+
+    async def cancel_hold(self, hold_id: int, user_id: UUID4) -> HoldDTO | None:
+        """The method removing a user from the queue of a book.
+
+        Args:
+            hold_id (int): The id of the hold.
+            user_id (UUID4): The id of the user owning the hold.
+
+        Returns:
+            HoldDTO | None: The canceled hold, None if no such waiting hold exists.
+        """
+        async with self._uow:
+            hold = await self._uow.hold_repository.cancel_hold(hold_id, user_id)
+            return HoldDTO.from_domain(hold) if hold else None
@@ -1,18 +1,31 @@
 """Module containing book service abstractions"""
 
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
-from src.core.domain.book import Book, BookCreate, BookUpdate
+from src.core.domain.book import Book, BookCreate, BookFacets, BookField, BookImport, CounterMismatch, BookSummary, BookUpdate, ImportReport, MatchMode
+from src.core.domain.batch import Batch
+from src.core.domain.page import Page
+from src.infrastructure.utils.consts import COUNTER_FOLD_BATCH_SIZE, DEFAULT_PAGE_SIZE, FUZZY_MATCH_LIMIT
 
 class IBookService(ABC):
     """An abstract class representing protocol of book service"""
 
     @abstractmethod
-    async def get_all_books(self) -> list[Book]:
-        """The abstract getting all books from the repository.
+    async def get_all_books(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
+        """The abstract getting a page of books from the repository.
+
+        Args:
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[Book]: The collection of the all books.
+            Page[Book]: The page of books.
         """
 
     @abstractmethod
@@ -26,6 +39,17 @@ class IBookService(ABC):
             Book | None: The book data if exists.
         """
 
+    @abstractmethod
+    async def get_books_by_ids(self, book_ids: list[int]) -> Batch[Book, int]:
+        """The abstract getting many books from the repository at once.
+
+        Args:
+            book_ids (list[int]): The ids of the books.
+
+        Returns:
+            Batch[Book, int]: The books in the order of `book_ids` with the ids not found.
+        """
+
     @abstractmethod
     async def get_book_by_title(self, title: str) -> list[Book]:
         """The abstract getting book by the title from the repository.
@@ -48,6 +72,48 @@ class IBookService(ABC):
             list[Book]: The collection of the all books written  by this author
         """
 
+    @abstractmethod
+    async def fuzzy_search_by_title(self, title: str, limit: int = FUZZY_MATCH_LIMIT) -> list[Book]:
+        """The abstract getting books with a title similar to the given one from the repository.
+
+        Args:
+            title (str): The (possibly misspelled or partial) title of the book.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[Book]: The collection of similar books, most similar first.
+        """
+
+    @abstractmethod
+    async def fuzzy_search_by_author(self, author: str, limit: int = FUZZY_MATCH_LIMIT) -> list[Book]:
+        """The abstract getting books with an author similar to the given one from the repository.
+
+        Args:
+            author (str): The (possibly misspelled or partial) author name.
+            limit (int): Maximum number of books to return.
+
+        Returns:
+            list[Book]: The collection of books by similar authors, most similar first.
+        """
+
+    @abstractmethod
+    async def search_books(
+        self, query: str, limit: int = DEFAULT_PAGE_SIZE, after: str | None = None, with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
+        """The abstract full-text searching books in the repository.
+
+        Args:
+            query (str): The search phrase.
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
+
+        Returns:
+            Page[Book]: The page of matching books, best ranked first.
+        """
+
     @abstractmethod
     async def get_book_by_isbn(self, isbn: str) -> Book | None:
         """The abstract getting book by isbn from the repository.
@@ -62,24 +128,59 @@ class IBookService(ABC):
     
     @abstractmethod
     async def filter_books(
-        self, 
-        author: str | None = None,
-        subject: str | None = None,
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
         publisher: str | None = None,
         publication_year: int | None = None,
         language: str | None = None,
-    ) -> list[Book]:
+        match: MatchMode = MatchMode.all,
+        with_availability: bool = False,
+        fields: list[BookField] | None = None,
+    ) -> Page[Book | BookSummary]:
         """The abstract getting filtered books by chosen parameter
         
         Args:
-            author: str | None = None,
-            subject: str | None = None,
+            limit (int): Maximum number of books on the page.
+            after (str | None): The cursor of the previous page.
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
             publisher: str | None = None,
             publication_year: int | None = None,
             language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+            with_availability (bool): Whether to add total and available copies counts.
+            fields (list[BookField] | None): The attributes to return (as `BookSummary`), all when None.
         
         Returns:
-            list[Book]: The collection of the all books which match the parameters.
+            Page[Book]: The page of books which match the parameters, ordered by id.
+        """
+
+    @abstractmethod
+    async def get_facets(
+        self, 
+        author: list[str] | None = None,
+        subject: list[str] | None = None,
+        publisher: str | None = None,
+        publication_year: int | None = None,
+        language: str | None = None,
+        match: MatchMode = MatchMode.all,
+    ) -> BookFacets:
+        """The abstract counting books per facet value for the chosen filters.
+            Facets are subject, language, publisher and publication year.
+        
+        Args:
+            author: list[str] | None = None,
+            subject: list[str] | None = None,
+            publisher: str | None = None,
+            publication_year: int | None = None,
+            language: str | None = None,
+            match: MatchMode = MatchMode.all: whether a book must have all or any of the given authors/subjects.
+        
+        Returns:
+            BookFacets: The book counts per value of every facet, most frequent first.
         """
 
     @abstractmethod
@@ -95,6 +196,23 @@ class IBookService(ABC):
             Book | None: The newly created book.
         """
 
+    @abstractmethod
+    async def import_books(
+        self,
+        records: AsyncIterator[tuple[int, BookImport | str]],
+        default_copies_location: str | None = None,
+    ) -> ImportReport:
+        """The abstract importing a stream of books with their copies to the repository (Intended for librarian).
+
+        Args:
+            records (AsyncIterator[tuple[int, BookImport | str]]): The line numbers with
+                validated records or the reasons they were rejected.
+            default_copies_location (str | None): The location of copies without their own.
+
+        Returns:
+            ImportReport: The number of imported books and copies with the rejected records.
+        """
+
     @abstractmethod
     async def update_book(self, book_id: int, data: BookUpdate) -> Book | None:
         """The abstract updating book data in the repository (Intended for librarian).
@@ -117,4 +235,33 @@ class IBookService(ABC):
         Returns:
             bool: Success of the operation.
         """
-    
\ No newline at end of file
+
+    @abstractmethod
+    async def reconcile_counters(self, fix: bool = False) -> list[CounterMismatch]:
+        """The abstract verifying the books copies counters against their copies.
+
+        Args:
+            fix (bool): Whether to overwrite the wrong counters.
+
+        Returns:
+            list[CounterMismatch]: The books whose counters were wrong.
+        """
+
+    @abstractmethod
+    async def fold_copy_counters(self, batch_size: int = COUNTER_FOLD_BATCH_SIZE) -> int:
+        """The abstract folding all pending copies counters deltas into their books.
+
+        Args:
+            batch_size (int): Maximum number of deltas folded in one transaction.
+
+        Returns:
+            int: The number of folded deltas.
+        """
+
+    @abstractmethod
+    def cache_stats(self) -> dict[str, int]:
+        """The abstract returning the book lookup cache counters.
+
+        Returns:
+            dict[str, int]: The number of hits, misses and cached entries.
+        """
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 
+from src.core.domain.batch import Batch
 from src.core.domain.book_copy import BookCopy, BookCopyCreate, BookCopyStatus, BookCopyUpdate
 
 
@@ -30,6 +31,17 @@ class IBookCopyService(ABC):
             BookCopy | None: The book copy data if exists.
         """
 
+    @abstractmethod
+    async def get_copies_by_ids(self, copy_ids: list[int]) -> Batch[BookCopy, int]:
+        """The abstract getting many book copies from the repository at once. (Intended for librarian).
+
+        Args:
+            copy_ids (list[int]): The ids of the book copies.
+
+        Returns:
+            Batch[BookCopy, int]: The copies in the order of `copy_ids` with the ids not found.
+        """
+
     @abstractmethod
     async def get_copies_by_book(self, book_id: int, status: BookCopyStatus | None = None, ) -> list[BookCopy]:
         """The abstract getting book copies of a specific book from the repository. (Intended for librarian).
@@ -43,6 +55,19 @@ class IBookCopyService(ABC):
             list[BookCopy]: The collection of the all copies of a specific book.
         """
 
+    @abstractmethod
+    async def get_copies_fingerprint(self, book_id: int, status: BookCopyStatus | None = None) -> str:
+        """The abstract getting a digest of a specific book copies from the repository.
+            Optionally filter by status.
+
+        Args:
+            book_id (int): The id of the book to compute the digest for.
+            status (BookCopyStatus | None): status of the copy e.g available.
+
+        Returns:
+            str: The digest, changing whenever a copy is added, removed or updated.
+        """
+
     @abstractmethod
     async def add_book_copy(self, data: BookCopyCreate) -> BookCopy | None:
         """The abstract adding new book copy to the repository. (Intended for librarian).
@@ -53,6 +78,19 @@ class IBookCopyService(ABC):
             BookCopy | None: The newly created book copy.
         """
 
+    @abstractmethod
+    async def add_book_copies(self, book_id: int, location: str | None, count: int) -> list[BookCopy]:
+        """The abstract adding many copies of a book to the repository at once. (Intended for librarian).
+
+        Args:
+            book_id (int): The id of the book.
+            location (str | None): The location of the copies.
+            count (int): Number of copies to create.
+
+        Returns:
+            list[BookCopy]: The newly created book copies.
+        """
+
     @abstractmethod
     async def update_book_copy(self, copy_id: int, data: BookCopyUpdate) -> BookCopy | None:
         """The abstract updating book copy  data in the repository.(Intended for librarian).
@@ -61,6 +99,9 @@ class IBookCopyService(ABC):
             copy_id (int): The book copy  id.
             data (BookCopyUpdate): The attributes of the book copy.
 
+        Raises:
+            CopyNotAvailable: If the copy still backs an active reservation or loan.
+
         Returns:
             BookCopy | None: The updated book copy.
         """
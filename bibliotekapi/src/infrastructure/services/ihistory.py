@@ -1,24 +1,77 @@
 """Module containing history service abstractions"""
 
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 from pydantic import UUID4
 
 from src.infrastructure.dto.historydto import HistoryDTO
-from src.core.domain.history import HistoryStatus
+from src.core.domain.history import HistoryStatus, OverdueUser
+from src.core.domain.page import Page
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE
 
 
 class IHistoryService(ABC):
     """An abstract class representing protocol of history service."""
 
     @abstractmethod
-    async def get_all_history(self, status: HistoryStatus | None = None) -> list[HistoryDTO]:
-        """The abstract getting a all history from the repository (Intendend for Librarian use).
+    async def get_all_history(
+        self,
+        status: HistoryStatus | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Page[HistoryDTO]:
+        """The abstract getting a page of history from the repository (Intendend for Librarian use).
             Optionally filter by status.
 
         Args:
             status: HistoryStatus | None = None: status of a book in history record.
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
         Returns:
-            list[HistoryDTO]: The collection of all history data.
+            Page[HistoryDTO]: The page of history data.
+        """
+
+    @abstractmethod
+    def export_history(self, status: HistoryStatus | None = None) -> AsyncIterator[HistoryDTO]:
+        """The abstract streaming all history from the repository for export (Intendend for Librarian use).
+            Optionally filter by status.
+
+        Args:
+            status: HistoryStatus | None = None: status of a book in history record.
+        Returns:
+            AsyncIterator[HistoryDTO]: The iterator over all history data.
+        """
+
+    @abstractmethod
+    async def get_overdue_history(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Page[HistoryDTO]:
+        """The abstract getting a page of loans past their due date (Intended for Librarian use).
+
+        Args:
+            limit (int): Maximum number of history records on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[HistoryDTO]: The page of overdue loans, the longest overdue first.
+        """
+
+    @abstractmethod
+    async def get_overdue_users(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Page[OverdueUser]:
+        """The abstract getting a page of users with loans past their due date (Intended for Librarian use).
+
+        Args:
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
+
+        Returns:
+            Page[OverdueUser]: The page of users with their overdue loans.
         """
 
     @abstractmethod
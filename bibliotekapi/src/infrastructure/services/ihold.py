@@ -0,0 +1,74 @@
+"""Module containing hold service abstractions"""
+
+from abc import ABC, abstractmethod
+from pydantic import UUID4
+
+from src.core.domain.hold import HoldStatus
+from src.infrastructure.dto.holddto import HoldDTO
+
+
+class IHoldService(ABC):
+    """An abstract class representing protocol of hold service."""
+
+    @abstractmethod
+    async def get_hold_by_id(self, hold_id: int) -> HoldDTO | None:
+        """The abstract getting a hold from the repository.
+
+        Args:
+            hold_id (int): The id of the hold.
+
+        Returns:
+            HoldDTO | None: The hold data with its place in the queue if exists.
+        """
+
+    @abstractmethod
+    async def get_holds_by_user(self, user_id: UUID4, status: HoldStatus | None = None) -> list[HoldDTO]:
+        """The abstract getting holds of a given user from the repository.
+            Optionally filter by status.
+
+        Args:
+            user_id (UUID4): The id of the user.
+            status (HoldStatus | None): The hold status.
+
+        Returns:
+            list[HoldDTO]: The collection of holds with their places in the queues.
+        """
+
+    @abstractmethod
+    async def get_book_queue(self, book_id: int) -> list[HoldDTO]:
+        """The abstract getting the queue of a book (Intended for Librarian use).
+
+        Args:
+            book_id (int): The id of the book.
+
+        Returns:
+            list[HoldDTO]: The waiting holds in the queue order.
+        """
+
+    @abstractmethod
+    async def place_hold(self, book_id: int, user_id: UUID4) -> HoldDTO:
+        """The abstract placing a user in the queue of a book.
+            If a copy is available, it is reserved right away and the hold is fulfilled.
+
+        Args:
+            book_id (int): The id of the book.
+            user_id (UUID4): The id of the user.
+
+        Raises:
+            HoldAlreadyExist: If the user is already waiting for the book.
+
+        Returns:
+            HoldDTO: The new hold with its place in the queue.
+        """
+
+    @abstractmethod
+    async def cancel_hold(self, hold_id: int, user_id: UUID4) -> HoldDTO | None:
+        """The abstract removing a user from the queue of a book.
+
+        Args:
+            hold_id (int): The id of the hold.
+            user_id (UUID4): The id of the user owning the hold.
+
+        Returns:
+            HoldDTO | None: The canceled hold, None if no such waiting hold exists.
+        """
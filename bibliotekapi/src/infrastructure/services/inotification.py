@@ -0,0 +1,21 @@
+"""Module containing notification service abstractions"""
+
+from abc import ABC, abstractmethod
+
+from src.infrastructure.utils.consts import NOTIFICATION_BATCH_SIZE
+
+
+class INotificationService(ABC):
+    """An abstract class representing protocol of notification service."""
+
+    @abstractmethod
+    async def send_notifications(self, batch_size: int = NOTIFICATION_BATCH_SIZE) -> int:
+        """The abstract notifying patrons about loans due soon and loans that became overdue.
+            Every loan is notified at most once per kind.
+
+        Args:
+            batch_size (int): Maximum number of loans claimed in one transaction.
+
+        Returns:
+            int: The number of sent notices.
+        """
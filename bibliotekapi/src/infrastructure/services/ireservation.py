@@ -1,10 +1,13 @@
 """Module containing reservation service abstractions"""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pydantic import UUID4
 
-from src.core.domain.reservation import ReservationStatus
+from src.core.domain.reservation import ReservationOrder, ReservationStatus
+from src.core.domain.page import Page
 from src.infrastructure.dto.reservationdto import ReservationDTO
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, EXPIRY_SWEEP_BATCH_SIZE
 
 
 class IReservationService(ABC):
@@ -12,15 +15,32 @@ class IReservationService(ABC):
     """An abstract class representing protocol of reservation ."""
 
     @abstractmethod
-    async def get_all_reservations(self, status: ReservationStatus | None = None) -> list[ReservationDTO]:
-        """The abstract getting a all reservations from the repository (Intended for Librarian use).
-            Optionally filter by status.
+    async def get_all_reservations(
+        self,
+        status: ReservationStatus | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+        reserved_from: datetime | None = None,
+        reserved_to: datetime | None = None,
+        expires_before: datetime | None = None,
+        order: ReservationOrder = ReservationOrder.reservation_id,
+        descending: bool = False,
+    ) -> Page[ReservationDTO]:
+        """The abstract getting a page of reservations from the repository (Intended for Librarian use).
+            Optionally filter by status and dates.
 
         Args:
             status (ReservationStatus | None): status of reservation.
+            limit (int): Maximum number of reservations on the page.
+            after (str | None): The cursor of the previous page.
+            reserved_from (datetime | None): The earliest reservation date.
+            reserved_to (datetime | None): The latest reservation date.
+            expires_before (datetime | None): The latest expiration date.
+            order (ReservationOrder): The sort key of the page.
+            descending (bool): Whether to sort in descending order.
         
         Returns:
-            list[ReservationDTO]: The collection of reservations data.
+            Page[ReservationDTO]: The page of reservations data.
         """
 
     @abstractmethod
@@ -81,4 +101,14 @@ class IReservationService(ABC):
         Returns:
             ReservationDTO | None: Updated reservation record.
         """
-       
+
+    @abstractmethod
+    async def expire_reservations(self, batch_size: int = EXPIRY_SWEEP_BATCH_SIZE) -> int:
+        """The abstract canceling all expired reservations and releasing their copies.
+
+        Args:
+            batch_size (int): Maximum number of reservations canceled in one transaction.
+
+        Returns:
+            int: The number of released copies.
+        """
@@ -1,10 +1,13 @@
 """Module containing unit of work abstractions"""
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 
 from src.core.repositories.ibook import IBookRepository
 from src.core.repositories.ibook_copy import IBookCopyRepository
 from src.core.repositories.ihistory import IHistoryRepository
+from src.core.repositories.ihold import IHoldRepository
+from src.core.repositories.inotification import INotificationRepository
 from src.core.repositories.ireservation import IReservationRepository
 from src.core.repositories.iuser import IUserRepository
 
@@ -13,6 +16,8 @@ class IUnitOfWork(ABC):
     book_repository: IBookRepository
     copy_repository: IBookCopyRepository
     history_repository: IHistoryRepository
+    hold_repository: IHoldRepository
+    notification_repository: INotificationRepository
     reservation_repository: IReservationRepository
     user_repository: IUserRepository
 
@@ -30,6 +35,11 @@ class IUnitOfWork(ABC):
     async def commit(self):
         pass
 
+    @abstractmethod
+    def savepoint(self) -> AbstractAsyncContextManager:
+        """The abstract opening a nested transaction, an error inside it
+            rolls back only the changes made within the block."""
+
     @abstractmethod
     async def rollback(self):
         pass
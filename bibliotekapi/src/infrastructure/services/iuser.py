@@ -5,19 +5,26 @@ from abc import ABC, abstractmethod
 from pydantic import UUID4, EmailStr
 
 from src.core.domain.user import UserCreate, UserRole, UserLogin
+from src.core.domain.batch import Batch
+from src.core.domain.page import Page
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.dto.tokendto import TokenDTO
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE
 
 
 class IUserService(ABC):
     """An abstarct repository class for user."""
 
     @abstractmethod
-    async def get_all_users(self) -> list[UserDTO]:
-       """The abstract getting all users from the repository (Intended for Librarian use).
+    async def get_all_users(self, limit: int = DEFAULT_PAGE_SIZE, after: str | None = None) -> Page[UserDTO]:
+       """The abstract getting a page of users from the repository (Intended for Librarian use).
+
+        Args:
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
         
         Returns:
-            list[UserDTO]: The collection of the all users.
+            Page[UserDTO]: The page of users.
         """
 
     @abstractmethod
@@ -31,6 +38,17 @@ class IUserService(ABC):
             UserDTO | None: The user data if exists.
         """
 
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: list[UUID4]) -> Batch[UserDTO, UUID4]:
+        """The abstract getting many users from the repository at once.
+
+        Args:
+            user_ids (list[UUID4]): The ids of the users.
+
+        Returns:
+            Batch[UserDTO, UUID4]: The users in the order of `user_ids` with the ids not found.
+        """
+
     @abstractmethod
     async def get_user_by_email(self, email: EmailStr) -> UserDTO | None:
         """The abstract getting a user by email from the repository.
@@ -0,0 +1,161 @@
+"""Module containing notification service implementation"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from src.core.domain.notification import LoanNotice, Message, NotificationKind
+from src.infrastructure.services.inotification import INotificationService
+from src.infrastructure.services.iunit_of_work import IUnitOfWork
+from src.infrastructure.utils.consts import (
+    NOTIFICATION_BATCH_SIZE,
+    NOTIFICATION_CONCURRENCY,
+    REMINDER_DAYS_BEFORE,
+)
+from src.infrastructure.utils.itransport import INotificationTransport
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationService(INotificationService):
+    """Class implementing notification service.
+
+    A notice is claimed (its idempotency marker committed) before it is sent,
+    so a restart or a concurrent run never sends it twice. A notice interrupted
+    between the claim and the send stays unsent rather than risking a duplicate.
+    """
+
+    def __init__(
+        self,
+        uow: IUnitOfWork,
+        transport: INotificationTransport,
+        concurrency: int = NOTIFICATION_CONCURRENCY,
+    ):
+        self._uow = uow
+        self._transport = transport
+        self._concurrency = concurrency
+
+    async def send_notifications(self, batch_size: int = NOTIFICATION_BATCH_SIZE) -> int:
+        """The method notifying patrons about loans due soon and loans that became overdue.
+            Every loan is notified at most once per kind.
+
+        Args:
+            batch_size (int): Maximum number of loans claimed in one transaction.
+
+        Returns:
+            int: The number of sent notices.
+        """
+        now = datetime.now()
+        due_soon = await self._send_kind(
+            NotificationKind.due_soon,
+            due_from=now,
+            due_to=now + timedelta(days=REMINDER_DAYS_BEFORE),
+            batch_size=batch_size,
+        )
+        overdue = await self._send_kind(
+            NotificationKind.overdue,
+            due_from=None,
+            due_to=now,
+            batch_size=batch_size,
+        )
+        return due_soon + overdue
+
+    async def _send_kind(
+        self,
+        kind: NotificationKind,
+        due_from: datetime | None,
+        due_to: datetime,
+        batch_size: int,
+    ) -> int:
+        """A private method sending the notices of a kind, batch by batch in the due date order.
+            The messages are sent outside of the DB transactions, the failed ones
+            are released to be retried by the next run.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            due_from (datetime | None): The inclusive lower bound of the due date, if any.
+            due_to (datetime): The exclusive upper bound of the due date.
+            batch_size (int): Maximum number of loans claimed in one transaction.
+
+        Returns:
+            int: The number of sent notices.
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+        sent_count = 0
+        after = None
+        while True:
+            async with self._uow:
+                page = await self._uow.notification_repository.get_pending_notices(
+                    kind, due_from, due_to, batch_size, after,
+                )
+                claimed = set(await self._uow.notification_repository.claim_notices(
+                    kind, [notice.history_id for notice in page.items], datetime.now(),
+                ))
+
+            notices = [notice for notice in page.items if notice.history_id in claimed]
+            results = await asyncio.gather(*(
+                self._deliver(semaphore, kind, notice) for notice in notices
+            ))
+            sent = [notice.history_id for notice, ok in zip(notices, results) if ok]
+            failed = [notice.history_id for notice, ok in zip(notices, results) if not ok]
+
+            if notices:
+                async with self._uow:
+                    await self._uow.notification_repository.mark_sent(kind, sent, datetime.now())
+                    await self._uow.notification_repository.release_notices(kind, failed)
+            sent_count += len(sent)
+
+            if page.next_cursor is None:
+                return sent_count
+            after = page.next_cursor
+
+    async def _deliver(
+        self,
+        semaphore: asyncio.Semaphore,
+        kind: NotificationKind,
+        notice: LoanNotice,
+    ) -> bool:
+        """A private method sending a single notice, bounded by the semaphore.
+
+        Args:
+            semaphore (asyncio.Semaphore): The semaphore limiting concurrent sends.
+            kind (NotificationKind): The kind of the notice.
+            notice (LoanNotice): The loan to notify about.
+
+        Returns:
+            bool: Whether the notice was sent.
+        """
+        async with semaphore:
+            try:
+                await self._transport.send(self._render(kind, notice))
+                return True
+            except Exception:
+                logger.warning("Sending %s notice of loan %d failed", kind.value, notice.history_id, exc_info=True)
+                return False
+
+    def _render(self, kind: NotificationKind, notice: LoanNotice) -> Message:
+        """A private method rendering the message of a notice.
+
+        Args:
+            kind (NotificationKind): The kind of the notice.
+            notice (LoanNotice): The loan to notify about.
+
+        Returns:
+            Message: The message for the patron.
+        """
+        due = notice.due_date.strftime("%Y-%m-%d")
+        if kind is NotificationKind.due_soon:
+            subject = f"Reminder: \"{notice.title}\" is due on {due}"
+            body = (
+                f"Hello {notice.username},\n\n"
+                f"the book \"{notice.title}\" you borrowed is due on {due}. "
+                "Please return it on time or ask a librarian for help.\n"
+            )
+        else:
+            subject = f"Overdue: \"{notice.title}\" was due on {due}"
+            body = (
+                f"Hello {notice.username},\n\n"
+                f"the book \"{notice.title}\" you borrowed was due on {due}. "
+                "Please return it as soon as possible.\n"
+            )
+        return Message(recipient=notice.email, subject=subject, body=body)
@@ -4,33 +4,65 @@ from datetime import datetime, timedelta
 from pydantic import UUID4
 
 from src.infrastructure.dto.reservationdto import ReservationDTO
-from src.core.domain.reservation import ReservationStatus, ReservationCreate
+from src.core.domain.reservation import ReservationOrder, ReservationStatus, ReservationCreate
 from src.core.domain.history import HistoryStatus
-from src.core.domain.book_copy import BookCopy, BookCopyStatus
+from src.core.domain.book_copy import BookCopy, BookCopyStatus, CopyTransition
+from src.core.domain.page import Page
 from src.core.repositories.ireservation import IReservationRepository
 from src.infrastructure.services.iunit_of_work import IUnitOfWork
 from src.infrastructure.services.ireservation import IReservationService
-from src.core.exceptions.exceptions import UserNotFound, BookNotFound, BookNotAvailable, CopyNotFound
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, EXPIRY_SWEEP_BATCH_SIZE
+from src.core.exceptions.exceptions import UserNotFound, BookNotFound, BookNotAvailable
 
 class ReservationService(IReservationService):
     """Class implementing reservation service."""
 
-    def __init__(self, uow: IUnitOfWork ):
+    def __init__(self, uow: IUnitOfWork, read_uow: IUnitOfWork | None = None):
         self._uow = uow
+        self._read_uow = read_uow or uow
      
-    async def get_all_reservations(self, status: ReservationStatus | None = None) -> list[ReservationDTO]:
-        """The method getting a all reservations from the repository (Intended for Librarian use).
-            Optionally filter by status.
+    async def get_all_reservations(
+        self,
+        status: ReservationStatus | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+        reserved_from: datetime | None = None,
+        reserved_to: datetime | None = None,
+        expires_before: datetime | None = None,
+        order: ReservationOrder = ReservationOrder.reservation_id,
+        descending: bool = False,
+    ) -> Page[ReservationDTO]:
+        """The method getting a page of reservations from the repository (Intended for Librarian use).
+            Optionally filter by status and dates.
 
         Args:
             status (ReservationStatus | None): status of reservation.
+            limit (int): Maximum number of reservations on the page.
+            after (str | None): The cursor of the previous page.
+            reserved_from (datetime | None): The earliest reservation date.
+            reserved_to (datetime | None): The latest reservation date.
+            expires_before (datetime | None): The latest expiration date.
+            order (ReservationOrder): The sort key of the page.
+            descending (bool): Whether to sort in descending order.
         
         Returns:
-            list[ReservationDTO]: The collection of reservations data.
+            Page[ReservationDTO]: The page of reservations data.
         """
-        async with self._uow:
-            reservations = await self._uow.reservation_repository.get_all_reservations()
-            return [ReservationDTO.model_validate(reservation) for reservation in reservations]
+        async with self._read_uow:
+            page = await self._read_uow.reservation_repository.get_all_reservations(
+                limit,
+                after,
+                status=status,
+                reserved_from=reserved_from,
+                reserved_to=reserved_to,
+                expires_before=expires_before,
+                order=order,
+                descending=descending,
+            )
+            return Page(
+                items=[ReservationDTO.from_domain(reservation) for reservation in page.items],
+                next_cursor=page.next_cursor,
+            )
 
     async def get_reservation_by_id(self, reservation_id: int) -> ReservationDTO | None:
         """The method getting a reservation record from the repository (Intended for Librarian use).
@@ -41,9 +73,9 @@ class ReservationService(IReservationService):
         Returns:
             ReservationDTO | None: The reservation data if exists.
         """
-        async with self._uow:
-            reservation = await self._uow.reservation_repository.get_reservation_by_id(reservation_id)
-            return ReservationDTO.model_validate(reservation) if reservation else None
+        async with self._read_uow:
+            reservation = await self._read_uow.reservation_repository.get_reservation_by_id(reservation_id)
+            return ReservationDTO.from_domain(reservation) if reservation else None
 
     async def get_reservations_by_user(self, user_id: UUID4, status: ReservationStatus | None = None) -> list[ReservationDTO]:
        """The method getting a reservations for a given user from the repository (Intended for Librarian use).
@@ -55,9 +87,9 @@ class ReservationService(IReservationService):
         Returns:
             List[ReservationDTO]: The collection of reservation data for a given user.
         """
-       async with self._uow:
-        reservations = await self._uow.reservation_repository.get_reservation_by_user(user_id, status)
-        return [ReservationDTO.model_validate(reservation) for reservation in reservations]
+       async with self._read_uow:
+        reservations = await self._read_uow.reservation_repository.get_reservation_by_user(user_id, status)
+        return [ReservationDTO.from_domain(reservation) for reservation in reservations]
        
     async def get_user_reservations(self, user_id: UUID4, status: ReservationStatus | None = None) -> list[ReservationDTO]:
        """The method getting a reservations for currently authenticated user from the repository.
@@ -70,9 +102,9 @@ class ReservationService(IReservationService):
         Returns:
             List[ReservationDTO]: The collection of reservation data for the user.
         """
-       async with self._uow:
-            reservations = await self._uow.reservation_repository.get_reservation_by_user(user_id, status)
-            return [ReservationDTO.model_validate(reservation) for reservation in reservations]
+       async with self._read_uow:
+            reservations = await self._read_uow.reservation_repository.get_reservation_by_user(user_id, status)
+            return [ReservationDTO.from_domain(reservation) for reservation in reservations]
 
     async def add_reservation(self, book_id: int, user_id: UUID4 ) -> ReservationDTO | None:
         """The method adding new reservation to the repository.
@@ -90,33 +122,49 @@ class ReservationService(IReservationService):
             book = await self._uow.book_repository.get_book_by_id(book_id=book_id)
             if not book:
                 raise BookNotFound()
-            copies = await self._uow.copy_repository.get_copies_by_book(book_id=book_id, status=BookCopyStatus.available)
-            if len(copies) < 1:
+            copy = await self._uow.copy_repository.claim_available_copy(book_id, CopyTransition.reserve)
+            if not copy:
                 raise BookNotAvailable()
-            copy = copies[0]
-            copy.status = BookCopyStatus.reserved
-            await self._uow.copy_repository.update_book_copy(copy.copy_id, copy)
             reservation = await self._uow.reservation_repository.add_reservation(ReservationCreate(user_id=user_id, copy_id=copy.copy_id))
-            return ReservationDTO.model_validate(reservation) if reservation else None
+            return ReservationDTO.from_domain(reservation) if reservation else None
 
     async def cancel_reservation(self, reservation_id: int) -> ReservationDTO | None:
-       """The method for canceling reservation.
+       """The method for canceling an active reservation. Its copy is released
+            and reserved for the next user waiting for the book, if any.
 
         Args:
             reservation_id (int): The reservation id.
 
         Returns:
-            ReservationDTO | None: Updated reservation record.
+            ReservationDTO | None: Updated reservation record, None if no such active reservation exists.
         """
        async with self._uow:
-           reservation = await self._uow.reservation_repository.get_reservation_by_id(reservation_id)
+           reservation = await self._uow.reservation_repository.cancel_and_release(reservation_id)
            if not reservation:
                return None
-           reservation.status = ReservationStatus.canceled
-           copy = await self._uow.copy_repository.get_book_copy_by_id(reservation.copy_id)
-           if not copy:
-               raise CopyNotFound()
-           copy.status = BookCopyStatus.available
-           await self._uow.copy_repository.update_book_copy(copy.copy_id, copy)
-           updated_reservation = await self._uow.reservation_repository.update_reservation(reservation_id, reservation)
-           return ReservationDTO.model_validate(updated_reservation) if updated_reservation else None    
\ No newline at end of file
+           await self._uow.hold_repository.allocate_copy(reservation.copy_id)
+           return ReservationDTO.from_domain(reservation)
+
+    async def expire_reservations(self, batch_size: int = EXPIRY_SWEEP_BATCH_SIZE) -> int:
+        """The method canceling all expired reservations and releasing their copies,
+            each released copy is reserved for the next user waiting for its book.
+            Every batch is committed in its own transaction, keeping row locks short.
+
+        Args:
+            batch_size (int): Maximum number of reservations canceled in one transaction.
+
+        Returns:
+            int: The number of released copies.
+        """
+        now = datetime.now()
+        released = 0
+        while True:
+            async with self._uow:
+                canceled, copy_ids = await self._uow.reservation_repository.expire_reservations(now, batch_size)
+                for copy_id in copy_ids:
+                    await self._uow.hold_repository.allocate_copy(copy_id)
+            released += len(copy_ids)
+            # A batch may cancel reservations whose copies were not reserved
+            # any more, only a short batch of canceled rows means none are left.
+            if canceled < batch_size:
+                return released
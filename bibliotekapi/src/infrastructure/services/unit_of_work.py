@@ -1,27 +1,47 @@
 """Module containing unit of work implementation"""
 
+from contextlib import AbstractAsyncContextManager
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.repositories.book import BookRepository
 from src.infrastructure.repositories.book_copy import BookCopyRepository
 from src.infrastructure.repositories.history import HistoryRepository
+from src.infrastructure.repositories.hold import HoldRepository
+from src.infrastructure.repositories.notification import NotificationRepository
 from src.infrastructure.repositories.reservation import ReservationRepository
 from src.infrastructure.repositories.user import UserRepository
 from src.infrastructure.services.iunit_of_work import IUnitOfWork
-from src.db import async_session_factory
+from src.db import async_session_factory, async_replica_session_factory, read_your_writes
 
 
 class UnitOfWork(IUnitOfWork):
-    """Class implementing unit of work."""
-    def __init__(self, async_session_factory = async_session_factory):
+    """Class implementing unit of work.
+
+    A read-only unit of work uses the replica, unless the current request
+    has to read its own writes (see `read_your_writes`).
+    """
+    def __init__(
+        self,
+        async_session_factory = async_session_factory,
+        read_only: bool = False,
+        replica_session_factory = async_replica_session_factory,
+    ):
         self._async_session_factory = async_session_factory
+        self._read_only = read_only
+        self._replica_session_factory = replica_session_factory
    
     async def __aenter__(self):
-        self._session: AsyncSession = self._async_session_factory()
+        if self._read_only and not read_your_writes.get():
+            self._session: AsyncSession = self._replica_session_factory()
+        else:
+            self._session: AsyncSession = self._async_session_factory()
 
         self.book_repository = BookRepository(self._session)
         self.copy_repository = BookCopyRepository(self._session)
         self.history_repository = HistoryRepository(self._session)
+        self.hold_repository = HoldRepository(self._session)
+        self.notification_repository = NotificationRepository(self._session)
         self.reservation_repository = ReservationRepository(self._session)
         self.user_repository = UserRepository(self._session)
         
@@ -40,5 +60,8 @@ class UnitOfWork(IUnitOfWork):
     async def commit(self):
        await self._session.commit()
 
+    def savepoint(self) -> AbstractAsyncContextManager:
+        return self._session.begin_nested()
+
     async def rollback(self):
         await self._session.rollback()
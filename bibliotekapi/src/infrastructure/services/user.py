@@ -3,6 +3,8 @@
 from pydantic import UUID4, EmailStr
 
 from src.core.domain.user import UserCreate, UserRole, UserLogin
+from src.core.domain.batch import Batch
+from src.core.domain.page import Page
 from src.core.repositories.iuser import IUserRepository
 from src.infrastructure.services.iuser import IUserService
 from src.infrastructure.dto.userdto import UserDTO
@@ -10,6 +12,7 @@ from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.utils.password import hash_password
 from src.infrastructure.utils.password import verify_password
 from src.infrastructure.utils.token import generate_user_token
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE
 from src.infrastructure.services.iunit_of_work import IUnitOfWork
 from src.core.exceptions.exceptions import EmailAlreadyExist
 
@@ -17,18 +20,26 @@ from src.core.exceptions.exceptions import EmailAlreadyExist
 class UserService(IUserService):
     """A class implementing the user service"""
 
-    def __init__(self, uow: IUnitOfWork):
+    def __init__(self, uow: IUnitOfWork, read_uow: IUnitOfWork | None = None):
         self._uow = uow
+        self._read_uow = read_uow or uow
 
-    async def get_all_users(self) -> list[UserDTO]:
-       """The method getting all users from the repository (Intended for Librarian use).
+    async def get_all_users(self, limit: int = DEFAULT_PAGE_SIZE, after: str | None = None) -> Page[UserDTO]:
+       """The method getting a page of users from the repository (Intended for Librarian use).
+
+        Args:
+            limit (int): Maximum number of users on the page.
+            after (str | None): The cursor of the previous page.
         
         Returns:
-            list[UserDTO]: The collection of the all users.
+            Page[UserDTO]: The page of users.
         """
-       async with self._uow:
-            users = await self._uow.user_repository.get_all_users()
-            return [UserDTO.model_validate(user) for user in users]
+       async with self._read_uow:
+            page = await self._read_uow.user_repository.get_all_users(limit, after)
+            return Page(
+                items=[UserDTO.from_domain(user) for user in page.items],
+                next_cursor=page.next_cursor,
+            )
 
     async def get_user_by_uuid(self, user_id: UUID4) -> UserDTO | None:
         """The method getting a user from the repository.
@@ -39,9 +50,27 @@ class UserService(IUserService):
         Returns:
             UserDTO | None: The user data if exists.
         """
-        async with self._uow:
-            user = await self._uow.user_repository.get_user_by_uuid(user_id)
-            return UserDTO.model_validate(user) if user else None
+        async with self._read_uow:
+            user = await self._read_uow.user_repository.get_user_by_uuid(user_id)
+            return UserDTO.from_domain(user) if user else None
+
+    async def get_users_by_ids(self, user_ids: list[UUID4]) -> Batch[UserDTO, UUID4]:
+        """The method getting many users from the repository at once.
+
+        Args:
+            user_ids (list[UUID4]): The ids of the users.
+
+        Returns:
+            Batch[UserDTO, UUID4]: The users in the order of `user_ids` with the ids not found.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        async with self._read_uow:
+            users = await self._read_uow.user_repository.get_users_by_ids(user_ids)
+        return Batch.from_items(
+            user_ids,
+            [UserDTO.from_domain(user) for user in users],
+            key=lambda user: user.user_id,
+        )
 
     async def get_user_by_email(self, email: EmailStr) -> UserDTO | None:
         """The method getting a user by email from the repository.
@@ -52,9 +81,9 @@ class UserService(IUserService):
         Returns:
             UserDTO | None: The user data if exists.
         """
-        async with self._uow:
-            user = await self._uow.user_repository.get_user_by_email(email)
-            return UserDTO.model_validate(user) if user else None
+        async with self._read_uow:
+            user = await self._read_uow.user_repository.get_user_by_email(email)
+            return UserDTO.from_domain(user) if user else None
 
 
     async def get_user_by_username(self, username: str) -> list[UserDTO]:
@@ -66,9 +95,9 @@ class UserService(IUserService):
         Returns:
             list[UserDTO]: The collection of user data.
         """
-        async with self._uow:
-            users = await self._uow.user_repository.get_user_by_username(username)
-            return [UserDTO.model_validate(user) for user in users]
+        async with self._read_uow:
+            users = await self._read_uow.user_repository.get_user_by_username(username)
+            return [UserDTO.from_domain(user) for user in users]
 
 
     async def register_user(self, data: UserCreate) -> UserDTO | None:
@@ -83,7 +112,7 @@ class UserService(IUserService):
             if await self._uow.user_repository.get_user_by_email(data.email):
                 raise EmailAlreadyExist()
             user = await self._uow.user_repository.add_user(data)
-            return UserDTO.model_validate(user) if user else None
+            return UserDTO.from_domain(user) if user else None
     
     async def update_user_username(self, user_id: UUID4, username: str ) -> UserDTO | None:
         """The method updating user username.
@@ -101,7 +130,7 @@ class UserService(IUserService):
                 return None
             user.username = username
             updated_user = await self._uow.user_repository.update_user(user_id,user)
-            return UserDTO.model_validate(updated_user)
+            return UserDTO.from_domain(updated_user)
 
     async def update_user_email(self, user_id: UUID4, new_email: EmailStr ) -> UserDTO | None:
         """The method updating user email.
@@ -121,7 +150,7 @@ class UserService(IUserService):
                 raise EmailAlreadyExist()
             user.email = new_email
             updated_user = await self._uow.user_repository.update_user(user_id,user)
-            return UserDTO.model_validate(updated_user) 
+            return UserDTO.from_domain(updated_user) 
 
     async def change_user_password(self, user_id: UUID4, new_password: str) -> UserDTO | None:
         """The method changing user password.
@@ -139,7 +168,7 @@ class UserService(IUserService):
                 return None
             user.password = hash_password(new_password)
             updated_user = await self._uow.user_repository.update_user(user_id,user)
-            return UserDTO.model_validate(updated_user) 
+            return UserDTO.from_domain(updated_user) 
 
     async def set_role(self, user_id: UUID4, role: UserRole) -> UserDTO | None:
         """The abstarct setting role for the user.
@@ -157,7 +186,7 @@ class UserService(IUserService):
                 return None
             user.role = role
             updated_user = await self._uow.user_repository.update_user(user_id, user)
-            return UserDTO.model_validate(updated_user) if updated_user else None
+            return UserDTO.from_domain(updated_user) if updated_user else None
 
     async def authenticate_user(self, user: UserLogin) -> TokenDTO | None:
         """The method authenticating the user.
@@ -0,0 +1,103 @@
+"""A module containing in-memory caching helpers."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from src.infrastructure.utils.icache import ICache
+
+
+class TTLCache(ICache):
+    """A bounded in-memory LRU cache expiring entries after a time to live.
+
+    The cache is local to the process and not safe to share between threads,
+    which is fine for a single asyncio event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # The generation of the last invalidation of recently invalidated keys, and the
+        # newest generation forgotten, assumed for the keys not remembered any more.
+        self._generation = 0
+        self._invalidated: OrderedDict[Hashable, int] = OrderedDict()
+        self._forgotten = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Method returning a cached value if present and not expired.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): The value returned on a miss.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self) -> int:
+        """Method returning the current invalidation generation.
+
+        Returns:
+            int: The generation, growing with every invalidation.
+        """
+        return self._generation
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """Method storing a value, evicting the least recently used entry when full.
+            With a generation, the value is dropped if the key was invalidated since.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            generation (int | None): The generation taken before the value was read.
+        """
+        if generation is not None and self._invalidated.get(key, self._forgotten) > generation:
+            return
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Method removing a value from the cache if present.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self._data.pop(key, None)
+        self._generation += 1
+        self._invalidated[key] = self._generation
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self._maxsize:
+            _, forgotten = self._invalidated.popitem(last=False)
+            self._forgotten = max(self._forgotten, forgotten)
+
+    def clear(self) -> None:
+        """Method removing all values from the cache."""
+        self._data.clear()
+        self._generation += 1
+        self._invalidated.clear()
+        self._forgotten = self._generation
+
+    def stats(self) -> dict[str, int]:
+        """Method returning the cache usage counters.
+
+        Returns:
+            dict[str, int]: The number of hits, misses and stored entries.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
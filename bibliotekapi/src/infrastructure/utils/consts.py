@@ -2,4 +2,25 @@
 
 EXPIRATION_MINUTES = 60
 SECRET_KEY = "s3cr3t"  # TODO: -> random generation - it's safe 
-ALGORITHM = "HS256"
\ No newline at end of file
+ALGORITHM = "HS256"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+STREAM_BATCH_SIZE = 1000
+FUZZY_MATCH_LIMIT = 20
+FACET_CACHE_SIZE = 1024
+FACET_CACHE_TTL = 30  # seconds
+BOOK_CACHE_SIZE = 10_000
+BOOK_CACHE_TTL = 300  # seconds
+IMPORT_BATCH_SIZE = 1000
+MAX_BULK_COPIES = 1000
+MAX_BATCH_IDS = 500
+READ_PRIMARY_COOKIE = "read_primary"
+READ_PRIMARY_HEADER = "X-Read-Primary"
+READ_PRIMARY_SECONDS = 10  # longer than the expected replica lag
+EXPIRY_SWEEP_BATCH_SIZE = 500
+RESERVATION_DAYS = 3
+LOAN_DAYS = 14
+COUNTER_FOLD_BATCH_SIZE = 5000
+REMINDER_DAYS_BEFORE = 2
+NOTIFICATION_BATCH_SIZE = 500
+NOTIFICATION_CONCURRENCY = 20
@@ -0,0 +1,37 @@
+"""A module building the SQL of book copy status transitions."""
+
+from sqlalchemy import and_, exists
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.core.domain.book_copy import BookCopyStatus, CopyTransition, COPY_TRANSITIONS
+from src.core.domain.history import HistoryStatus
+from src.core.domain.reservation import ReservationStatus
+from src.db import BookCopy as BookCopyORM, History as HistoryORM, Reservation as ReservationORM
+
+
+def copy_transition(transition: CopyTransition) -> tuple[ColumnElement[bool], BookCopyStatus]:
+    """A function building the condition a copy status transition applies under and its new status,
+        both taken from `COPY_TRANSITIONS`, for the WHERE and SET clauses of a conditional UPDATE.
+
+    Args:
+        transition (CopyTransition): The status change.
+
+    Returns:
+        tuple[ColumnElement[bool], BookCopyStatus]: The condition on the `book_copy` row and the new status.
+    """
+    allowed_from, status = COPY_TRANSITIONS[transition]
+    condition = BookCopyORM.status.in_(allowed_from)
+    if transition == CopyTransition.restore:
+        # A copy backing an active reservation or a loan changes only with them.
+        condition = and_(
+            condition,
+            ~exists().where(
+                ReservationORM.copy_id==BookCopyORM.copy_id,
+                ReservationORM.status==ReservationStatus.active,
+            ),
+            ~exists().where(
+                HistoryORM.copy_id==BookCopyORM.copy_id,
+                HistoryORM.status==HistoryStatus.borrowed,
+            ),
+        )
+    return condition, status
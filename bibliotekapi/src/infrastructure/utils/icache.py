@@ -0,0 +1,61 @@
+"""A module containing cache abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Hashable
+
+
+class ICache(ABC):
+    """An abstract class representing protocol of a key-value cache."""
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The abstract returning a cached value.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): The value returned on a miss.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+
+    @abstractmethod
+    def generation(self) -> int:
+        """The abstract returning the current invalidation generation.
+            Taken before reading a value to cache and passed to `set`.
+
+        Returns:
+            int: The generation, growing with every invalidation.
+        """
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """The abstract storing a value in the cache.
+            With a generation, the value is dropped if the key was invalidated since,
+            as it may have been read before the change.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            generation (int | None): The generation taken before the value was read.
+        """
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """The abstract removing a value from the cache.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """The abstract removing all values from the cache."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """The abstract returning the cache usage counters.
+
+        Returns:
+            dict[str, int]: The number of hits, misses and stored entries.
+        """
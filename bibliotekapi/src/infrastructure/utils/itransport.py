@@ -0,0 +1,20 @@
+"""A module containing notification transport abstractions."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.notification import Message
+
+
+class INotificationTransport(ABC):
+    """An abstract class representing protocol of a notification transport."""
+
+    @abstractmethod
+    async def send(self, message: Message) -> None:
+        """The abstract delivering a single message.
+
+        Args:
+            message (Message): The rendered message.
+
+        Raises:
+            Exception: If the message could not be delivered.
+        """
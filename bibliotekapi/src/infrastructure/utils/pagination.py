@@ -0,0 +1,100 @@
+"""A module containing keyset (cursor) pagination helpers."""
+
+import base64
+import json
+from typing import Any, Callable, Sequence, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Row, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.core.domain.page import Page
+from src.core.exceptions.exceptions import InvalidCursor
+
+T = TypeVar("T")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """A function encoding sort key values into an opaque cursor.
+
+    Args:
+        values (Sequence[Any]): The sort key values of the last returned row.
+
+    Returns:
+        str: The url-safe cursor token.
+    """
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[ColumnElement]) -> list[Any]:
+    """A function decoding an opaque cursor into typed sort key values.
+
+    Args:
+        cursor (str): The cursor token received from the client.
+        keys (Sequence[ColumnElement]): The sort key expressions the cursor was built on.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or does not match the keys.
+
+    Returns:
+        list[Any]: The sort key values converted to the keys python types.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise InvalidCursor()
+        return [
+            TypeAdapter(key.type.python_type).validate_python(value)
+            for key, value in zip(keys, values)
+        ]
+    except (ValueError, TypeError, ValidationError) as e:
+        raise InvalidCursor() from e
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    keys: Sequence[ColumnElement],
+    limit: int,
+    after: str | None,
+    to_item: Callable[[Row], T],
+    descending: bool = False,
+) -> Page[T]:
+    """A function executing a statement as a single keyset paginated page.
+
+    The keys must form a unique sort order (e.g. end with the primary key).
+    The statement is extended with the keyset condition, ordering and
+    a limit of one extra row used to detect if a next page exists.
+
+    Args:
+        session (AsyncSession): The database session.
+        stmt (Select): The base select statement.
+        keys (Sequence[ColumnElement]): The sort key expressions.
+        limit (int): Maximum number of items on the page.
+        after (str | None): The cursor returned with the previous page.
+        to_item (Callable[[Row], T]): The function mapping a result row to an item.
+        descending (bool): Whether to sort the keys in descending order.
+
+    Returns:
+        Page[T]: The page of items with the next page cursor.
+    """
+    if after is not None:
+        values = decode_cursor(after, keys)
+        if descending:
+            stmt = stmt.where(tuple_(*keys) < tuple_(*values))
+        else:
+            stmt = stmt.where(tuple_(*keys) > tuple_(*values))
+    order = [key.desc() for key in keys] if descending else list(keys)
+    stmt = stmt.add_columns(*keys).order_by(*order).limit(limit + 1)
+
+    rows = (await session.execute(stmt)).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1][-len(keys):]) if has_next else None
+    return Page(
+        items=[to_item(row) for row in rows],
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,72 @@
+"""A module containing notification transports."""
+
+import asyncio
+import json
+import smtplib
+from email.message import EmailMessage
+
+from src.core.domain.notification import Message
+from src.infrastructure.utils.itransport import INotificationTransport
+
+
+class SmtpTransport(INotificationTransport):
+    """A transport sending messages as e-mails through an SMTP server.
+
+    `smtplib` is blocking, every message is sent from a worker thread
+    so the event loop serving the requests is never blocked.
+    """
+
+    def __init__(self, host: str, port: int, sender: str, timeout: float = 10):
+        self._host = host
+        self._port = port
+        self._sender = sender
+        self._timeout = timeout
+
+    async def send(self, message: Message) -> None:
+        """Method sending a message as an e-mail.
+
+        Args:
+            message (Message): The rendered message.
+        """
+        await asyncio.to_thread(self._send, message)
+
+    def _send(self, message: Message) -> None:
+        """A private method sending a message over a new SMTP connection.
+
+        Args:
+            message (Message): The rendered message.
+        """
+        email = EmailMessage()
+        email["From"] = self._sender
+        email["To"] = message.recipient
+        email["Subject"] = message.subject
+        email.set_content(message.body)
+        with smtplib.SMTP(self._host, self._port, timeout=self._timeout) as smtp:
+            smtp.send_message(email)
+
+
+class FileTransport(INotificationTransport):
+    """A transport appending messages to a JSON lines file, e.g. for tests and development."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = asyncio.Lock()
+
+    async def send(self, message: Message) -> None:
+        """Method appending a message to the file.
+
+        Args:
+            message (Message): The rendered message.
+        """
+        line = json.dumps(message.model_dump(), ensure_ascii=False) + "\n"
+        async with self._lock:
+            await asyncio.to_thread(self._write, line)
+
+    def _write(self, line: str) -> None:
+        """A private method appending a line to the file.
+
+        Args:
+            line (str): The serialized message.
+        """
+        with open(self._path, "a", encoding="utf-8") as file:
+            file.write(line)
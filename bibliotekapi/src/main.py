@@ -1,24 +1,33 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import ORJSONResponse
 from src.api.error_handlers import domain_exception_handler
+from src.api.utils.read_your_writes import read_your_writes_middleware
 from src.core.exceptions.exceptions import DomainError
 
 from src.api.routers.book import router as book_router
 from src.api.routers.book_copy import router as book_copy_router
 from src.api.routers.history import router as history_router
+from src.api.routers.hold import router as hold_router
 from src.api.routers.reservation import router as reservation_router
 from src.api.routers.user import router as user_router
+from src.config import config
 from src.container import Container
 from src.db import init_db
+from src.utils.counter_folder import fold_copy_counters_periodically
+from src.utils.notifier import send_notifications_periodically
+from src.utils.reservation_sweeper import sweep_expired_reservations
 
 container = Container()
 container.wire(modules=[
     "src.api.routers.book",
     "src.api.routers.book_copy",
     "src.api.routers.history",
+    "src.api.routers.hold",
     "src.api.routers.reservation",
     "src.api.routers.user",
     "src.infrastructure.auth.auth",
@@ -33,17 +42,41 @@ async def lifespan(_: FastAPI) -> AsyncGenerator:
     user_service = container.user_service()
     await user_service.create_admin_if_not_exists()
 
+    tasks = []
+    if config.RESERVATION_SWEEP_INTERVAL > 0:
+        tasks.append(asyncio.create_task(sweep_expired_reservations(
+            container.reservation_service(),
+            config.RESERVATION_SWEEP_INTERVAL,
+        )))
+    if config.COPY_COUNTER_FOLD_INTERVAL > 0:
+        tasks.append(asyncio.create_task(fold_copy_counters_periodically(
+            container.book_service(),
+            config.COPY_COUNTER_FOLD_INTERVAL,
+        )))
+    if config.NOTIFICATION_INTERVAL > 0:
+        tasks.append(asyncio.create_task(send_notifications_periodically(
+            container.notification_service(),
+            config.NOTIFICATION_INTERVAL,
+        )))
+
     yield
 
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(book_router, prefix="/book")
 app.include_router(book_copy_router, prefix="/book_copy")
 app.include_router(history_router, prefix="/history")
+app.include_router(hold_router, prefix="/hold")
 app.include_router(reservation_router, prefix="/reservation")
 app.include_router(user_router, prefix="/user")
 
 app.add_exception_handler(DomainError, domain_exception_handler)
+app.middleware("http")(read_your_writes_middleware)
 
 
 @app.exception_handler(HTTPException)
@@ -0,0 +1,24 @@
+"""A module containing the background task folding copies counters deltas into books."""
+
+import asyncio
+import logging
+
+from src.infrastructure.services.ibook import IBookService
+
+logger = logging.getLogger(__name__)
+
+
+async def fold_copy_counters_periodically(service: IBookService, interval: int) -> None:
+    """Function folding the pending copies counters deltas into their books
+        every `interval` seconds, until the task is cancelled.
+
+    Args:
+        service (IBookService): The book service.
+        interval (int): Seconds between the folds.
+    """
+    while True:
+        try:
+            await service.fold_copy_counters()
+        except Exception:
+            logger.exception("Folding copies counters failed")
+        await asyncio.sleep(interval)
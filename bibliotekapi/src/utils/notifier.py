@@ -0,0 +1,26 @@
+"""A module containing the background task sending loan notifications."""
+
+import asyncio
+import logging
+
+from src.infrastructure.services.inotification import INotificationService
+
+logger = logging.getLogger(__name__)
+
+
+async def send_notifications_periodically(service: INotificationService, interval: int) -> None:
+    """Function notifying patrons about loans due soon and overdue loans
+        every `interval` seconds, until the task is cancelled.
+
+    Args:
+        service (INotificationService): The notification service.
+        interval (int): Seconds between the runs.
+    """
+    while True:
+        try:
+            sent = await service.send_notifications()
+            if sent:
+                logger.info("Sent %d loan notifications", sent)
+        except Exception:
+            logger.exception("Sending loan notifications failed")
+        await asyncio.sleep(interval)
@@ -0,0 +1,40 @@
+"""A command verifying the books copies counters against the book copies.
+
+Usage:
+    python -m src.utils.reconcile_counters [--fix]
+
+Exits with status 1 when wrong counters were found and not fixed.
+"""
+
+import argparse
+import asyncio
+
+from src.container import Container
+
+
+async def main(fix: bool) -> int:
+    """Function comparing (and optionally fixing) `total_copies`/`available_copies` of all books.
+
+    Args:
+        fix (bool): Whether to overwrite the wrong counters.
+
+    Returns:
+        int: The exit status of the command.
+    """
+    service = Container().book_service()
+    mismatches = await service.reconcile_counters(fix)
+    for mismatch in mismatches:
+        print(
+            f"book {mismatch.book_id}: "
+            f"total {mismatch.total_copies} (actual {mismatch.actual_total_copies}), "
+            f"available {mismatch.available_copies} (actual {mismatch.actual_available_copies})"
+        )
+    print(f"{len(mismatches)} book(s) with wrong counters{', fixed' if fix and mismatches else ''}")
+    return 1 if mismatches and not fix else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fix", action="store_true", help="overwrite the wrong counters")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.fix)))
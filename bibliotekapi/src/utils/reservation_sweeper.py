@@ -0,0 +1,26 @@
+"""A module containing the background task canceling expired reservations."""
+
+import asyncio
+import logging
+
+from src.infrastructure.services.ireservation import IReservationService
+
+logger = logging.getLogger(__name__)
+
+
+async def sweep_expired_reservations(service: IReservationService, interval: int) -> None:
+    """Function canceling expired reservations and releasing their copies
+        every `interval` seconds, until the task is cancelled.
+
+    Args:
+        service (IReservationService): The reservation service.
+        interval (int): Seconds between the sweeps.
+    """
+    while True:
+        try:
+            expired = await service.expire_reservations()
+            if expired:
+                logger.info("Released %d copies of expired reservations", expired)
+        except Exception:
+            logger.exception("Sweeping expired reservations failed")
+        await asyncio.sleep(interval)